@@ -0,0 +1,158 @@
+"""Benchmark the iterative ADF renderer against the original recursive _adf_to_text.
+
+Usage (from the project root):
+    python benchmarks/bench_adf.py [--repeat N]
+
+Builds synthetic documents at the NFR-011 limits — a 50,000-character
+description and a ticket with 200 comments — plus a deeply nested document,
+and reports the best-of-N wall time for each renderer.
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from jira_api.adf import adf_to_markdown, adf_to_text
+
+
+def legacy_adf_to_text(node: dict | list | None) -> str:
+    """The recursive renderer previously used by jira_mcp_server (kept verbatim as the baseline)."""
+    if node is None:
+        return ""
+    if isinstance(node, list):
+        return "".join(legacy_adf_to_text(n) for n in node)
+    if isinstance(node, str):
+        return node
+    if not isinstance(node, dict):
+        return str(node)
+
+    node_type = node.get("type", "")
+    text = node.get("text", "")
+    content = node.get("content", [])
+
+    if node_type == "mention":
+        attrs = node.get("attrs", {})
+        return attrs.get("text", "")
+    if text:
+        return text
+    if node_type == "hardBreak":
+        return "\n"
+    if node_type in ("paragraph", "heading"):
+        return legacy_adf_to_text(content) + "\n"
+    if node_type == "bulletList":
+        items = []
+        for item in content:
+            items.append("- " + legacy_adf_to_text(item.get("content", [])).strip())
+        return "\n".join(items) + "\n"
+    if node_type == "orderedList":
+        items = []
+        for i, item in enumerate(content, 1):
+            items.append(f"{i}. " + legacy_adf_to_text(item.get("content", [])).strip())
+        return "\n".join(items) + "\n"
+    if node_type == "codeBlock":
+        code = legacy_adf_to_text(content)
+        return f"```\n{code}```\n"
+
+    return legacy_adf_to_text(content)
+
+
+def _text(rng: random.Random, words: int) -> dict:
+    node = {"type": "text", "text": " ".join(rng.choice(_WORDS) for _ in range(words))}
+    if rng.random() < 0.2:
+        node["marks"] = [{"type": rng.choice(["strong", "em", "code"])}]
+    return node
+
+
+def _paragraph(rng: random.Random) -> dict:
+    return {"type": "paragraph", "content": [_text(rng, rng.randint(3, 12)) for _ in range(rng.randint(1, 4))]}
+
+
+def _block(rng: random.Random) -> dict:
+    kind = rng.random()
+    if kind < 0.6:
+        return _paragraph(rng)
+    if kind < 0.75:
+        return {"type": "bulletList", "content": [
+            {"type": "listItem", "content": [_paragraph(rng)]} for _ in range(rng.randint(2, 6))
+        ]}
+    if kind < 0.85:
+        return {"type": "codeBlock", "content": [_text(rng, 20)]}
+    if kind < 0.95:
+        return {"type": "heading", "attrs": {"level": 2}, "content": [_text(rng, 4)]}
+    return {"type": "table", "content": [
+        {"type": "tableRow", "content": [
+            {"type": "tableCell", "content": [_paragraph(rng)]} for _ in range(3)
+        ]} for _ in range(4)
+    ]}
+
+
+def large_document(chars: int, seed: int = 1) -> dict:
+    """Build a mixed-content ADF doc whose text totals roughly ``chars`` characters."""
+    rng = random.Random(seed)
+    doc = {"type": "doc", "version": 1, "content": []}
+    while len(legacy_adf_to_text(doc)) < chars:
+        doc["content"].extend(_block(rng) for _ in range(50))
+    return doc
+
+
+def nested_document(depth: int) -> dict:
+    """Build a document with ``depth`` nested bullet lists."""
+    root = {"type": "doc", "content": []}
+    parent = root
+    for i in range(depth):
+        lst = {"type": "bulletList", "content": [{"type": "listItem", "content": [
+            {"type": "paragraph", "content": [{"type": "text", "text": f"level {i}"}]},
+        ]}]}
+        parent["content"].append(lst)
+        parent = lst["content"][0]
+    return root
+
+
+_WORDS = "the server returns issue worklog comment field error retry page cache token status link".split()
+
+
+def _best_of(func, arg, repeat: int) -> float | str:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        try:
+            func(arg)
+        except RecursionError:
+            return "RecursionError"
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per case; the best time is reported")
+    args = parser.parse_args()
+
+    description = large_document(50_000)
+    comments = [large_document(1_500, seed=i) for i in range(200)]
+    cases = [
+        ("50k-char description", description),
+        ("200 comments x 1.5k chars", comments),
+        ("nested lists, depth 2000", nested_document(2000)),
+    ]
+    renderers = [
+        ("legacy _adf_to_text", legacy_adf_to_text),
+        ("render_adf text", adf_to_text),
+        ("render_adf markdown", adf_to_markdown),
+    ]
+
+    print(f"{'case':<28}" + "".join(f"{name:>24}" for name, _ in renderers))
+    for case_name, doc in cases:
+        row = f"{case_name:<28}"
+        for _, renderer in renderers:
+            result = _best_of(renderer, doc, args.repeat)
+            row += f"{result:>24}" if isinstance(result, str) else f"{result * 1000:>21.2f} ms"
+        print(row)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,267 @@
+"""Encrypted reuse of the target app's authenticated browser storage state."""
+
+import argparse
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+
+from cryptography.fernet import Fernet, InvalidToken
+from playwright.sync_api import Browser
+
+from automation.config import (
+    WEB_UI_LOGIN_SUBMIT,
+    WEB_UI_LOGIN_URL,
+    WEB_UI_PASSWORD,
+    WEB_UI_PASSWORD_FIELD,
+    WEB_UI_STATE_KEY,
+    WEB_UI_STATE_MAX_AGE,
+    WEB_UI_STATE_PATH,
+    WEB_UI_TIMEOUT,
+    WEB_UI_USERNAME,
+    WEB_UI_USERNAME_FIELD,
+)
+from automation.forms import field_locator
+
+logger = logging.getLogger(__name__)
+
+# After a failed login, seconds during which callers get the failure
+# instead of each repeating the login
+LOGIN_FAILURE_BACKOFF = 60
+
+
+class LoginError(Exception):
+    """Logging in to the target app failed (bad credentials, unexpected page)."""
+
+
+class StorageStateStore:
+    """Playwright storage state (cookies + localStorage) in a Fernet-encrypted file.
+
+    Fernet tokens carry their creation time, so a state older than
+    ``max_age`` seconds fails to decrypt and is treated as missing.
+    The file and any generated key file are created with mode 0600.
+    """
+
+    def __init__(self, path: Path, key: str = "", max_age: int = 28800):
+        self.path = Path(path)
+        self.max_age = max_age
+        # Creation time (time.time()) of the state last loaded or saved
+        self.saved_at = 0.0
+        self._key = key
+        self._fernet_instance: Fernet | None = None
+
+    @property
+    def _fernet(self) -> Fernet:
+        # Created on first use, so no key file appears unless a session is saved
+        if self._fernet_instance is None:
+            self._fernet_instance = Fernet(self._key.encode() if self._key else self._load_or_create_key())
+        return self._fernet_instance
+
+    def load(self) -> dict | None:
+        """Return the saved state, or None if there is none, it expired or cannot be decrypted."""
+        try:
+            token = self.path.read_bytes()
+        except FileNotFoundError:
+            return None
+        try:
+            state = json.loads(self._fernet.decrypt(token, ttl=self.max_age or None))
+        except InvalidToken:
+            logger.info("Saved browser session in %s expired or unreadable, ignoring it", self.path)
+            return None
+        self.saved_at = self._fernet.extract_timestamp(token)
+        return state
+
+    def save(self, state: dict) -> None:
+        """Encrypt and atomically replace the saved state."""
+        token = self._fernet.encrypt(json.dumps(state).encode())
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            f.write(token)
+        os.replace(tmp, self.path)
+        self.saved_at = time.time()
+
+    def clear(self) -> None:
+        self.path.unlink(missing_ok=True)
+
+    def _load_or_create_key(self) -> bytes:
+        key_path = self.path.with_name(self.path.name + ".key")
+        try:
+            return key_path.read_bytes().strip()
+        except FileNotFoundError:
+            pass
+        key = Fernet.generate_key()
+        fd = os.open(key_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            f.write(key)
+        logger.info("Generated browser session key %s (set WEB_UI_STATE_KEY to manage it yourself)", key_path)
+        return key
+
+
+class WebAuth:
+    """Hands out an authenticated storage state for new browser contexts.
+
+    The decrypted state is kept in memory; when it is missing or expired,
+    the first caller logs in through the login form in a throwaway context
+    while other callers wait, and everyone then reuses the saved result.
+    Call :meth:`invalidate` when a page is redirected to the login page.
+    A failed login is reported to every caller for LOGIN_FAILURE_BACKOFF
+    seconds before it is tried again.
+    """
+
+    def __init__(
+        self,
+        store: StorageStateStore,
+        login_url: str = "",
+        username: str = "",
+        password: str = "",
+        username_field: str = "Username",
+        password_field: str = "Password",
+        submit_selector: str = "",
+        timeout: int = 30,
+    ):
+        self.store = store
+        self.login_url = login_url
+        self.username = username
+        self.password = password
+        self.username_field = username_field
+        self.password_field = password_field
+        self.submit_selector = submit_selector
+        self.timeout_ms = timeout * 1000
+        self._lock = threading.Lock()
+        self._state: dict | None = None
+        self._failed_at = 0.0
+        self._failure: Exception | None = None
+        self.logins = 0
+
+    @property
+    def can_login(self) -> bool:
+        return bool(self.login_url and self.username and self.password)
+
+    def context_state(self, browser: Browser) -> dict | None:
+        """A valid storage state for ``browser.new_context``, logging in first if needed.
+
+        Returns None (a blank context) when no state is saved and no credentials are configured.
+
+        Raises:
+            LoginError: Logging in failed now or less than LOGIN_FAILURE_BACKOFF seconds ago
+        """
+        with self._lock:
+            if self._state is not None and not self._expired():
+                return self._state
+            state = self.store.load()
+            if state is None and self.can_login:
+                waited = time.monotonic() - self._failed_at
+                if self._failure is not None and waited < LOGIN_FAILURE_BACKOFF:
+                    raise LoginError(
+                        f"Login failed {waited:.0f}s ago, retrying after {LOGIN_FAILURE_BACKOFF}s: {self._failure}"
+                    ) from self._failure
+                try:
+                    state = self._login(browser)
+                except Exception as e:
+                    self._failed_at, self._failure = time.monotonic(), e
+                    raise
+                self._failure = None
+                self.store.save(state)
+            self._state = state
+            return state
+
+    def invalidate(self, used_since: float | None = None) -> None:
+        """Forget the saved state, e.g. after a redirect to the login page.
+
+        Args:
+            used_since: ``time.time()`` when the failing page started; a state
+                obtained after that (another worker already logged in again) is kept
+        """
+        with self._lock:
+            if used_since is not None and self.store.saved_at > used_since:
+                return
+            logger.info("Browser session rejected by the app, logging in again on next use")
+            self._state = None
+            self.store.clear()
+
+    def _expired(self) -> bool:
+        return bool(self.store.max_age) and time.time() - self.store.saved_at >= self.store.max_age
+
+    def _login(self, browser: Browser) -> dict:
+        started = time.monotonic()
+        context = browser.new_context()
+        try:
+            page = context.new_page()
+            page.set_default_timeout(self.timeout_ms)
+            page.goto(self.login_url, wait_until="domcontentloaded")
+            field_locator(page, self.username_field).first.fill(self.username)
+            password = field_locator(page, self.password_field).first
+            password.fill(self.password)
+            if self.submit_selector:
+                page.click(self.submit_selector)
+            else:
+                password.press("Enter")
+            page.wait_for_load_state("networkidle")
+            if page.url.split("?")[0] == self.login_url.split("?")[0]:
+                raise LoginError(f"Still on the login page after submitting credentials ({page.url})")
+            state = context.storage_state()
+        finally:
+            context.close()
+        self.logins += 1
+        logger.info("Logged in to %s in %.1fs; session saved to %s", self.login_url, time.monotonic() - started, self.store.path)
+        return state
+
+
+_auth: WebAuth | None = None
+_auth_lock = threading.Lock()
+
+
+def get_web_auth() -> WebAuth:
+    """Return the process-wide session manager, creating it on first use."""
+    global _auth
+    if _auth is None:
+        with _auth_lock:
+            if _auth is None:
+                _auth = WebAuth(
+                    StorageStateStore(WEB_UI_STATE_PATH, WEB_UI_STATE_KEY, WEB_UI_STATE_MAX_AGE),
+                    login_url=WEB_UI_LOGIN_URL,
+                    username=WEB_UI_USERNAME,
+                    password=WEB_UI_PASSWORD,
+                    username_field=WEB_UI_USERNAME_FIELD,
+                    password_field=WEB_UI_PASSWORD_FIELD,
+                    submit_selector=WEB_UI_LOGIN_SUBMIT,
+                    timeout=WEB_UI_TIMEOUT,
+                )
+    return _auth
+
+
+if __name__ == "__main__":
+    # cd src && python -m automation.auth login|manual|clear
+    from playwright.sync_api import sync_playwright
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+    parser = argparse.ArgumentParser(description="Manage the saved, encrypted browser session of the target app.")
+    parser.add_argument(
+        "action", choices=["login", "manual", "clear"],
+        help="login: log in with WEB_UI_USERNAME/PASSWORD; manual: log in yourself in a visible browser "
+             "(SSO, MFA); clear: delete the saved session",
+    )
+    args = parser.parse_args()
+    auth = get_web_auth()
+    if args.action == "clear":
+        auth.store.clear()
+        print(f"Removed {auth.store.path}")
+        raise SystemExit(0)
+
+    with sync_playwright() as pw:
+        browser = pw.chromium.launch(headless=args.action == "login")
+        if args.action == "login":
+            if not auth.can_login:
+                raise SystemExit("Error: set WEB_UI_LOGIN_URL, WEB_UI_USERNAME and WEB_UI_PASSWORD in .env")
+            auth.invalidate()
+            auth.context_state(browser)
+        else:
+            context = browser.new_context()
+            context.new_page().goto(WEB_UI_LOGIN_URL or "about:blank")
+            input("Log in in the browser window, then press Enter here to save the session... ")
+            auth.store.save(context.storage_state())
+        browser.close()
+    print(f"Session saved to {auth.store.path} (valid for {auth.store.max_age}s)")
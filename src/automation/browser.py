@@ -2,7 +2,10 @@
 
 import logging
 
-from playwright.sync_api import Browser, Page, Playwright, sync_playwright
+from playwright.sync_api import Browser, BrowserContext, Page, Playwright, sync_playwright
+
+from automation.auth import get_web_auth
+from automation.network import LoadPolicy
 
 logger = logging.getLogger(__name__)
 
@@ -10,6 +13,12 @@ logger = logging.getLogger(__name__)
 class BrowserSession:
     """Manages a Playwright Chromium browser session.
 
+    The page's context starts from the saved login session of the target
+    app (see :mod:`automation.auth`) unless ``use_auth`` is False, and
+    loads pages according to ``policy`` (default: the WEB_UI_* settings,
+    see :class:`~automation.network.LoadPolicy`); use :meth:`navigate` to
+    load a page and get its timings.
+
     Supports context manager usage::
 
         with BrowserSession(headless=True) as session:
@@ -17,11 +26,14 @@ class BrowserSession:
             page.goto("https://example.com")
     """
 
-    def __init__(self, headless: bool = True, timeout: int = 30):
+    def __init__(self, headless: bool = True, timeout: int = 30, use_auth: bool = True, policy: LoadPolicy | None = None):
         self.headless = headless
         self.timeout_ms = timeout * 1000
+        self.use_auth = use_auth
+        self.policy = policy or LoadPolicy.from_config()
         self._pw: Playwright | None = None
         self._browser: Browser | None = None
+        self._context: BrowserContext | None = None
         self._page: Page | None = None
 
     @property
@@ -33,12 +45,25 @@ class BrowserSession:
     def __enter__(self) -> "BrowserSession":
         logger.info("Launching Chromium (headless=%s, timeout=%dms)", self.headless, self.timeout_ms)
         self._pw = sync_playwright().start()
-        self._browser = self._pw.chromium.launch(headless=self.headless)
-        self._page = self._browser.new_page()
-        self._page.set_default_timeout(self.timeout_ms)
-        self._page.set_default_navigation_timeout(self.timeout_ms)
+        try:
+            self._browser = self._pw.chromium.launch(headless=self.headless)
+            # May log in first, which can fail (LoginError, timeout)
+            state = get_web_auth().context_state(self._browser) if self.use_auth else None
+            self._context = self._browser.new_context(storage_state=state, **self.policy.context_options())
+            self._page = self._context.new_page()
+            self._page.set_default_timeout(self.timeout_ms)
+            self._page.set_default_navigation_timeout(self.timeout_ms)
+            self.policy.prepare(self._page)
+        except BaseException:
+            # __exit__ does not run when __enter__ raises
+            self.__exit__(None, None, None)
+            raise
         return self
 
+    def navigate(self, url: str):
+        """Load ``url`` under the session's policy; returns ``(response, timings)``."""
+        return self.policy.navigate(self.page, url)
+
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
         if self._browser:
             logger.info("Closing browser")
@@ -46,5 +71,6 @@ class BrowserSession:
         if self._pw:
             self._pw.stop()
         self._page = None
+        self._context = None
         self._browser = None
         self._pw = None
@@ -12,6 +12,56 @@ WEB_UI_BASE_URL = os.getenv("WEB_UI_BASE_URL", "")
 WEB_UI_TIMEOUT = int(os.getenv("WEB_UI_TIMEOUT", "30"))
 WEB_UI_HEADLESS = os.getenv("WEB_UI_HEADLESS", "true").lower() in ("true", "1", "yes")
 
+# Page loading (see automation.network): resource types to block (Playwright
+# names: image, media, font, stylesheet, script, ...), URL substrings to block
+# (analytics and tracking hosts), JavaScript on/off, the element that marks
+# the page ready (EC-012) and the load event goto waits for. Nothing is
+# blocked unless configured.
+WEB_UI_BLOCK_RESOURCES = [t.strip() for t in os.getenv("WEB_UI_BLOCK_RESOURCES", "").split(",") if t.strip()]
+WEB_UI_BLOCK_URLS = [u.strip() for u in os.getenv("WEB_UI_BLOCK_URLS", "").split(",") if u.strip()]
+WEB_UI_JAVASCRIPT = os.getenv("WEB_UI_JAVASCRIPT", "true").lower() in ("true", "1", "yes")
+WEB_UI_READY_SELECTOR = os.getenv("WEB_UI_READY_SELECTOR", "")
+WEB_UI_WAIT_UNTIL = os.getenv("WEB_UI_WAIT_UNTIL", "domcontentloaded")
+
+# Login to the target app (see automation.auth). The authenticated storage
+# state (cookies, localStorage) is saved Fernet-encrypted and reused by new
+# browser contexts until it is WEB_UI_STATE_MAX_AGE seconds old or the app
+# redirects to its login page. The key comes from WEB_UI_STATE_KEY, or is
+# generated into a 0600 file next to the state.
+WEB_UI_LOGIN_URL = os.getenv("WEB_UI_LOGIN_URL", "")
+WEB_UI_USERNAME = os.getenv("WEB_UI_USERNAME", "")
+WEB_UI_PASSWORD = os.getenv("WEB_UI_PASSWORD", "")
+WEB_UI_USERNAME_FIELD = os.getenv("WEB_UI_USERNAME_FIELD", "Username")
+WEB_UI_PASSWORD_FIELD = os.getenv("WEB_UI_PASSWORD_FIELD", "Password")
+WEB_UI_LOGIN_SUBMIT = os.getenv("WEB_UI_LOGIN_SUBMIT", "")
+WEB_UI_STATE_PATH = Path(os.getenv("WEB_UI_STATE_PATH", "") or Path(__file__).parent.parent.parent / ".web_ui_state.enc")
+WEB_UI_STATE_KEY = os.getenv("WEB_UI_STATE_KEY", "")
+WEB_UI_STATE_MAX_AGE = int(os.getenv("WEB_UI_STATE_MAX_AGE", "28800"))
+
+# Warm browser pool (see automation.pool). At most 5 browsers (NFR-010);
+# browsers are recycled after WEB_UI_RECYCLE_AFTER jobs, and the largest one
+# is recycled when the browser processes together exceed
+# WEB_UI_MEMORY_BUDGET_MB (NFR-002); idle browsers are closed after
+# WEB_UI_POOL_IDLE_TIMEOUT seconds without work.
+WEB_UI_POOL_SIZE = int(os.getenv("WEB_UI_POOL_SIZE", "5"))
+WEB_UI_MEMORY_BUDGET_MB = int(os.getenv("WEB_UI_MEMORY_BUDGET_MB", "500"))
+WEB_UI_RECYCLE_AFTER = int(os.getenv("WEB_UI_RECYCLE_AFTER", "100"))
+WEB_UI_POOL_IDLE_TIMEOUT = int(os.getenv("WEB_UI_POOL_IDLE_TIMEOUT", "300"))
+
+# Batch data entry (see automation.data_entry): the form, which ticket value
+# goes into which field (ticket key:field id, name, label or placeholder),
+# an optional submit button, the wait for the form to render (NFR-001) and
+# attempts per ticket for transient failures
+WEB_UI_FORM_URL = os.getenv("WEB_UI_FORM_URL", "")
+WEB_UI_FIELD_MAP = dict(
+    pair.split(":", 1) if ":" in pair else (pair, pair)
+    for pair in (p.strip() for p in os.getenv("WEB_UI_FIELD_MAP", "key,summary,status,description").split(","))
+    if pair
+)
+WEB_UI_SUBMIT_SELECTOR = os.getenv("WEB_UI_SUBMIT_SELECTOR", "")
+WEB_UI_FIELD_TIMEOUT = int(os.getenv("WEB_UI_FIELD_TIMEOUT", "10"))
+WEB_UI_ENTRY_ATTEMPTS = int(os.getenv("WEB_UI_ENTRY_ATTEMPTS", "3"))
+
 
 def validate_config() -> str | None:
     """Return an error string if configuration is incomplete, or None if valid."""
@@ -0,0 +1,302 @@
+"""Batch data entry of Jira tickets into the target web form, in parallel browser contexts."""
+
+import argparse
+import gzip
+import json
+import logging
+import random
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from pathlib import Path
+
+from playwright.sync_api import Error as PlaywrightError
+from playwright.sync_api import Page
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+from automation.config import (
+    WEB_UI_BASE_URL,
+    WEB_UI_ENTRY_ATTEMPTS,
+    WEB_UI_FIELD_MAP,
+    WEB_UI_FIELD_TIMEOUT,
+    WEB_UI_FORM_URL,
+    WEB_UI_SUBMIT_SELECTOR,
+    validate_config,
+)
+from automation.forms import field_locator
+from automation.network import LoadPolicy
+from automation.pool import get_browser_pool
+from jira_api.adf import adf_to_text
+from jira_api.formatting import simplify_value
+
+logger = logging.getLogger(__name__)
+
+# Playwright errors worth retrying: the page or network, not the data, was at fault
+_TRANSIENT_MARKERS = ("net::", "Navigation", "Target closed", "Target page, context or browser has been closed")
+
+
+class DataEntryError(Exception):
+    """A ticket could not be entered for a reason retrying will not fix (e.g. verification failed)."""
+
+
+class LoginRequired(DataEntryError):
+    """The form redirected to a login page: the saved session is missing or expired."""
+
+
+def enter_ticket(
+    page: Page,
+    ticket: dict,
+    form_url: str,
+    field_map: dict[str, str],
+    submit_selector: str = "",
+    field_timeout: int = 10,
+    policy: LoadPolicy | None = None,
+) -> dict:
+    """Open the form, fill each mapped ticket value, verify it and optionally submit.
+
+    Fields are located by id, name, label or placeholder (first match wins).
+    A field missing from the form is skipped with a warning; a read-only
+    field or a value that does not read back as entered fails the ticket.
+
+    Args:
+        page: A fresh page (e.g. from the browser pool)
+        ticket: Ticket values by key, e.g. {"key": "LAE-1", "summary": "...", "status": "Open"}
+        form_url: URL of the data entry form
+        field_map: Ticket key -> form field id, name, label or placeholder
+        submit_selector: Optional selector of the button to click after filling
+        field_timeout: Seconds to wait for the form's fields to appear
+        policy: How to load the form (ready selector, wait event); the page must have been prepared with it
+
+    Returns:
+        {"filled": [ticket keys], "warnings": [messages], "timings": form load timings}
+
+    Raises:
+        LoginRequired: Redirected to a login page
+        DataEntryError: Read-only field or verification mismatch
+    """
+    _, timings = (policy or LoadPolicy()).navigate(page, form_url)
+    if "login" in page.url.lower() and "login" not in form_url.lower():
+        raise LoginRequired(f"Login required or redirected (landed on {page.url})")
+
+    filled, warnings = [], []
+    # Wait once for the form to render; later fields are then looked up without waiting
+    locators = {name: field_locator(page, target) for name, target in field_map.items()}
+    if locators:
+        first = None
+        for locator in locators.values():
+            first = locator if first is None else first.or_(locator)
+        try:
+            first.first.wait_for(state="attached", timeout=field_timeout * 1000)
+        except PlaywrightTimeoutError:
+            raise DataEntryError(f"No form field found on {page.url} within {field_timeout}s") from None
+
+    for name, locator in locators.items():
+        value = ticket.get(name)
+        if value is None or value == "":
+            warnings.append(f"Field '{name}' has no data")
+            continue
+        value = _text(value)
+        if locator.count() == 0:
+            warnings.append(f"Field '{field_map[name]}' not found, skipping")
+            continue
+        field = locator.first
+        if not field.is_editable():
+            raise DataEntryError(f"Field '{field_map[name]}' is read-only, cannot input")
+        if field.evaluate("e => e.tagName") == "SELECT":
+            field.select_option(label=value)
+            actual = field.evaluate("e => e.options[e.selectedIndex] ? e.options[e.selectedIndex].text : ''")
+        else:
+            field.fill(value)
+            actual = field.input_value()
+        if _normalize(actual) != _normalize(value):
+            raise DataEntryError(f"Verification failed for '{field_map[name]}': expected {value[:80]!r}, found {actual[:80]!r}")
+        logger.info("%s: verification passed for field '%s'", ticket.get("key", "?"), field_map[name])
+        filled.append(name)
+
+    if submit_selector:
+        page.click(submit_selector)
+        page.wait_for_load_state("domcontentloaded")
+    return {"filled": filled, "warnings": warnings, "timings": timings}
+
+
+def run_batch(
+    tickets: list[dict],
+    concurrency: int = 0,
+    form_url: str = "",
+    field_map: dict[str, str] | None = None,
+    submit_selector: str | None = None,
+    max_attempts: int = WEB_UI_ENTRY_ATTEMPTS,
+) -> dict:
+    """Enter many tickets concurrently, each in its own browser context, retrying transient failures.
+
+    Tickets are spread over the browser pool (at most 5 browsers). A
+    ticket whose attempt fails with a timeout or navigation/network error
+    goes to a retry queue and is tried again after an exponential backoff
+    with jitter, up to ``max_attempts``; data errors fail it at once. A
+    redirect to the login page drops the saved session, so the retry logs
+    in again when credentials are configured.
+
+    Args:
+        tickets: Ticket dicts (see :func:`ticket_values` for the accepted shapes)
+        concurrency: Tickets in flight at once. 0 uses the pool size
+        form_url: Form URL (default: WEB_UI_FORM_URL, else WEB_UI_BASE_URL)
+        field_map: Ticket key -> form field (default: WEB_UI_FIELD_MAP)
+        submit_selector: Submit button selector (default: WEB_UI_SUBMIT_SELECTOR)
+        max_attempts: Attempts per ticket, including the first
+
+    Returns:
+        {"results": [per-ticket dicts in input order], "wall_seconds", "seconds_per_ticket", "ok", "failed", "retries"}
+    """
+    pool = get_browser_pool()
+    form_url = form_url or WEB_UI_FORM_URL or WEB_UI_BASE_URL
+    field_map = field_map or WEB_UI_FIELD_MAP
+    submit_selector = WEB_UI_SUBMIT_SELECTOR if submit_selector is None else submit_selector
+    concurrency = max(1, min(concurrency or pool.size, pool.size))
+    values = [ticket_values(t) for t in tickets]
+
+    results: list[dict] = [
+        {"key": v.get("key", f"#{i + 1}"), "status": "pending", "attempts": 0, "seconds": [], "filled": [], "warnings": [], "timings": {}, "error": ""}
+        for i, v in enumerate(values)
+    ]
+    # (ticket index, earliest start time); new tickets first, retries when due
+    pending: deque[tuple[int, float]] = deque((i, 0.0) for i in range(len(values)))
+    # Future -> (ticket index, monotonic start, wall-clock start)
+    in_flight: dict[Future, tuple[int, float, float]] = {}
+    retries = 0
+    started = time.monotonic()
+
+    def job(index: int):
+        return lambda page: enter_ticket(
+            page, values[index], form_url, field_map, submit_selector, WEB_UI_FIELD_TIMEOUT, pool.policy,
+        )
+
+    while pending or in_flight:
+        now = time.monotonic()
+        for _ in range(len(pending)):
+            if len(in_flight) >= concurrency:
+                break
+            index, not_before = pending.popleft()
+            if not_before > now:
+                pending.append((index, not_before))
+                continue
+            results[index]["attempts"] += 1
+            in_flight[pool.submit(job(index))] = (index, time.monotonic(), time.time())
+
+        if not in_flight:
+            # Only retries waiting for their backoff
+            time.sleep(max(0.0, min(nb for _, nb in pending) - time.monotonic()))
+            continue
+        done, _ = wait(in_flight, timeout=0.5, return_when=FIRST_COMPLETED)
+        for future in done:
+            index, attempt_started, attempt_wall = in_flight.pop(future)
+            result = results[index]
+            result["seconds"].append(round(time.monotonic() - attempt_started, 2))
+            try:
+                outcome = future.result()
+            except Exception as e:
+                result["error"] = f"{type(e).__name__}: {e}"
+                relogin = isinstance(e, LoginRequired) and pool.auth is not None and pool.auth.can_login
+                if relogin:
+                    # The next context logs in again (once, however many tickets saw the redirect)
+                    pool.auth.invalidate(used_since=attempt_wall)
+                if (relogin or _is_transient(e)) and result["attempts"] < max_attempts:
+                    delay = random.uniform(0, 2 ** result["attempts"])
+                    logger.warning("%s: attempt %d failed (%s), retrying in %.1fs", result["key"], result["attempts"], e, delay)
+                    pending.append((index, time.monotonic() + delay))
+                    retries += 1
+                else:
+                    result["status"] = "failed"
+                    logger.error("%s: data entry failed: %s", result["key"], result["error"])
+            else:
+                result.update(outcome, status="ok", error="")
+                logger.info("%s: %d field(s) successfully populated", result["key"], len(outcome["filled"]))
+
+    wall = time.monotonic() - started
+    ok = sum(1 for r in results if r["status"] == "ok")
+    return {
+        "results": results,
+        "wall_seconds": round(wall, 2),
+        "seconds_per_ticket": round(wall / len(results), 2) if results else 0.0,
+        "concurrency": concurrency,
+        "ok": ok,
+        "failed": len(results) - ok,
+        "retries": retries,
+    }
+
+
+def ticket_values(ticket: dict) -> dict:
+    """Flatten a ticket into plain values by key.
+
+    Accepts the JSON output of the Jira tools (``get_jira_issues`` /
+    ``export_jira_issues`` records, already flat) or a raw REST issue with
+    a ``fields`` object, whose values are reduced to their display text.
+    """
+    if "fields" not in ticket:
+        return dict(ticket)
+    values = {"key": ticket.get("key", "")}
+    for name, value in ticket["fields"].items():
+        values[name] = _text(value)
+    return values
+
+
+def load_tickets(path: str | Path) -> list[dict]:
+    """Read tickets from a .json file (a list, or {"issues": [...]}) or a .jsonl file, optionally gzipped."""
+    path = Path(path)
+    opener = gzip.open if path.suffix == ".gz" else open
+    with opener(path, "rt", encoding="utf-8") as f:
+        if path.name.removesuffix(".gz").endswith(".jsonl"):
+            return [json.loads(line) for line in f if line.strip()]
+        data = json.load(f)
+    if isinstance(data, dict):
+        data = data.get("issues", [data])
+    return data
+
+
+def _text(value) -> str:
+    """Plain text for a form field from a raw Jira value (ADF documents, users, options, lists)."""
+    if isinstance(value, str):
+        return value
+    if isinstance(value, dict) and value.get("type") == "doc":
+        return adf_to_text(value).strip()
+    if isinstance(value, list):
+        return ", ".join(filter(None, (_text(v) for v in value)))
+    value = simplify_value(value)
+    return "" if value is None or isinstance(value, dict) else str(value)
+
+
+def _normalize(text: str) -> str:
+    """Compare values independently of line endings (EC-004) and trailing whitespace."""
+    return text.replace("\r\n", "\n").replace("\r", "\n").rstrip()
+
+
+def _is_transient(error: Exception) -> bool:
+    if isinstance(error, DataEntryError):
+        return False
+    if isinstance(error, PlaywrightTimeoutError):
+        return True
+    return isinstance(error, PlaywrightError) and any(m in str(error) for m in _TRANSIENT_MARKERS)
+
+
+if __name__ == "__main__":
+    # cd src && python -m automation.data_entry ../output/tickets.jsonl --concurrency 5
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+    parser = argparse.ArgumentParser(description="Enter Jira tickets into the web UI form in parallel.")
+    parser.add_argument("tickets", help="JSON or JSON Lines file of tickets (e.g. from export_jira_issues)")
+    parser.add_argument("--concurrency", type=int, default=0, help="tickets in flight (default: pool size)")
+    parser.add_argument("--form-url", default="", help="form URL (default: WEB_UI_FORM_URL / WEB_UI_BASE_URL)")
+    args = parser.parse_args()
+
+    if not args.form_url and not (WEB_UI_FORM_URL or WEB_UI_BASE_URL):
+        raise SystemExit(validate_config())
+    batch = run_batch(load_tickets(args.tickets), concurrency=args.concurrency, form_url=args.form_url)
+    for r in batch["results"]:
+        line = f"{r['key']}: {r['status']} after {r['attempts']} attempt(s) ({', '.join(f'{s}s' for s in r['seconds'])})"
+        if r["timings"]:
+            line += f", form loaded in {r['timings']['total_ms']}ms"
+        print(line + (f" — {r['error']}" if r["error"] and r["status"] != "ok" else ""))
+        for warning in r["warnings"]:
+            print(f"  warning: {warning}")
+    print(
+        f"\n{batch['ok']} ok, {batch['failed']} failed, {batch['retries']} retried — "
+        f"{batch['wall_seconds']}s total, {batch['seconds_per_ticket']}s per ticket with {batch['concurrency']} browser(s)"
+    )
@@ -0,0 +1,16 @@
+"""Locating form fields by several strategies (US-006)."""
+
+import json
+
+from playwright.sync_api import Locator, Page
+
+
+def field_locator(page: Page, target: str) -> Locator:
+    """A locator matching a form field by id, name, label or placeholder."""
+    quoted = json.dumps(target)
+    return (
+        page.locator(f"[id={quoted}]")
+        .or_(page.locator(f"[name={quoted}]"))
+        .or_(page.get_by_label(target, exact=True))
+        .or_(page.get_by_placeholder(target, exact=True))
+    )
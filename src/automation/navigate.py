@@ -4,6 +4,8 @@ import logging
 
 from automation.browser import BrowserSession
 from automation.config import WEB_UI_BASE_URL, WEB_UI_HEADLESS, WEB_UI_TIMEOUT, validate_config
+from automation.network import LoadPolicy
+from automation.pool import get_browser_pool
 
 logger = logging.getLogger(__name__)
 
@@ -12,13 +14,20 @@ def navigate_to_url(
     url: str = "",
     headless: bool | None = None,
     timeout: int | None = None,
+    block_resources: str | None = None,
+    javascript: bool | None = None,
+    ready_selector: str | None = None,
 ) -> str:
-    """Navigate to a URL and return a status report.
+    """Navigate to a URL and return a status report with page timings.
 
     Args:
         url: The URL to navigate to. Falls back to WEB_UI_BASE_URL from .env.
         headless: Run browser headless. Defaults to WEB_UI_HEADLESS from .env.
         timeout: Navigation timeout in seconds. Defaults to WEB_UI_TIMEOUT from .env.
+        block_resources: Comma-separated resource types to block (e.g. 'image,font,stylesheet'),
+            '' to block none. Defaults to WEB_UI_BLOCK_RESOURCES from .env.
+        javascript: Run page scripts. Defaults to WEB_UI_JAVASCRIPT from .env.
+        ready_selector: Element that marks the page ready. Defaults to WEB_UI_READY_SELECTOR from .env.
 
     Returns:
         A string describing the result (success with details, or error message).
@@ -32,28 +41,53 @@ def navigate_to_url(
 
     use_headless = headless if headless is not None else WEB_UI_HEADLESS
     use_timeout = timeout if timeout is not None else WEB_UI_TIMEOUT
-
     try:
-        with BrowserSession(headless=use_headless, timeout=use_timeout) as session:
-            logger.info("Navigating to %s", target_url)
-            response = session.page.goto(target_url, wait_until="domcontentloaded")
+        policy = LoadPolicy.from_config(
+            block_resources=[t.strip() for t in block_resources.split(",") if t.strip()] if block_resources is not None else None,
+            javascript=javascript,
+            ready_selector=ready_selector,
+        )
+    except ValueError as e:
+        return f"Error: {e}"
+
+    def visit(page) -> str:
+        logger.info("Navigating to %s", target_url)
+        response, timings = policy.navigate(page, target_url)
 
-            status_code = response.status if response else "unknown"
-            page_title = session.page.title()
-            final_url = session.page.url
+        status_code = response.status if response else "unknown"
+        page_title = page.title()
+        final_url = page.url
 
-            lines = [
-                "Navigation successful.",
-                f"  URL: {final_url}",
-                f"  HTTP status: {status_code}",
-                f"  Page title: {page_title or '(empty)'}",
-            ]
-            if final_url != target_url:
-                lines.append(f"  Redirected from: {target_url}")
+        lines = [
+            "Navigation successful.",
+            f"  URL: {final_url}",
+            f"  HTTP status: {status_code}",
+            f"  Page title: {page_title or '(empty)'}",
+        ]
+        if final_url != target_url:
+            lines.append(f"  Redirected from: {target_url}")
+        lines.append(f"  Load policy: {policy.describe()}")
+        lines.append(
+            "  Timings: "
+            + ", ".join(f"{name.removesuffix('_ms')} {value}ms" for name, value in timings.items() if name.endswith("_ms") and value is not None)
+        )
+        if "requests" in timings:
+            lines.append(
+                f"  Requests: {timings['requests']} ({timings['blocked']} blocked)"
+                + (f", {timings['transfer_kb']} KB document transfer" if "transfer_kb" in timings else "")
+            )
+        return "\n".join(lines)
 
-            result = "\n".join(lines)
-            logger.info(result)
-            return result
+    try:
+        if use_headless == WEB_UI_HEADLESS:
+            # The usual case: a fresh context on a warm pooled browser
+            result = get_browser_pool().run(visit, timeout=use_timeout, policy=policy)
+        else:
+            # A one-off headed/headless override gets its own browser
+            with BrowserSession(headless=use_headless, timeout=use_timeout, policy=policy) as session:
+                result = visit(session.page)
+        logger.info(result)
+        return result
 
     except Exception as e:
         error_msg = f"Navigation failed: {type(e).__name__}: {e}"
@@ -0,0 +1,166 @@
+"""Lean page loading: request blocking, optional no-JS mode, readiness selector and timings."""
+
+import logging
+import time
+import weakref
+
+from playwright.sync_api import Page, Response, Route
+
+from automation.config import (
+    WEB_UI_BLOCK_RESOURCES,
+    WEB_UI_BLOCK_URLS,
+    WEB_UI_JAVASCRIPT,
+    WEB_UI_READY_SELECTOR,
+    WEB_UI_WAIT_UNTIL,
+)
+
+logger = logging.getLogger(__name__)
+
+# Playwright resource types (request.resource_type)
+RESOURCE_TYPES = (
+    "document", "stylesheet", "image", "media", "font", "script", "texttrack",
+    "xhr", "fetch", "eventsource", "websocket", "manifest", "other",
+)
+
+# Request counters per prepared page, dropped with the page
+_page_counters: "weakref.WeakKeyDictionary[Page, dict]" = weakref.WeakKeyDictionary()
+
+
+class LoadPolicy:
+    """How pages are loaded for automation.
+
+    Requests of a blocked resource type (e.g. images, fonts) or whose URL
+    contains a blocked pattern (e.g. analytics hosts) are aborted before
+    they leave the browser. ``javascript=False`` loads pages without
+    running scripts, for static checks. ``ready_selector`` is the element
+    that marks the page as usable (EC-012), waited for after navigation.
+
+    Usage::
+
+        policy = LoadPolicy.from_config()
+        context = browser.new_context(**policy.context_options())
+        page = context.new_page()
+        policy.prepare(page)
+        response, timings = policy.navigate(page, url)
+    """
+
+    def __init__(
+        self,
+        block_resources: tuple[str, ...] | list[str] = (),
+        block_urls: tuple[str, ...] | list[str] = (),
+        javascript: bool = True,
+        ready_selector: str = "",
+        wait_until: str = "domcontentloaded",
+    ):
+        unknown = set(block_resources) - set(RESOURCE_TYPES)
+        if unknown:
+            raise ValueError(f"Unknown resource type(s) {', '.join(sorted(unknown))}. Use any of: {', '.join(RESOURCE_TYPES)}")
+        if "document" in block_resources:
+            raise ValueError("Blocking 'document' would block the page itself")
+        self.block_resources = frozenset(block_resources)
+        self.block_urls = tuple(block_urls)
+        self.javascript = javascript
+        self.ready_selector = ready_selector
+        self.wait_until = wait_until
+
+    @classmethod
+    def from_config(cls, **overrides) -> "LoadPolicy":
+        """The policy from WEB_UI_* settings, with keyword overrides (None values are ignored)."""
+        settings = {
+            "block_resources": WEB_UI_BLOCK_RESOURCES,
+            "block_urls": WEB_UI_BLOCK_URLS,
+            "javascript": WEB_UI_JAVASCRIPT,
+            "ready_selector": WEB_UI_READY_SELECTOR,
+            "wait_until": WEB_UI_WAIT_UNTIL,
+        }
+        settings.update({k: v for k, v in overrides.items() if v is not None})
+        return cls(**settings)
+
+    @property
+    def blocks_requests(self) -> bool:
+        return bool(self.block_resources or self.block_urls)
+
+    def context_options(self) -> dict:
+        """Keyword arguments for ``browser.new_context``."""
+        return {} if self.javascript else {"java_script_enabled": False}
+
+    def prepare(self, page: Page) -> None:
+        """Install request blocking and counting on a new page (before its first navigation)."""
+        counters = {"requests": 0, "blocked": 0}
+        _page_counters[page] = counters
+
+        def count(_request) -> None:
+            counters["requests"] += 1
+
+        page.on("request", count)
+        if not self.blocks_requests:
+            return
+
+        def route(route: Route) -> None:
+            request = route.request
+            if request.resource_type in self.block_resources or any(p in request.url for p in self.block_urls):
+                counters["blocked"] += 1
+                route.abort("blockedbyclient")
+            else:
+                route.continue_()
+
+        page.route("**/*", route)
+
+    def navigate(self, page: Page, url: str) -> tuple[Response | None, dict]:
+        """Go to ``url``, wait for the ready selector if set and return the response with page timings.
+
+        Timings (milliseconds): ``goto_ms`` until ``wait_until``, ``ready_ms``
+        until the ready selector was visible, ``total_ms``, and from the
+        browser's Navigation Timing entry ``ttfb_ms``,
+        ``dom_content_loaded_ms`` and ``transfer_kb``; plus the number of
+        requests the page made and how many were blocked.
+        """
+        started = time.perf_counter()
+        response = page.goto(url, wait_until=self.wait_until)
+        loaded = time.perf_counter()
+        if self.ready_selector:
+            page.wait_for_selector(self.ready_selector, state="visible")
+        ready = time.perf_counter()
+
+        timings = {
+            "goto_ms": round((loaded - started) * 1000),
+            "ready_ms": round((ready - loaded) * 1000) if self.ready_selector else None,
+            "total_ms": round((ready - started) * 1000),
+            **_navigation_timing(page),
+            **_page_counters.get(page, {}),
+        }
+        logger.info("Loaded %s in %dms (%s)", url, timings["total_ms"], ", ".join(f"{k}={v}" for k, v in timings.items() if v is not None))
+        return response, timings
+
+    def describe(self) -> str:
+        parts = []
+        if self.block_resources:
+            parts.append(f"blocking {', '.join(sorted(self.block_resources))}")
+        if self.block_urls:
+            parts.append(f"{len(self.block_urls)} blocked URL pattern(s)")
+        if not self.javascript:
+            parts.append("JavaScript off")
+        if self.ready_selector:
+            parts.append(f"ready when {self.ready_selector!r} is visible")
+        return "; ".join(parts) or "no restrictions"
+
+
+def _navigation_timing(page: Page) -> dict:
+    """Milliseconds from the browser's PerformanceNavigationTiming entry (empty if unavailable)."""
+    try:
+        entry = page.evaluate(
+            """() => {
+                const n = performance.getEntriesByType("navigation")[0];
+                return n ? {ttfb: n.responseStart, dcl: n.domContentLoadedEventEnd, size: n.transferSize} : null;
+            }"""
+        )
+    except Exception as e:
+        logger.debug("Navigation timing unavailable: %s", e)
+        return {}
+    if not entry:
+        return {}
+    return {
+        "ttfb_ms": round(entry["ttfb"]),
+        "dom_content_loaded_ms": round(entry["dcl"]) or None,
+        "transfer_kb": round(entry["size"] / 1024, 1),
+    }
@@ -0,0 +1,388 @@
+"""A long-lived pool of warm Chromium browsers that runs jobs in fresh contexts."""
+
+import atexit
+import logging
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from pathlib import Path
+
+from playwright.sync_api import Browser, Playwright, sync_playwright
+
+from automation.auth import WebAuth, get_web_auth
+from automation.network import LoadPolicy
+from automation.config import (
+    WEB_UI_HEADLESS,
+    WEB_UI_MEMORY_BUDGET_MB,
+    WEB_UI_POOL_IDLE_TIMEOUT,
+    WEB_UI_POOL_SIZE,
+    WEB_UI_RECYCLE_AFTER,
+    WEB_UI_TIMEOUT,
+)
+
+logger = logging.getLogger(__name__)
+
+# NFR-010: never more than 5 concurrent browser sessions
+MAX_BROWSER_SESSIONS = 5
+
+_STOP = object()
+
+
+class _BrowserWorker(threading.Thread):
+    """One thread owning one Playwright driver and Chromium process.
+
+    Playwright's sync API must be used from the thread that started it, so
+    each browser lives on its own thread and takes jobs from the pool's
+    queue. The browser is launched on the first job, relaunched if it
+    crashed or was recycled, and closed when the worker has been idle for
+    the pool's idle timeout.
+    """
+
+    def __init__(self, pool: "BrowserPool", number: int):
+        super().__init__(name=f"browser-{number}", daemon=True)
+        self.pool = pool
+        self._pw: Playwright | None = None
+        self._browser: Browser | None = None
+        # The Playwright driver process; the browser runs under it
+        self._driver_pid: int | None = None
+        self._jobs_since_launch = 0
+        self.recycle_requested = False
+
+    def run(self) -> None:
+        try:
+            while True:
+                try:
+                    item = self.pool._jobs.get(timeout=self.pool.idle_timeout or None)
+                except queue.Empty:
+                    logger.info("%s idle for %ds, closing", self.name, self.pool.idle_timeout)
+                    return
+                if item is _STOP:
+                    return
+                try:
+                    self._run_job(*item)
+                finally:
+                    self.pool._job_finished()
+                self._check_health()
+        finally:
+            self._close_browser()
+            self.pool._worker_exited(self)
+
+    def _run_job(self, job, future: Future, timeout_ms: int, policy: LoadPolicy) -> None:
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            browser = self._ensure_browser()
+            # A fresh context per job: no cookies, storage or cache leak between
+            # jobs, apart from the saved login session when one is configured
+            state = self.pool.auth.context_state(browser) if self.pool.auth else None
+            context = browser.new_context(storage_state=state, **policy.context_options())
+            try:
+                page = context.new_page()
+                page.set_default_timeout(timeout_ms)
+                page.set_default_navigation_timeout(timeout_ms)
+                policy.prepare(page)
+                result = job(page)
+            finally:
+                context.close()
+        except BaseException as e:
+            future.set_exception(e)
+        else:
+            future.set_result(result)
+        finally:
+            self._jobs_since_launch += 1
+            self.pool._count("jobs")
+
+    def _ensure_browser(self) -> Browser:
+        if self._browser is not None and not self._browser.is_connected():
+            logger.warning("%s: browser disconnected (crashed?), relaunching", self.name)
+            self.pool._count("crashes")
+            self._close_browser()
+        if self._browser is None:
+            started = time.monotonic()
+            # Serialised so the one new child process is this worker's driver
+            with self.pool._launch_lock:
+                before = _child_pids(os.getpid())
+                self._pw = sync_playwright().start()
+                new = _child_pids(os.getpid()) - before
+            self._driver_pid = new.pop() if len(new) == 1 else None
+            try:
+                self._browser = self._pw.chromium.launch(headless=self.pool.headless)
+            except BaseException:
+                # Stop the driver, or the next job would start a second one on this thread
+                self._close_browser()
+                raise
+            self._jobs_since_launch = 0
+            self.pool._count("launches")
+            logger.info("%s: launched Chromium in %.1fs (headless=%s)", self.name, time.monotonic() - started, self.pool.headless)
+        return self._browser
+
+    def rss_mb(self) -> float | None:
+        """Resident memory of this worker's driver and browser processes, in MB."""
+        if self._browser is None or self._driver_pid is None:
+            return None
+        return process_tree_rss_mb(self._driver_pid, include_root=True)
+
+    def _check_health(self) -> None:
+        """Recycle the browser after too many jobs, a recycle request or when chosen to free memory."""
+        reason = None
+        if self.recycle_requested:
+            reason = "recycle requested"
+        elif self.pool.recycle_after and self._jobs_since_launch >= self.pool.recycle_after:
+            reason = f"{self._jobs_since_launch} jobs since launch"
+        elif self._browser is not None and self.pool.memory_budget_mb:
+            reason = self.pool._memory_recycle_reason(self)
+        if reason and self._browser is not None:
+            logger.info("%s: recycling browser (%s)", self.name, reason)
+            self.pool._count("recycles")
+            self._close_browser()
+        self.recycle_requested = False
+
+    def _close_browser(self) -> None:
+        try:
+            if self._browser is not None:
+                self._browser.close()
+        except Exception as e:
+            logger.warning("%s: error closing browser: %s", self.name, e)
+        try:
+            if self._pw is not None:
+                self._pw.stop()
+        except Exception as e:
+            logger.warning("%s: error stopping Playwright: %s", self.name, e)
+        self._browser = None
+        self._pw = None
+        self._driver_pid = None
+
+
+class BrowserPool:
+    """Runs browser jobs on up to ``size`` warm Chromium processes.
+
+    A job is a callable taking a Playwright ``Page``; it runs in a new,
+    isolated ``BrowserContext`` of an already running browser, so only the
+    first job on each browser pays for the launch. Browsers are started on
+    demand, recycled after ``recycle_after`` jobs or when the RSS of the
+    pool's browser processes exceeds ``memory_budget_mb`` (then only the
+    largest browser is recycled, one at a time), relaunched
+    after a crash, and closed after ``idle_timeout`` seconds without work.
+    With ``auth``, contexts start from the saved login session. Pages are
+    prepared with ``policy`` (request blocking, JavaScript) unless a job
+    brings its own; jobs load pages with ``policy.navigate``.
+
+    Usage::
+
+        pool = get_browser_pool()
+        title = pool.run(lambda page: page.goto(url) and page.title())
+    """
+
+    def __init__(
+        self,
+        size: int = MAX_BROWSER_SESSIONS,
+        headless: bool = True,
+        timeout: int = 30,
+        memory_budget_mb: int = 500,
+        recycle_after: int = 100,
+        idle_timeout: int = 300,
+        auth: WebAuth | None = None,
+        policy: LoadPolicy | None = None,
+    ):
+        self.size = max(1, min(size, MAX_BROWSER_SESSIONS))
+        self.headless = headless
+        self.timeout_ms = timeout * 1000
+        self.memory_budget_mb = memory_budget_mb
+        self.recycle_after = recycle_after
+        self.idle_timeout = idle_timeout
+        self.auth = auth
+        self.policy = policy or LoadPolicy()
+        self._jobs: queue.Queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._launch_lock = threading.Lock()
+        self._workers: list[_BrowserWorker] = []
+        # Jobs submitted and not yet finished (queued or running)
+        self._outstanding = 0
+        self._spawned = 0
+        self._closed = False
+        self._counters = {"jobs": 0, "launches": 0, "recycles": 0, "crashes": 0}
+
+    def submit(self, job, timeout: int | None = None, policy: LoadPolicy | None = None) -> Future:
+        """Queue ``job(page)`` and return a Future for its result.
+
+        Args:
+            job: Callable receiving a fresh ``Page``; its return value becomes the result
+            timeout: Page default timeout in seconds (default: the pool's)
+            policy: Page load policy for this job (default: the pool's)
+        """
+        future: Future = Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("BrowserPool is closed")
+            self._jobs.put((job, future, timeout * 1000 if timeout else self.timeout_ms, policy or self.policy))
+            self._outstanding += 1
+            # Start another browser only when every running one is busy
+            if len(self._workers) < self.size and self._outstanding > len(self._workers):
+                self._spawned += 1
+                worker = _BrowserWorker(self, self._spawned)
+                self._workers.append(worker)
+                worker.start()
+        return future
+
+    def run(self, job, timeout: int | None = None, policy: LoadPolicy | None = None):
+        """Run ``job(page)`` on a pooled browser and return its result (or raise its exception)."""
+        return self.submit(job, timeout, policy).result()
+
+    def recycle(self) -> None:
+        """Ask every browser to restart after its current job (e.g. after a deployment of the target app)."""
+        with self._lock:
+            for worker in self._workers:
+                worker.recycle_requested = True
+
+    def stats(self) -> dict:
+        rss = process_tree_rss_mb()
+        with self._lock:
+            queued = self._jobs.qsize()
+            return {
+                **self._counters,
+                "browsers": len(self._workers),
+                "busy": self._outstanding - queued,
+                "queued": queued,
+                "max_browsers": self.size,
+                "rss_mb": rss,
+                "memory_budget_mb": self.memory_budget_mb,
+            }
+
+    def close(self) -> None:
+        """Stop accepting jobs, let queued jobs finish and close every browser."""
+        with self._lock:
+            self._closed = True
+            workers = list(self._workers)
+        for _ in workers:
+            self._jobs.put(_STOP)
+        for worker in workers:
+            worker.join(timeout=30)
+
+    def _memory_recycle_reason(self, worker: _BrowserWorker) -> str | None:
+        """Why ``worker`` should recycle its browser to bring the pool back under its memory budget, if it should.
+
+        Only the largest browser is recycled, and only when no other recycle
+        is pending, so a pool over budget sheds one browser's memory at a
+        time instead of restarting every browser after every job.
+        """
+        with self._lock:
+            workers = list(self._workers)
+        sizes = {w: rss for w in workers if (rss := w.rss_mb()) is not None}
+        total = process_tree_rss_mb()
+        if not sizes or total is None or total <= self.memory_budget_mb:
+            return None
+        largest = max(sizes, key=sizes.get)
+        with self._lock:
+            if any(w.recycle_requested for w in self._workers if w is not worker):
+                return None
+            if largest is not worker:
+                # Restarts after its current (or next) job
+                largest.recycle_requested = True
+                return None
+        return (
+            f"pool RSS {total:.0f}MB over the {self.memory_budget_mb}MB budget, "
+            f"this browser is the largest at {sizes[worker]:.0f}MB"
+        )
+
+    def _job_finished(self) -> None:
+        with self._lock:
+            self._outstanding -= 1
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._counters[name] += 1
+
+    def _worker_exited(self, worker: _BrowserWorker) -> None:
+        with self._lock:
+            if worker in self._workers:
+                self._workers.remove(worker)
+            # A job may have been queued while this worker was timing out
+            respawn = not self._closed and not self._workers and not self._jobs.empty()
+            if respawn:
+                self._spawned += 1
+                replacement = _BrowserWorker(self, self._spawned)
+                self._workers.append(replacement)
+                replacement.start()
+
+
+def process_tree_rss_mb(root: int | None = None, include_root: bool = False) -> float | None:
+    """Resident memory of the processes descended from ``root`` (default: this one), in MB.
+
+    Reads /proc, so it returns None where that is unavailable. Chromium
+    processes share pages, so the sum over-estimates real usage slightly,
+    which errs on the safe side for a budget.
+
+    Args:
+        root: PID whose descendants are counted (default: this process,
+            i.e. every browser and driver of the pool)
+        include_root: Count ``root`` itself too
+    """
+    proc = Path("/proc")
+    if not proc.is_dir():
+        return None
+    children = _process_children()
+    root = root or os.getpid()
+
+    total_kb = 0
+    pending = list(children.get(root, [])) + ([root] if include_root else [])
+    while pending:
+        pid = pending.pop()
+        pending.extend(children.get(pid, []))
+        try:
+            for line in (proc / str(pid) / "status").read_text().splitlines():
+                if line.startswith("VmRSS:"):
+                    total_kb += int(line.split()[1])
+                    break
+        except OSError:
+            continue
+    return total_kb / 1024
+
+
+def _process_children() -> dict[int, list[int]]:
+    """Parent PID -> child PIDs of every process in /proc (empty where /proc is unavailable)."""
+    proc = Path("/proc")
+    children: dict[int, list[int]] = {}
+    if not proc.is_dir():
+        return children
+    for entry in proc.iterdir():
+        if not entry.name.isdigit():
+            continue
+        try:
+            stat = (entry / "stat").read_text()
+        except OSError:
+            continue
+        # The command name is parenthesised and may contain spaces
+        ppid = int(stat.rsplit(")", 1)[1].split()[1])
+        children.setdefault(ppid, []).append(int(entry.name))
+    return children
+
+
+def _child_pids(pid: int) -> set[int]:
+    return set(_process_children().get(pid, []))
+
+
+_pool: BrowserPool | None = None
+_pool_lock = threading.Lock()
+
+
+def get_browser_pool() -> BrowserPool:
+    """Return the process-wide browser pool, creating it on first use."""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                logger.info("Creating browser pool (max %d browsers, headless=%s)", WEB_UI_POOL_SIZE, WEB_UI_HEADLESS)
+                _pool = BrowserPool(
+                    size=WEB_UI_POOL_SIZE,
+                    headless=WEB_UI_HEADLESS,
+                    timeout=WEB_UI_TIMEOUT,
+                    memory_budget_mb=WEB_UI_MEMORY_BUDGET_MB,
+                    recycle_after=WEB_UI_RECYCLE_AFTER,
+                    idle_timeout=WEB_UI_POOL_IDLE_TIMEOUT,
+                    auth=get_web_auth(),
+                    policy=LoadPolicy.from_config(),
+                )
+                atexit.register(_pool.close)
+    return _pool
@@ -0,0 +1 @@
+"""Jira REST API client support for the MCP server."""
@@ -0,0 +1,323 @@
+"""Iterative Atlassian Document Format (ADF) renderer for Markdown and plain text.
+
+The renderer walks the document with an explicit stack instead of recursion,
+so deeply nested documents cannot hit Python's recursion limit, and appends
+every fragment to a single output buffer that is joined once at the end.
+"""
+
+import logging
+from collections.abc import Callable
+from datetime import datetime, timezone
+
+logger = logging.getLogger(__name__)
+
+MARKDOWN = "markdown"
+TEXT = "text"
+
+_MARK_DELIMITERS = {"strong": "**", "em": "*", "strike": "~~", "code": "`"}
+_PANEL_LABELS = {"info": "Info", "note": "Note", "warning": "Warning", "error": "Error", "success": "Success", "tip": "Tip"}
+# Containers whose children are simply rendered in order
+_TRANSPARENT = {"doc", "layoutSection", "layoutColumn", "bodiedExtension"}
+# Top-level block nodes start on a new line (after a blank line in Markdown)
+_BLOCKS = {
+    "paragraph", "heading", "rule", "codeBlock", "bulletList", "orderedList", "taskList", "decisionList",
+    "blockquote", "panel", "expand", "nestedExpand", "table", "mediaSingle", "mediaGroup",
+    "blockCard", "embedCard", "extension",
+}
+
+_warned_types: set[str] = set()
+
+
+class _Writer:
+    """Line-aware output buffer that applies nested line prefixes (lists, quotes)."""
+
+    def __init__(self):
+        self.parts: list[str] = []
+        # Each prefix is [first_line, continuation, first_line_used]
+        self.prefixes: list[list] = []
+        self.at_line_start = True
+        self.trailing_newlines = 0
+        # Inside table cells block breaks collapse to single spaces
+        self.inline_depth = 0
+        self.pending_space = False
+
+    def write(self, text: str) -> None:
+        # Fast path: mid-line text without line breaks needs no bookkeeping
+        if not self.at_line_start and not self.pending_space and "\n" not in text:
+            if text:
+                self.parts.append(text)
+                self.trailing_newlines = 0
+            return
+        for i, chunk in enumerate(text.split("\n")):
+            if i:
+                self.newline()
+            if chunk:
+                if self.at_line_start and self.prefixes:
+                    self.parts.append(self._prefix())
+                if self.pending_space:
+                    self.parts.append(" ")
+                    self.pending_space = False
+                self.parts.append(chunk)
+                self.at_line_start = False
+                self.trailing_newlines = 0
+
+    def newline(self) -> None:
+        if self.inline_depth:
+            self.pending_space = not self.at_line_start
+            return
+        self.parts.append("\n")
+        self.at_line_start = True
+        self.trailing_newlines += 1
+
+    def end_line(self) -> None:
+        if not self.at_line_start and not self.inline_depth:
+            self.newline()
+
+    def blank_line(self) -> None:
+        """Ensure the next block starts after an empty line (no-op at document start)."""
+        if not self.parts or self.inline_depth:
+            return
+        self.end_line()
+        if self.trailing_newlines < 2:
+            self.newline()
+
+    def push_prefix(self, first: str, rest: str | None = None) -> None:
+        self.prefixes.append([first, first if rest is None else rest, False])
+
+    def pop_prefix(self) -> None:
+        self.prefixes.pop()
+
+    def _prefix(self) -> str:
+        out = []
+        for prefix in self.prefixes:
+            out.append(prefix[1] if prefix[2] else prefix[0])
+            prefix[2] = True
+        return "".join(out)
+
+    def getvalue(self) -> str:
+        return "".join(self.parts)
+
+
+def render_adf(node: dict | list | str | None, target: str = MARKDOWN) -> str:
+    """Render an ADF document (or fragment) as Markdown or plain text.
+
+    Args:
+        node: An ADF node, list of nodes, or plain string (returned unchanged)
+        target: 'markdown' (marks, links, tables and headings as Markdown) or 'text'
+
+    Returns:
+        The rendered string. Unknown node types fall back to their children.
+    """
+    if node is None:
+        return ""
+    if isinstance(node, str):
+        return node
+    if target not in (MARKDOWN, TEXT):
+        raise ValueError(f"Unknown ADF render target: {target}")
+
+    md = target == MARKDOWN
+    out = _Writer()
+    # Stack items are nodes or zero-argument callbacks, processed LIFO
+    stack: list = list(reversed(node)) if isinstance(node, list) else [node]
+
+    def push_children(n: dict) -> None:
+        stack.extend(reversed(n.get("content") or []))
+
+    def push_list_items(items: list, prefix_for: Callable[[int, dict], str], nested_indent: int) -> None:
+        for i in range(len(items) - 1, -1, -1):
+            marker = prefix_for(i, items[i])
+            stack.append(out.pop_prefix)
+            stack.append(items[i])
+            stack.append(lambda marker=marker: out.push_prefix(marker, " " * max(nested_indent, len(marker))))
+
+    pop, write, newline = stack.pop, out.write, out.newline
+    while stack:
+        item = pop()
+        if type(item) is not dict:
+            if callable(item):
+                item()
+            elif isinstance(item, str):
+                write(item)
+            elif item is not None:
+                write(str(item))
+            continue
+
+        node_type = item.get("type", "")
+        # Text nodes dominate real documents, so they skip the dispatch below
+        if node_type == "text":
+            marks = item.get("marks")
+            if marks:
+                _write_text(out, item.get("text", ""), marks, md)
+            else:
+                write(item.get("text", ""))
+            continue
+
+        attrs = item.get("attrs") or {}
+        if node_type in _BLOCKS:
+            if md and not out.prefixes:
+                out.blank_line()
+            else:
+                out.end_line()
+
+        if node_type == "hardBreak":
+            out.newline()
+        elif node_type == "mention":
+            out.write(attrs.get("text", ""))
+        elif node_type == "emoji":
+            out.write(attrs.get("text") or attrs.get("shortName", ""))
+        elif node_type == "status":
+            out.write(f"[{attrs.get('text', '')}]")
+        elif node_type == "date":
+            out.write(_format_timestamp(attrs.get("timestamp")))
+        elif node_type in ("inlineCard", "blockCard", "embedCard"):
+            url = attrs.get("url") or (attrs.get("data") or {}).get("url", "")
+            out.write(f"<{url}>" if md and url else url)
+            if node_type != "inlineCard":
+                out.end_line()
+        elif node_type in ("media", "mediaInline"):
+            name = attrs.get("alt") or attrs.get("filename") or attrs.get("id", "")
+            out.write(f"[media: {name}]")
+        elif node_type in ("extension", "inlineExtension"):
+            out.write(f"[extension: {attrs.get('extensionKey', '')}]")
+        elif node_type == "placeholder":
+            pass
+        elif node_type == "paragraph":
+            stack.append(newline)
+            push_children(item)
+        elif node_type == "heading":
+            if md:
+                out.write("#" * int(attrs.get("level", 1)) + " ")
+            stack.append(out.newline)
+            push_children(item)
+        elif node_type == "rule":
+            out.write("---")
+            out.newline()
+        elif node_type == "codeBlock":
+            out.end_line()
+            out.write(f"```{attrs.get('language', '') if md else ''}")
+            out.newline()
+            stack.append(lambda: _close_fence(out))
+            # Code is literal: marks are never applied inside code blocks
+            stack.extend(reversed([c.get("text", "") for c in item.get("content") or [] if isinstance(c, dict)]))
+        elif node_type == "bulletList":
+            out.end_line()
+            push_list_items(item.get("content") or [], lambda i, _: "- ", 2)
+        elif node_type == "orderedList":
+            out.end_line()
+            start = int(attrs.get("order", 1) or 1)
+            push_list_items(item.get("content") or [], lambda i, _: f"{start + i}. ", 3)
+        elif node_type == "taskList":
+            out.end_line()
+            push_list_items(
+                item.get("content") or [],
+                lambda i, task: "- [x] " if (task.get("attrs") or {}).get("state") == "DONE" else "- [ ] ",
+                2,
+            )
+        elif node_type == "decisionList":
+            out.end_line()
+            push_list_items(item.get("content") or [], lambda i, _: "- Decision: ", 2)
+        elif node_type in ("listItem", "taskItem", "decisionItem"):
+            stack.append(out.end_line)
+            push_children(item)
+        elif node_type in ("blockquote", "panel"):
+            out.end_line()
+            out.push_prefix("> ")
+            stack.append(out.pop_prefix)
+            push_children(item)
+            if node_type == "panel":
+                label = _PANEL_LABELS.get(attrs.get("panelType", "info"), "Note")
+                out.write(f"**{label}:**" if md else f"{label}:")
+                out.newline()
+        elif node_type in ("expand", "nestedExpand"):
+            title = attrs.get("title", "")
+            if title:
+                out.write(f"**{title}**" if md else title)
+                out.newline()
+            push_children(item)
+        elif node_type in ("mediaSingle", "mediaGroup"):
+            stack.append(out.end_line)
+            push_children(item)
+        elif node_type == "table":
+            out.end_line()
+            _push_table(stack, out, item, md)
+        elif node_type in _TRANSPARENT:
+            push_children(item)
+        else:
+            if node_type not in _warned_types:
+                _warned_types.add(node_type)
+                logger.debug("Unhandled ADF node type '%s'; rendering its children", node_type)
+            if item.get("text"):
+                out.write(item["text"])
+            push_children(item)
+
+    return out.getvalue()
+
+
+def _close_fence(out: _Writer) -> None:
+    out.end_line()
+    out.write("```")
+    out.newline()
+
+
+def _write_text(out: _Writer, text: str, marks: list[dict], md: bool) -> None:
+    """Write a text node, wrapping it in Markdown syntax for its marks."""
+    link = next((m for m in marks if m.get("type") == "link"), None)
+    href = (link.get("attrs") or {}).get("href", "") if link else ""
+    if not md:
+        out.write(f"{text} ({href})" if href and href != text else text)
+        return
+
+    opening, closing = [], []
+    for mark in marks:
+        delimiter = _MARK_DELIMITERS.get(mark.get("type", ""))
+        if delimiter:
+            opening.append(delimiter)
+            closing.insert(0, delimiter)
+    body = "".join(opening) + text + "".join(closing)
+    out.write(f"[{body}]({href})" if href else body)
+
+
+def _push_table(stack: list, out: _Writer, table: dict, md: bool) -> None:
+    """Schedule a table as '| a | b |' rows, with a header separator in Markdown."""
+    rows = [r for r in table.get("content") or [] if isinstance(r, dict)]
+
+    def start_cell() -> None:
+        out.inline_depth += 1
+
+    def end_cell() -> None:
+        out.inline_depth -= 1
+        out.pending_space = False
+        out.write(" |")
+
+    ops: list = []
+    for row_index, row in enumerate(rows):
+        cells = [c for c in row.get("content") or [] if isinstance(c, dict)]
+        ops.append("|")
+        for cell in cells:
+            ops.append(" ")
+            ops.append(start_cell)
+            ops.extend(cell.get("content") or [])
+            ops.append(end_cell)
+        ops.append(out.newline)
+        if md and row_index == 0:
+            ops.append("|" + " --- |" * len(cells))
+            ops.append(out.newline)
+    stack.extend(reversed(ops))
+
+
+def _format_timestamp(timestamp: str | int | None) -> str:
+    """Format an ADF date node's epoch-millisecond timestamp as YYYY-MM-DD."""
+    try:
+        return datetime.fromtimestamp(int(timestamp) / 1000, tz=timezone.utc).strftime("%Y-%m-%d")
+    except (TypeError, ValueError, OverflowError):
+        return str(timestamp or "")
+
+
+def adf_to_markdown(node: dict | list | str | None) -> str:
+    """Render ADF as Markdown."""
+    return render_adf(node, MARKDOWN)
+
+
+def adf_to_text(node: dict | list | str | None) -> str:
+    """Render ADF as plain text."""
+    return render_adf(node, TEXT)
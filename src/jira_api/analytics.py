@@ -0,0 +1,224 @@
+"""Columnar worklog aggregation: duration parsing, grouped totals and pivots."""
+
+import re
+from array import array
+from collections.abc import Iterable
+from datetime import date
+
+from jira_api.config import JIRA_DAYS_PER_WEEK, JIRA_HOURS_PER_DAY
+
+# Dimensions worklogs can be grouped by
+GROUP_DIMENSIONS = ("person", "day", "week", "ticket", "project")
+# Sort keys besides the group dimensions themselves
+SORT_KEYS = ("time", "count")
+
+_DURATION_RE = re.compile(r"(\d+(?:\.\d+)?)\s*([wdhm])", re.IGNORECASE)
+_UNIT_SECONDS = {
+    "w": JIRA_DAYS_PER_WEEK * JIRA_HOURS_PER_DAY * 3600,
+    "d": JIRA_HOURS_PER_DAY * 3600,
+    "h": 3600,
+    "m": 60,
+}
+
+
+def parse_duration(text: str) -> int:
+    """Convert a Jira duration such as ``"1d 2h 30m"`` to seconds.
+
+    Days and weeks use the working-time settings (JIRA_HOURS_PER_DAY,
+    JIRA_DAYS_PER_WEEK), as Jira does.
+
+    Raises:
+        ValueError: The text is not a Jira duration
+    """
+    text = (text or "").strip()
+    parts = _DURATION_RE.findall(text)
+    if not parts or _DURATION_RE.sub("", text).strip():
+        raise ValueError(f"Invalid duration '{text}' (expected e.g. '2h 30m', '1d', '45m')")
+    return round(sum(float(amount) * _UNIT_SECONDS[unit.lower()] for amount, unit in parts))
+
+
+def format_duration(seconds: int) -> str:
+    """Render seconds as hours and minutes (``"42h 30m"``), which stays unambiguous for totals."""
+    hours, minutes = divmod(round(seconds / 60), 60)
+    if hours and minutes:
+        return f"{hours}h {minutes}m"
+    return f"{hours}h" if hours else f"{minutes}m"
+
+
+def worklog_seconds(log: dict) -> int:
+    """Seconds spent on a worklog, parsed from ``timeSpent`` when Jira omits ``timeSpentSeconds``."""
+    seconds = log.get("timeSpentSeconds")
+    if seconds is not None:
+        return int(seconds)
+    try:
+        return parse_duration(log.get("timeSpent", ""))
+    except ValueError:
+        return 0
+
+
+class _Dictionary:
+    """Maps distinct strings to dense integer codes."""
+
+    def __init__(self):
+        self.codes: dict[str, int] = {}
+        self.values: list[str] = []
+
+    def encode(self, value: str) -> int:
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+
+class WorklogTable:
+    """Worklogs held as parallel typed arrays rather than one dict per entry.
+
+    Strings (person, ticket, project) are dictionary-encoded to integer
+    codes and days are stored as date ordinals, so a year of team worklogs
+    is a few flat ``array`` columns. Grouping packs each row's codes into a
+    single integer and sums seconds per packed key in one pass.
+    """
+
+    def __init__(self):
+        self.seconds = array("q")
+        self.days = array("l")
+        self.people = array("l")
+        self.tickets = array("l")
+        self.projects = array("l")
+        self._people = _Dictionary()
+        self._tickets = _Dictionary()
+        self._projects = _Dictionary()
+
+    def __len__(self) -> int:
+        return len(self.seconds)
+
+    @classmethod
+    def from_entries(
+        cls,
+        entries: Iterable[tuple[str, dict]],
+        start_date: str,
+        end_date: str,
+        people: list[str] | None = None,
+    ) -> "WorklogTable":
+        """Load ``(issue key, worklog)`` pairs started within the dates, optionally only for matching people.
+
+        ``people`` entries match case-insensitively as substrings of the author's display name.
+        """
+        table = cls()
+        needles = [p.lower() for p in people or []]
+        for key, log in entries:
+            started = log.get("started", "")[:10]
+            if not start_date <= started <= end_date:
+                continue
+            author = (log.get("author") or {}).get("displayName", "Unknown")
+            if needles and not any(n in author.lower() for n in needles):
+                continue
+            table.append(key, author, started, worklog_seconds(log))
+        return table
+
+    def append(self, ticket: str, person: str, day: str, seconds: int) -> None:
+        """Add one worklog; ``day`` is an ISO date."""
+        self.seconds.append(seconds)
+        self.days.append(date.fromisoformat(day).toordinal())
+        self.people.append(self._people.encode(person))
+        self.tickets.append(self._tickets.encode(ticket))
+        self.projects.append(self._projects.encode(ticket.rsplit("-", 1)[0]))
+
+    def total(self) -> int:
+        return sum(self.seconds)
+
+    def rows(self) -> list[tuple[str, str, str, int]]:
+        """Every worklog as ``(day, person, ticket, seconds)``, in load order."""
+        return [
+            (date.fromordinal(d).isoformat(), self._people.values[p], self._tickets.values[t], s)
+            for d, p, t, s in zip(self.days, self.people, self.tickets, self.seconds)
+        ]
+
+    def group(self, dimensions: list[str], sort_by: str = "") -> list[tuple[tuple[str, ...], int, int]]:
+        """Total seconds and worklog count per combination of ``dimensions``.
+
+        Args:
+            dimensions: Names from GROUP_DIMENSIONS; an empty list gives one grand-total group
+            sort_by: 'time' or 'count' (largest first), or one of ``dimensions`` (ascending).
+                A leading '-' reverses the order. Default: by the dimensions in order
+
+        Returns:
+            ``(labels, seconds, count)`` per group, labels in ``dimensions`` order
+
+        Raises:
+            ValueError: Unknown dimension or sort key
+        """
+        for dim in dimensions:
+            if dim not in GROUP_DIMENSIONS:
+                raise ValueError(f"Unknown group_by '{dim}'. Use any of: {', '.join(GROUP_DIMENSIONS)}")
+        reverse = sort_by.startswith("-")
+        sort_key = sort_by.lstrip("-")
+        if sort_key and sort_key not in SORT_KEYS and sort_key not in dimensions:
+            raise ValueError(
+                f"Unknown sort_by '{sort_by}'. Use 'time', 'count' or one of the group_by dimensions"
+            )
+
+        # Pack each row's codes into one integer (mixed radix), so grouping is
+        # a single pass of integer dict updates instead of tuple building
+        columns, decoders = [], []
+        for dim in dimensions:
+            codes, values = self._column(dim)
+            columns.append((codes, len(values)))
+            decoders.append(values)
+        packed = array("q", [0]) * len(self)
+        for codes, radix in columns:
+            packed = array("q", [k * radix + c for k, c in zip(packed, codes)])
+
+        seconds: dict[int, int] = {}
+        counts: dict[int, int] = {}
+        for k, s in zip(packed, self.seconds):
+            seconds[k] = seconds.get(k, 0) + s
+            counts[k] = counts.get(k, 0) + 1
+
+        groups = []
+        for k, total in seconds.items():
+            labels, rest = [], k
+            for (_, radix), values in zip(reversed(columns), reversed(decoders)):
+                rest, code = divmod(rest, radix)
+                labels.append(values[code])
+            groups.append((tuple(reversed(labels)), total, counts[k]))
+
+        if sort_key == "time":
+            groups.sort(key=lambda g: g[1], reverse=not reverse)
+        elif sort_key == "count":
+            groups.sort(key=lambda g: g[2], reverse=not reverse)
+        elif sort_key:
+            i = dimensions.index(sort_key)
+            groups.sort(key=lambda g: g[0][i], reverse=reverse)
+        else:
+            groups.sort(key=lambda g: g[0], reverse=reverse)
+        return groups
+
+    def pivot(self, row_dim: str, col_dim: str) -> tuple[list[str], list[str], dict[tuple[str, str], int]]:
+        """Cross-tabulate seconds: ``(row labels, column labels, {(row, column): seconds})``, labels sorted."""
+        cells = {labels: total for labels, total, _ in self.group([row_dim, col_dim])}
+        rows = sorted({r for r, _ in cells})
+        cols = sorted({c for _, c in cells})
+        return rows, cols, cells
+
+    def _column(self, dim: str) -> tuple[array, list[str]]:
+        """Integer codes for a dimension plus the label of each code."""
+        if dim == "person":
+            return self.people, self._people.values
+        if dim == "ticket":
+            return self.tickets, self._tickets.values
+        if dim == "project":
+            return self.projects, self._projects.values
+        # Days and weeks: re-code ordinals densely so the packing radix stays small
+        if dim == "week":
+            # Ordinal 1 (0001-01-01) is a Monday, so this is the Monday of each ISO week
+            ordinals = array("l", [d - (d - 1) % 7 for d in self.days])
+        else:
+            ordinals = self.days
+        distinct = sorted(set(ordinals))
+        index = {o: i for i, o in enumerate(distinct)}
+        labels = [date.fromordinal(o).isoformat() for o in distinct]
+        if dim == "week":
+            labels = [f"{label} (W{date.fromisoformat(label).isocalendar()[1]:02d})" for label in labels]
+        return array("l", [index[o] for o in ordinals]), labels
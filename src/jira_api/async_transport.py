@@ -0,0 +1,169 @@
+"""Pooled asyncio HTTP transport for the Jira REST API (httpx)."""
+
+import asyncio
+import logging
+import threading
+import time
+import weakref
+from base64 import b64encode
+
+import httpx
+
+from jira_api.config import JIRA_API_TOKEN, JIRA_BASE_URL, JIRA_EMAIL, JIRA_POOL_SIZE, JIRA_TIMEOUT
+from jira_api.lazy import lazy_import
+from jira_api.metrics import metrics
+from jira_api.ratelimit import RetryScheduler, get_scheduler
+
+requests = lazy_import("requests")
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncJiraTransport:
+    """An ``httpx.AsyncClient`` counterpart of :class:`~jira_api.transport.JiraTransport`.
+
+    Requests share the sync transport's rate limiter and retry policy, and
+    failures are raised as the same :mod:`requests` exception types
+    (``e.response.status_code`` / ``e.response.text`` work unchanged), so
+    tools handle errors identically on either path.
+
+    An httpx client is bound to the event loop it was first used on, so
+    each loop gets its own client (e.g. a script calling ``asyncio.run``
+    twice). A client is closed on its loop when that loop shuts down.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        email: str,
+        api_token: str,
+        pool_size: int = 10,
+        timeout: int = 30,
+        scheduler: RetryScheduler | None = None,
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.api_url = f"{self.base_url}/rest/api/3/"
+        self.pool_size = max(1, pool_size)
+        self.timeout = timeout
+        self.scheduler = scheduler or get_scheduler()
+
+        token = b64encode(f"{email}:{api_token}".encode()).decode()
+        self._headers = {
+            "Authorization": f"Basic {token}",
+            "Accept": "application/json",
+            "Accept-Encoding": "gzip, deflate",
+        }
+        # Event loop -> (client, async generator closing it at loop shutdown)
+        self._clients: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+        self._request_count = 0
+
+    async def _get_client(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            entry = self._clients.get(loop)
+            if entry is not None:
+                return entry[0]
+            # Clients of finished loops were closed at their shutdown
+            for finished in [other for other in self._clients if other.is_closed()]:
+                del self._clients[finished]
+            client = httpx.AsyncClient(
+                headers=self._headers,
+                timeout=self.timeout,
+                limits=httpx.Limits(max_connections=self.pool_size, max_keepalive_connections=self.pool_size),
+            )
+            closer = _close_at_loop_shutdown(client)
+            self._clients[loop] = (client, closer)
+        # Started generators are finalized (closing the client) by the loop's
+        # shutdown_asyncgens, which asyncio.run and anyio.run call
+        await closer.__anext__()
+        return client
+
+    async def request(
+        self,
+        method: str,
+        endpoint: str,
+        params: dict | None = None,
+        json_data: dict | list | None = None,
+    ) -> httpx.Response:
+        """Send a request to ``/rest/api/3/{endpoint}`` and raise on HTTP errors."""
+        client = await self._get_client()
+
+        async def send() -> httpx.Response:
+            with self._lock:
+                self._request_count += 1
+            start = time.perf_counter()
+            try:
+                resp = await client.request(method, self.api_url + endpoint, params=params, json=json_data)
+            except httpx.TimeoutException as e:
+                metrics.observe_request(method, endpoint, None, time.perf_counter() - start)
+                raise requests.Timeout(f"{method} {endpoint} timed out: {e}") from e
+            except httpx.TransportError as e:
+                metrics.observe_request(method, endpoint, None, time.perf_counter() - start)
+                raise requests.ConnectionError(f"{method} {endpoint} failed: {e}") from e
+            metrics.observe_request(
+                method, endpoint, resp.status_code, time.perf_counter() - start,
+                len(resp.request.content), len(resp.content),
+            )
+            return resp
+
+        return await self.scheduler.run_async(send, method, endpoint)
+
+    async def get(self, endpoint: str, params: dict | None = None) -> dict:
+        """GET an endpoint and return the decoded JSON body."""
+        return _decode(await self.request("GET", endpoint, params=params))
+
+    async def post(self, endpoint: str, json_data: dict | list) -> dict:
+        """POST a JSON body and return the decoded JSON body ({} if empty)."""
+        return _decode(await self.request("POST", endpoint, json_data=json_data))
+
+    async def put(self, endpoint: str, json_data: dict | list) -> None:
+        """PUT a JSON body, discarding the response."""
+        await self.request("PUT", endpoint, json_data=json_data)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"requests": self._request_count, "pool_size": self.pool_size}
+
+    async def aclose(self) -> None:
+        """Close the pooled connections of the current loop's client."""
+        with self._lock:
+            entry = self._clients.pop(asyncio.get_running_loop(), None)
+        if entry is not None:
+            await entry[1].aclose()
+
+
+async def _close_at_loop_shutdown(client: httpx.AsyncClient):
+    """Suspend until closed (explicitly or when the loop finalizes async generators), then close ``client``."""
+    try:
+        yield
+    finally:
+        await client.aclose()
+
+
+def _decode(resp: httpx.Response) -> dict:
+    """Decode a JSON response body, treating an empty body (e.g. 204) as {}."""
+    if not resp.content:
+        return {}
+    return resp.json()
+
+
+_transport: AsyncJiraTransport | None = None
+_transport_lock = threading.Lock()
+
+
+def get_async_transport() -> AsyncJiraTransport:
+    """Return the process-wide async transport, creating it on first use."""
+    global _transport
+    if _transport is None:
+        with _transport_lock:
+            if _transport is None:
+                logger.info("Creating async Jira HTTP transport (pool_size=%d, timeout=%ds)", JIRA_POOL_SIZE, JIRA_TIMEOUT)
+                _transport = AsyncJiraTransport(
+                    JIRA_BASE_URL,
+                    JIRA_EMAIL,
+                    JIRA_API_TOKEN,
+                    pool_size=JIRA_POOL_SIZE,
+                    timeout=JIRA_TIMEOUT,
+                )
+    return _transport
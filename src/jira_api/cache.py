@@ -0,0 +1,88 @@
+"""Thread-safe in-process LRU cache with per-entry TTL."""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any
+
+
+class TTLCache:
+    """An LRU cache whose entries go stale after ``ttl`` seconds.
+
+    Stale entries are kept (until evicted) so callers can revalidate them
+    cheaply with :meth:`get_stale` and :meth:`touch` instead of refetching.
+    """
+
+    def __init__(self, maxsize: int = 256, ttl: float = 60.0):
+        self.maxsize = max(1, maxsize)
+        self.ttl = ttl
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.invalidations = 0
+
+    def get(self, key: Hashable) -> Any | None:
+        """Return a fresh value, or None if absent or stale (counted as a miss)."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None or time.monotonic() - entry[0] > self.ttl:
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def get_stale(self, key: Hashable) -> Any | None:
+        """Return a value regardless of age, without touching the counters."""
+        with self._lock:
+            entry = self._data.get(key)
+            return entry[1] if entry is not None else None
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a value, evicting the least recently used entry when full."""
+        with self._lock:
+            self._data[key] = (time.monotonic(), value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def touch(self, key: Hashable) -> None:
+        """Mark a stale entry as fresh again after a successful revalidation."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                self._data[key] = (time.monotonic(), entry[1])
+                self._data.move_to_end(key)
+                self.revalidations += 1
+
+    def invalidate(self, predicate: Callable[[Hashable], bool]) -> int:
+        """Drop every entry whose key matches ``predicate``; return how many were dropped."""
+        with self._lock:
+            doomed = [k for k in self._data if predicate(k)]
+            for k in doomed:
+                del self._data[k]
+            self.invalidations += len(doomed)
+            return len(doomed)
+
+    def clear(self) -> None:
+        """Drop all entries (counters are kept)."""
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> dict:
+        """Return size, TTL and hit/miss counters."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "revalidations": self.revalidations,
+                "invalidations": self.invalidations,
+            }
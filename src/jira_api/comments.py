@@ -0,0 +1,98 @@
+"""Paginated comment retrieval for issues with more comments than Jira embeds."""
+
+import logging
+from collections.abc import Iterator
+from datetime import datetime, timezone
+
+from jira_api.transport import get_transport
+
+logger = logging.getLogger(__name__)
+
+# Jira returns at most 100 comments per page
+COMMENT_PAGE_SIZE = 100
+
+
+def iter_comment_pages(
+    issue_key: str,
+    newest_first: bool = False,
+    page_size: int = COMMENT_PAGE_SIZE,
+) -> Iterator[tuple[list[dict], int]]:
+    """Yield ``(comments, total)`` one page at a time from ``issue/{key}/comment``.
+
+    Only one page is held in memory at a time; stop iterating to stop fetching.
+    """
+    transport = get_transport()
+    start = 0
+    while True:
+        page = transport.get(f"issue/{issue_key}/comment", params={
+            "startAt": start,
+            "maxResults": page_size,
+            "orderBy": "-created" if newest_first else "created",
+        })
+        comments = page.get("comments", [])
+        total = page.get("total", start + len(comments))
+        if comments:
+            yield comments, total
+        start += len(comments)
+        if not comments or start >= total:
+            return
+
+
+def fetch_comments(
+    issue_key: str,
+    newest: int | None = None,
+    since: datetime | None = None,
+) -> tuple[list[dict], int]:
+    """Fetch an issue's comments, optionally only the newest N and/or those created since a time.
+
+    With ``newest`` or ``since``, pages are read newest-first and paging
+    stops as soon as enough comments were collected or an older comment is
+    reached, so old history is never downloaded.
+
+    Returns:
+        (comments oldest-first, total number of comments on the issue)
+    """
+    if newest is None and since is None:
+        comments, total = [], 0
+        for page, total in iter_comment_pages(issue_key):
+            comments.extend(page)
+        return comments, total
+
+    selected, total = [], 0
+    for page, total in iter_comment_pages(issue_key, newest_first=True):
+        for comment in page:
+            if since is not None and is_before(comment, since):
+                return selected[::-1], total
+            selected.append(comment)
+            if newest is not None and len(selected) >= newest:
+                return selected[::-1], total
+    return selected[::-1], total
+
+
+def parse_jira_time(value: str) -> datetime:
+    """Parse a Jira timestamp such as ``2026-02-20T10:00:00.000+0000``."""
+    try:
+        return datetime.strptime(value, "%Y-%m-%dT%H:%M:%S.%f%z")
+    except ValueError:
+        return parse_since(value)
+
+
+def is_before(comment: dict, since: datetime) -> bool:
+    """Whether a comment was created before ``since``; False if its timestamp is missing or unparseable."""
+    try:
+        return parse_jira_time(comment.get("created") or "") < since
+    except ValueError:
+        return False
+
+
+def parse_since(value: str) -> datetime:
+    """Parse a user-supplied date or ISO timestamp; naive values are taken as UTC.
+
+    Raises:
+        ValueError: The value is not a date or ISO 8601 timestamp
+    """
+    try:
+        parsed = datetime.fromisoformat(value.strip().replace("Z", "+00:00"))
+    except ValueError:
+        raise ValueError(f"Invalid date or timestamp '{value}' (expected e.g. 2026-02-01 or 2026-02-01T09:00:00+00:00)") from None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
@@ -0,0 +1,63 @@
+"""Bounded concurrent fan-out for independent Jira requests."""
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from typing import TypeVar
+
+from jira_api.config import JIRA_MAX_WORKERS
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def map_concurrent(
+    func: Callable[[T], R],
+    items: Iterable[T],
+    max_workers: int | None = None,
+) -> list[tuple[R | None, Exception | None]]:
+    """Apply ``func`` to every item on a bounded thread pool.
+
+    Results are returned in input order as ``(result, error)`` pairs, so
+    callers can merge them exactly as a serial loop would. Rate limiting and
+    retries happen in the transport, so workers share one request budget.
+    """
+    items = list(items)
+    workers = max(1, min(max_workers or JIRA_MAX_WORKERS, len(items) or 1))
+
+    def run(item: T) -> tuple[R | None, Exception | None]:
+        try:
+            return func(item), None
+        except Exception as e:
+            return None, e
+
+    if workers == 1:
+        return [run(item) for item in items]
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="jira-fanout") as pool:
+        return list(pool.map(run, items))
+
+
+async def gather_limited(
+    func: Callable[[T], Awaitable[R]],
+    items: Iterable[T],
+    max_workers: int | None = None,
+) -> list[tuple[R | None, Exception | None]]:
+    """Async counterpart of :func:`map_concurrent`.
+
+    Awaits ``func(item)`` for every item with ``asyncio.gather``, with at
+    most ``max_workers`` (default JIRA_MAX_WORKERS) in flight at once.
+    Results are ``(result, error)`` pairs in input order.
+    """
+    semaphore = asyncio.Semaphore(max(1, max_workers or JIRA_MAX_WORKERS))
+
+    async def run(item: T) -> tuple[R | None, Exception | None]:
+        async with semaphore:
+            try:
+                return await func(item), None
+            except Exception as e:
+                return None, e
+
+    return list(await asyncio.gather(*(run(item) for item in items)))
@@ -0,0 +1,60 @@
+"""Configuration for the Jira REST client, loaded from .env."""
+
+import os
+from pathlib import Path
+
+from dotenv import load_dotenv
+
+# Load .env from project root (two levels up from src/jira_api/)
+load_dotenv(Path(__file__).parent.parent.parent / ".env")
+
+JIRA_BASE_URL = os.getenv("JIRA_BASE_URL", "").rstrip("/")
+JIRA_EMAIL = os.getenv("JIRA_EMAIL", "")
+JIRA_API_TOKEN = os.getenv("JIRA_API_TOKEN", "")
+
+# HTTP transport tuning
+JIRA_TIMEOUT = int(os.getenv("JIRA_TIMEOUT", "30"))
+JIRA_POOL_SIZE = int(os.getenv("JIRA_POOL_SIZE", "10"))
+
+# Concurrent fan-out (e.g. per-issue worklog fetches). Keep at or below
+# JIRA_POOL_SIZE so workers never wait on a pooled connection.
+JIRA_MAX_WORKERS = int(os.getenv("JIRA_MAX_WORKERS", "8"))
+
+# Shared rate limit (requests per second, 0 disables) and retries of
+# throttled or transiently failing calls
+JIRA_RATE_LIMIT = float(os.getenv("JIRA_RATE_LIMIT", "20"))
+JIRA_RATE_BURST = int(os.getenv("JIRA_RATE_BURST", "40"))
+JIRA_MAX_RETRIES = int(os.getenv("JIRA_MAX_RETRIES", "4"))
+JIRA_RETRY_BACKOFF = float(os.getenv("JIRA_RETRY_BACKOFF", "1"))
+JIRA_MAX_RETRY_AFTER = int(os.getenv("JIRA_MAX_RETRY_AFTER", "60"))
+
+# Working time used to convert Jira durations ("1d", "1w") to seconds;
+# match the instance's time tracking settings
+JIRA_HOURS_PER_DAY = float(os.getenv("JIRA_HOURS_PER_DAY", "8"))
+JIRA_DAYS_PER_WEEK = float(os.getenv("JIRA_DAYS_PER_WEEK", "5"))
+
+# Server metrics (get_server_metrics): calls at least this slow are logged,
+# and an optional file (.prom/.txt = Prometheus text, else JSON) is rewritten
+# every JIRA_METRICS_DUMP_INTERVAL seconds
+JIRA_SLOW_CALL_SECONDS = float(os.getenv("JIRA_SLOW_CALL_SECONDS", "2"))
+JIRA_METRICS_FILE = Path(os.getenv("JIRA_METRICS_FILE")) if os.getenv("JIRA_METRICS_FILE") else None
+JIRA_METRICS_DUMP_INTERVAL = float(os.getenv("JIRA_METRICS_DUMP_INTERVAL", "60"))
+
+# Cold-start budget for --profile-startup: milliseconds from process start
+# until the server answers an MCP initialize request (0 disables the check)
+JIRA_STARTUP_BUDGET_MS = float(os.getenv("JIRA_STARTUP_BUDGET_MS", "1500"))
+
+# In-process cache for get_jira_issue responses
+JIRA_ISSUE_CACHE_SIZE = int(os.getenv("JIRA_ISSUE_CACHE_SIZE", "256"))
+JIRA_ISSUE_CACHE_TTL = float(os.getenv("JIRA_ISSUE_CACHE_TTL", "60"))
+
+# Optional local SQLite mirror of Jira issues (see sync_local_store)
+JIRA_STORE_PATH = Path(os.getenv("JIRA_STORE_PATH", "") or Path(__file__).parent.parent.parent / "jira_store.sqlite3")
+JIRA_STORE_PROJECTS = [p.strip() for p in os.getenv("JIRA_STORE_PROJECTS", "").split(",") if p.strip()]
+
+# Workflow transitions per (project, issue type, status)
+JIRA_TRANSITION_CACHE_TTL = float(os.getenv("JIRA_TRANSITION_CACHE_TTL", "600"))
+
+# Field metadata (field list + createmeta) persisted between server runs
+JIRA_FIELD_CACHE_PATH = Path(os.getenv("JIRA_FIELD_CACHE_PATH", "") or Path(__file__).parent.parent.parent / ".jira_field_cache.json")
+JIRA_FIELD_CACHE_TTL = float(os.getenv("JIRA_FIELD_CACHE_TTL", "86400"))
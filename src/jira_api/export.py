@@ -0,0 +1,133 @@
+"""Streaming, atomic file export of records as CSV, JSON Lines or Markdown."""
+
+import contextlib
+import csv
+import gzip
+import io
+import logging
+import os
+import tempfile
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
+from jira_api.formatting import to_json
+
+logger = logging.getLogger(__name__)
+
+CSV = "csv"
+JSONL = "jsonl"
+MARKDOWN = "markdown"
+EXPORT_FORMATS = (CSV, JSONL, MARKDOWN)
+_EXTENSIONS = {CSV: ".csv", JSONL: ".jsonl", MARKDOWN: ".md"}
+
+# Mode of a newly created file under the process umask (mkstemp files are 0600)
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+_NEW_FILE_MODE = 0o666 & ~_UMASK
+
+
+@contextlib.contextmanager
+def atomic_writer(path: Path, compress: bool = False) -> Iterator[io.TextIOBase]:
+    """Open a text stream whose content replaces ``path`` only once the block succeeds.
+
+    Data goes to a temporary file in the same directory, which is renamed
+    over ``path`` on success (an atomic replace on the same filesystem) and
+    deleted on failure, so readers never see a partial file. The result
+    keeps the mode of the file it replaces, or gets the umask's default
+    mode like any new file. With ``compress`` the stream is gzip-compressed.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        raw = os.fdopen(fd, "wb")
+        with raw:
+            if compress:
+                with gzip.GzipFile(filename=path.name.removesuffix(".gz"), mode="wb", fileobj=raw) as gz:
+                    with io.TextIOWrapper(gz, encoding="utf-8", newline="") as stream:
+                        yield stream
+            else:
+                with io.TextIOWrapper(raw, encoding="utf-8", newline="") as stream:
+                    yield stream
+        try:
+            mode = path.stat().st_mode & 0o7777
+        except FileNotFoundError:
+            mode = _NEW_FILE_MODE
+        os.chmod(tmp, mode)
+        os.replace(tmp, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp)
+        raise
+
+
+def export_path(directory: Path, filename: str, fmt: str, compress: bool) -> Path:
+    """Build the target path, adding the format's extension and .gz when missing."""
+    name = filename
+    if not Path(name.removesuffix(".gz")).suffix:
+        name = name.removesuffix(".gz") + _EXTENSIONS[fmt]
+    if compress and not name.endswith(".gz"):
+        name += ".gz"
+    return Path(directory) / name
+
+
+def write_records(
+    path: Path,
+    records: Iterable[dict],
+    fmt: str,
+    columns: list[str],
+    headers: dict[str, str] | None = None,
+    compress: bool = False,
+) -> int:
+    """Stream ``records`` to ``path`` atomically and return how many were written.
+
+    Records are consumed one at a time, so a generator of any length is
+    written in constant memory.
+
+    Args:
+        path: Target file
+        records: Dicts; CSV and Markdown write ``columns`` in order, JSON Lines writes each dict as-is
+        fmt: 'csv', 'jsonl' or 'markdown'
+        columns: Record keys to write as columns
+        headers: Optional column titles by key (default: the key)
+        compress: gzip the file
+    """
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format '{fmt}'. Use one of: {', '.join(EXPORT_FORMATS)}")
+    titles = [(headers or {}).get(c, c) for c in columns]
+    count = 0
+    with atomic_writer(path, compress) as stream:
+        if fmt == CSV:
+            writer = csv.writer(stream)
+            writer.writerow(titles)
+            for record in records:
+                writer.writerow([flatten_value(record.get(c)) for c in columns])
+                count += 1
+        elif fmt == JSONL:
+            for record in records:
+                stream.write(to_json(record))
+                stream.write("\n")
+                count += 1
+        else:
+            stream.write("| " + " | ".join(_md_cell(t) for t in titles) + " |\n")
+            stream.write("|" + " --- |" * len(titles) + "\n")
+            for record in records:
+                stream.write("| " + " | ".join(_md_cell(flatten_value(record.get(c))) for c in columns) + " |\n")
+                count += 1
+    logger.info("Exported %d record(s) to %s", count, path)
+    return count
+
+
+def flatten_value(value) -> str:
+    """Render a record value as a single flat string for CSV and Markdown cells."""
+    if value is None:
+        return ""
+    if isinstance(value, list):
+        return "; ".join(flatten_value(v) for v in value)
+    if isinstance(value, dict):
+        return to_json(value)
+    return str(value)
+
+
+def _md_cell(value: str) -> str:
+    return value.replace("|", "\\|").replace("\r", " ").replace("\n", "<br>")
@@ -0,0 +1,325 @@
+"""Field metadata registry: field list, name index and createmeta, cached on disk."""
+
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from jira_api.config import JIRA_BASE_URL, JIRA_FIELD_CACHE_PATH, JIRA_FIELD_CACHE_TTL
+from jira_api.lazy import lazy_import
+from jira_api.transport import get_transport
+
+requests = lazy_import("requests")
+
+logger = logging.getLogger(__name__)
+
+# After a failed field list fetch, seconds during which the failure is
+# returned (or the expired list served) instead of retrying the request
+FIELD_FAILURE_BACKOFF = 60
+
+# Custom field types that Jira manages itself and rejects on create
+# (schema.custom values, independent of the instance-specific field IDs)
+READ_ONLY_CUSTOM_TYPES = {
+    "com.pyxis.greenhopper.jira:gh-lexo-rank",  # Rank
+    "com.pyxis.greenhopper.jira:gh-sprint",  # Sprint (managed by board)
+    "com.atlassian.servicedesk:vp-origin",  # Request Type
+    "com.atlassian.servicedesk:sd-sla-field",  # SLAs
+    "com.atlassian.servicedesk:sd-request-feedback",  # Satisfaction
+    "com.atlassian.servicedesk:sd-request-feedback-date",
+    "com.atlassian.servicedesk.approvals-plugin:sd-approvals",
+    "com.atlassian.jira.plugins.jira-development-integration-plugin:devsummarycf",  # Development
+    "com.atlassian.jira.ext.charting:firstresponsedate",
+    "com.atlassian.jira.ext.charting:timeinstatus",
+}
+
+
+# Named field sets for the fields= parameter of the read tools
+FIELD_PRESETS = {
+    "minimal": ["summary", "status", "issuetype", "priority", "assignee", "updated"],
+    "triage": [
+        "summary", "status", "issuetype", "priority", "assignee", "reporter", "created", "updated", "project",
+        "labels", "components", "fixVersions", "versions", "resolution", "resolutiondate", "description",
+        "customfield_12000", "customfield_13981",
+    ],
+    "full": [
+        "summary", "description", "status", "priority", "assignee", "reporter", "created", "updated", "issuetype",
+        "project", "labels", "components", "fixVersions", "versions", "comment", "resolution", "resolutiondate",
+        "issuelinks", "attachment", "customfield_12000", "customfield_13981",
+    ],
+}
+# Jira's system field IDs. Tokens of a fields spec that are one of these
+# (in any case), customfield_N, *all or *navigable are used as IDs; anything
+# else is resolved as a field name. A leading '-' excludes a field.
+SYSTEM_FIELD_IDS = (
+    "aggregateprogress", "aggregatetimeestimate", "aggregatetimeoriginalestimate", "aggregatetimespent",
+    "assignee", "attachment", "comment", "components", "created", "creator", "description", "duedate",
+    "environment", "fixVersions", "issuelinks", "issuerestriction", "issuetype", "labels", "lastViewed",
+    "parent", "priority", "progress", "project", "reporter", "resolution", "resolutiondate", "security",
+    "status", "statuscategorychangedate", "statusCategory", "subtasks", "summary", "timeestimate",
+    "timeoriginalestimate", "timespent", "timetracking", "updated", "versions", "votes", "watches",
+    "worklog", "workratio",
+)
+_SYSTEM_FIELDS = {field_id.lower(): field_id for field_id in SYSTEM_FIELD_IDS}
+_CUSTOM_FIELD_RE = re.compile(r"^customfield_\d+$")
+_ALL_FIELDS = ("*all", "*navigable")
+
+
+class FieldRegistry:
+    """Jira field metadata, loaded once per process and persisted to disk.
+
+    The global field list (``GET field``) is fetched on first use, then served
+    from memory; it is also written to a JSON file so restarts within the TTL
+    cost no request. Create-screen metadata (createmeta) is loaded lazily per
+    project and issue type and persisted the same way.
+    """
+
+    def __init__(self, path: Path, ttl: float):
+        self.path = Path(path)
+        self.ttl = ttl
+        self._lock = threading.RLock()
+        self._fields: list[dict] | None = None
+        self._fetched_at = 0.0
+        self._by_id: dict[str, dict] = {}
+        self._by_name: dict[str, list[dict]] = {}
+        # "PROJECT/Issue Type" -> {"fetched_at": float, "fields": {field_id: meta}}
+        self._createmeta: dict[str, dict] = {}
+        self._loaded_from_disk = False
+        self._failed_at = 0.0
+        self._failure: Exception | None = None
+
+    # ---------- Field list ----------
+
+    def fields(self, refresh: bool = False) -> list[dict]:
+        """Return every field definition, fetching only when missing or expired.
+
+        When a fetch fails, an expired list is served if there is one;
+        otherwise the failure is raised again without a new request for
+        FIELD_FAILURE_BACKOFF seconds (unless ``refresh``).
+
+        Raises:
+            requests.RequestException: The field list is not cached and could not be fetched
+        """
+        with self._lock:
+            self._load_disk()
+            if refresh or self._fields is None or self._expired(self._fetched_at):
+                if not refresh and self._failure is not None and time.time() - self._failed_at < FIELD_FAILURE_BACKOFF:
+                    if self._fields is not None:
+                        return self._fields
+                    raise self._failure
+                logger.info("Loading Jira field list")
+                try:
+                    fields = get_transport().get("field")
+                except requests.RequestException as e:
+                    self._failed_at, self._failure = time.time(), e
+                    if self._fields is None:
+                        raise
+                    logger.warning("Could not refresh the field list, using the expired one: %s", e)
+                    return self._fields
+                self._failure = None
+                self._set_fields(fields, time.time())
+                self._save_disk()
+            return self._fields
+
+    def get(self, field_id: str) -> dict | None:
+        """Return a field definition by ID."""
+        self.fields()
+        return self._by_id.get(field_id)
+
+    def cached(self, field_id: str) -> dict | None:
+        """Return a field definition by ID from the cached list (memory or disk), never fetching."""
+        with self._lock:
+            self._load_disk()
+            return self._by_id.get(field_id)
+
+    def find(self, search: str = "", custom_only: bool = False) -> list[dict]:
+        """Return fields whose name contains ``search`` (case-insensitive), sorted by name."""
+        fields = self.fields()
+        needle = search.lower()
+        matches = [
+            f for f in fields
+            if (not custom_only or f.get("custom", False)) and needle in f.get("_name_lower", "")
+        ]
+        return sorted(matches, key=lambda f: f.get("name", ""))
+
+    def resolve(self, name_or_id: str) -> str | None:
+        """Resolve a field ID or exact (case-insensitive) field name to its ID."""
+        self.fields()
+        if name_or_id in self._by_id:
+            return name_or_id
+        matches = self._by_name.get(name_or_id.lower(), [])
+        return matches[0]["id"] if matches else None
+
+    def resolve_fields(self, spec: str | list[str]) -> list[str]:
+        """Expand presets and field names in a ``fields`` spec into Jira field IDs.
+
+        ``spec`` is a comma-separated string or list mixing preset names
+        (see FIELD_PRESETS), field IDs and field names, e.g.
+        ``"minimal, Resolution Path"``. System field IDs (SYSTEM_FIELD_IDS)
+        and ``customfield_N`` are used as they are; anything else, such as
+        ``sprint``, is looked up by name, which loads the field list.
+
+        Raises:
+            ValueError: A name matches no field
+        """
+        tokens = spec.split(",") if isinstance(spec, str) else spec
+        resolved: list[str] = []
+        for token in (t.strip() for t in tokens):
+            if not token:
+                continue
+            if token.lower() in FIELD_PRESETS:
+                resolved.extend(FIELD_PRESETS[token.lower()])
+                continue
+            exclude = token.startswith("-")
+            name = token[1:].strip() if exclude else token
+            field_id = _field_id(name) or self.resolve(name)
+            if field_id is None:
+                raise ValueError(f"Unknown field '{name}'. Use get_custom_fields to look up field names")
+            resolved.append(f"-{field_id}" if exclude else field_id)
+        return list(dict.fromkeys(resolved))
+
+    def is_copyable(self, field_id: str) -> bool:
+        """False for fields whose type Jira manages itself (rank, sprint, SLA, request type...)."""
+        field = self.get(field_id)
+        if field is None:
+            return True
+        return (field.get("schema") or {}).get("custom") not in READ_ONLY_CUSTOM_TYPES
+
+    # ---------- Createmeta ----------
+
+    def createmeta(self, project_key: str, issue_type: str, refresh: bool = False) -> dict[str, dict]:
+        """Return create-screen field metadata by field ID for a project and issue type name.
+
+        Returns an empty dict if the issue type does not exist in the project.
+        """
+        cache_key = f"{project_key.upper()}/{issue_type.lower()}"
+        with self._lock:
+            self._load_disk()
+            entry = self._createmeta.get(cache_key)
+            if entry is not None and not refresh and not self._expired(entry["fetched_at"]):
+                return entry["fields"]
+
+            transport = get_transport()
+            type_id = next(
+                (t["id"] for t in _paged(transport, f"issue/createmeta/{project_key}/issuetypes", "issueTypes")
+                 if t.get("name", "").lower() == issue_type.lower()),
+                None,
+            )
+            meta = {}
+            if type_id is not None:
+                meta = {
+                    f.get("fieldId") or f.get("key"): f
+                    for f in _paged(transport, f"issue/createmeta/{project_key}/issuetypes/{type_id}", "fields")
+                }
+            logger.info("Loaded createmeta for %s/%s (%d field(s))", project_key, issue_type, len(meta))
+            self._createmeta[cache_key] = {"fetched_at": time.time(), "fields": meta}
+            self._save_disk()
+            return meta
+
+    def creatable_fields(self, project_key: str, issue_type: str) -> set[str]:
+        """IDs of fields that can be set when creating this issue type in this project."""
+        return {
+            field_id for field_id, meta in self.createmeta(project_key, issue_type).items()
+            if "set" in (meta.get("operations") or ["set"])
+        }
+
+    # ---------- Persistence ----------
+
+    def clear(self) -> None:
+        """Forget everything in memory and on disk."""
+        with self._lock:
+            self._fields = None
+            self._failure = None
+            self._by_id, self._by_name, self._createmeta = {}, {}, {}
+            self.path.unlink(missing_ok=True)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "fields": len(self._fields or []),
+                "age": time.time() - self._fetched_at if self._fields is not None else None,
+                "createmeta_entries": len(self._createmeta),
+                "path": str(self.path),
+            }
+
+    def _expired(self, fetched_at: float) -> bool:
+        return time.time() - fetched_at > self.ttl
+
+    def _set_fields(self, fields: list[dict], fetched_at: float) -> None:
+        self._fields = fields
+        self._fetched_at = fetched_at
+        self._by_id = {}
+        self._by_name = {}
+        for field in fields:
+            field["_name_lower"] = field.get("name", "").lower()
+            self._by_id[field["id"]] = field
+            self._by_name.setdefault(field["_name_lower"], []).append(field)
+
+    def _load_disk(self) -> None:
+        if self._loaded_from_disk:
+            return
+        self._loaded_from_disk = True
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable field cache %s: %s", self.path, e)
+            return
+        # The cache belongs to one Jira site
+        if data.get("base_url") != JIRA_BASE_URL:
+            return
+        if data.get("fields") is not None:
+            self._set_fields(data["fields"], data.get("fetched_at", 0.0))
+        self._createmeta = data.get("createmeta", {})
+
+    def _save_disk(self) -> None:
+        data = {
+            "base_url": JIRA_BASE_URL,
+            "fetched_at": self._fetched_at,
+            "fields": [{k: v for k, v in f.items() if k != "_name_lower"} for f in self._fields or []] or None,
+            "createmeta": self._createmeta,
+        }
+        try:
+            fd, tmp = tempfile.mkstemp(dir=self.path.parent, prefix=self.path.name, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f, separators=(",", ":"))
+            os.replace(tmp, self.path)
+        except OSError as e:
+            logger.warning("Could not write field cache %s: %s", self.path, e)
+
+
+def _field_id(token: str) -> str | None:
+    """The ID a token names without a lookup (system or custom field ID, *all, *navigable), else None."""
+    if token in _ALL_FIELDS or _CUSTOM_FIELD_RE.match(token):
+        return token
+    return _SYSTEM_FIELDS.get(token.lower())
+
+
+def _paged(transport, endpoint: str, key: str):
+    """Yield items from a startAt/maxResults paged createmeta endpoint."""
+    start = 0
+    while True:
+        page = transport.get(endpoint, params={"startAt": start, "maxResults": 200})
+        items = page.get(key) or page.get("values") or []
+        yield from items
+        start += len(items)
+        if not items or start >= page.get("total", start):
+            return
+
+
+_registry: FieldRegistry | None = None
+_registry_lock = threading.Lock()
+
+
+def get_field_registry() -> FieldRegistry:
+    """Return the process-wide field registry."""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = FieldRegistry(JIRA_FIELD_CACHE_PATH, JIRA_FIELD_CACHE_TTL)
+    return _registry
@@ -0,0 +1,303 @@
+"""Shared Markdown and JSON formatters for Jira issues returned by the tools.
+
+Every formatter makes a single pass over its input and builds a list that
+is joined (Markdown) or serialized (JSON) once, so output cost is linear in
+the size of the payload.
+"""
+
+import json
+
+from jira_api.adf import adf_to_markdown
+from jira_api.config import JIRA_BASE_URL
+from jira_api.metrics import timed
+
+MARKDOWN = "markdown"
+JSON = "json"
+OUTPUT_FORMATS = (MARKDOWN, JSON)
+
+# Keys tried, in order, to reduce a Jira object (user, status, option...) to one value
+_DISPLAY_KEYS = ("displayName", "name", "value", "key")
+
+
+# ---------- Markdown ----------
+
+
+def _name(value: dict | None, default: str = "") -> str:
+    return value.get("name", default) if value else default
+
+
+def _display_name(value: dict | None, default: str) -> str:
+    return value.get("displayName", default) if value else default
+
+
+def _names(values: list | None) -> str:
+    return ", ".join(v.get("name", "") for v in values or []) or "N/A"
+
+
+# (field ID, label, render) for each line of a search result block
+_SEARCH_LINES = [
+    ("status", "Status", lambda v: _name(v, "Unknown")),
+    ("priority", "Priority", lambda v: _name(v, "None")),
+    ("reporter", "Reporter", lambda v: _display_name(v, "Unknown")),
+    ("assignee", "Assignee", lambda v: _display_name(v, "Unassigned")),
+    ("fixVersions", "Fix Version", _names),
+    ("versions", "Affect Version", _names),
+    ("summary", "Summary", lambda v: v or ""),
+    ("created", "Created", lambda v: (v or "")[:10]),
+    ("updated", "Updated", lambda v: (v or "")[:10]),
+]
+# Fetched for context (e.g. cached workflow transitions) but not shown
+_SEARCH_HIDDEN = {"issuetype", "project"}
+_SEARCH_KNOWN = {field_id for field_id, _, _ in _SEARCH_LINES} | _SEARCH_HIDDEN
+
+
+@timed()
+def format_search_result(index: int, issue: dict, field_names: dict[str, str] | None = None) -> list[str]:
+    """Format one search hit as the lines of a numbered result block.
+
+    Only fields present in the payload are shown; fields outside the
+    standard set are appended under their name from ``field_names``.
+    """
+    fields = issue["fields"]
+    lines = [f"#: {index}", f"{'Key:':<16}{JIRA_BASE_URL}/browse/{issue['key']}"]
+    for field_id, label, render in _SEARCH_LINES:
+        if field_id in fields:
+            lines.append(f"{label + ':':<16}{render(fields[field_id])}")
+    for field_id, value in fields.items():
+        if field_id not in _SEARCH_KNOWN:
+            label = (field_names or {}).get(field_id, field_id)
+            lines.append(f"{label + ':':<16}{_inline_value(value)}")
+    lines.append("")
+    return lines
+
+
+def _inline_value(value) -> str:
+    """Render any field value on one line."""
+    value = simplify_value(value)
+    if value is None or value == "" or value == []:
+        return "N/A"
+    if isinstance(value, list):
+        return ", ".join(str(v) for v in value)
+    if isinstance(value, dict):
+        return to_json(value)
+    return " ".join(str(value).split()) if isinstance(value, str) else str(value)
+
+
+# (field ID, label, render) for the header lines of an issue report
+_ISSUE_HEADER = [
+    ("issuetype", "Type", _name),
+    ("status", "Status", _name),
+    ("priority", "Priority", _name),
+    ("resolution", "Resolution", lambda v: _name(v, "Unresolved")),
+    ("resolutiondate", "Resolution Date", lambda v: v or "N/A"),
+    ("project", "Project", lambda v: f"{_name(v)} ({(v or {}).get('key', '')})"),
+    ("assignee", "Assignee", lambda v: _display_name(v, "Unassigned")),
+    ("reporter", "Reporter", lambda v: _display_name(v, "Unknown")),
+    ("created", "Created", lambda v: (v or "")[:10]),
+    ("updated", "Updated", lambda v: (v or "")[:10]),
+]
+# Fields format_issue renders under its own labels (no field names needed)
+ISSUE_REPORT_FIELDS = {field_id for field_id, _, _ in _ISSUE_HEADER} | {
+    "summary", "labels", "components", "fixVersions", "versions", "customfield_13981", "customfield_12000",
+    "description", "comment", "issuelinks", "attachment",
+}
+
+
+@timed()
+def format_issue(data: dict, field_names: dict[str, str] | None = None) -> str:
+    """Format an issue payload as the Markdown report returned by get_jira_issue.
+
+    Lines and sections are only rendered for fields present in the payload,
+    so a narrower ``fields`` request produces a shorter report. Fields outside
+    the standard report are listed under their name from ``field_names``.
+    """
+    fields = data.get("fields", {})
+    key = data.get("key", "")
+
+    lines = [
+        f"# {key}: {fields.get('summary', '')}",
+        f"**URL:** {JIRA_BASE_URL}/browse/{key}",
+    ]
+    for field_id, label, render in _ISSUE_HEADER:
+        if field_id in fields:
+            lines.append(f"**{label}:** {render(fields[field_id])}")
+
+    labels = fields.get("labels") or []
+    if labels:
+        lines.append(f"**Labels:** {', '.join(labels)}")
+
+    components = fields.get("components") or []
+    if components:
+        lines.append(f"**Components:** {', '.join(c.get('name', '') for c in components)}")
+
+    fix_versions = fields.get("fixVersions") or []
+    if fix_versions:
+        lines.append(f"**Fix Versions:** {', '.join(v.get('name', '') for v in fix_versions)}")
+
+    affect_versions = fields.get("versions") or []
+    if affect_versions:
+        lines.append(f"**Affect Versions:** {', '.join(v.get('name', '') for v in affect_versions)}")
+
+    customer_commitment = fields.get("customfield_13981")
+    if customer_commitment:
+        values = [item.get("value", "") for item in customer_commitment if isinstance(item, dict)]
+        if values:
+            lines.append(f"**Customer Commitment:** {', '.join(values)}")
+
+    for field_id, value in fields.items():
+        if field_id in ISSUE_REPORT_FIELDS or value is None:
+            continue
+        label = (field_names or {}).get(field_id, field_id)
+        if isinstance(value, dict) and value.get("type") == "doc":
+            lines.append(f"\n## {label}\n{adf_to_markdown(value)}")
+        else:
+            lines.append(f"**{label}:** {_inline_value(value)}")
+
+    # Resolution Path (customfield_12000)
+    resolution_path = fields.get("customfield_12000")
+    if resolution_path:
+        resolution_path_text = adf_to_markdown(resolution_path) if isinstance(resolution_path, dict) else str(resolution_path)
+        lines.append(f"\n## Resolution Path\n{resolution_path_text}")
+
+    if "description" in fields:
+        # Convert Atlassian Document Format to Markdown
+        desc = fields["description"]
+        lines.append(f"\n## Description\n{adf_to_markdown(desc) if desc else 'No description'}")
+
+    # Include ALL comments
+    comment_field = fields.get("comment") or {}
+    comments_data = comment_field.get("comments", [])
+    if comments_data:
+        total = max(comment_field.get("total", 0), len(comments_data))
+        shown = "total" if total == len(comments_data) else f"of {total} shown"
+        lines.append(f"\n## Comments ({len(comments_data)} {shown})")
+        for c in comments_data:
+            author = c.get("author", {}).get("displayName", "Unknown")
+            created = c.get("created", "")[:16]
+            body = adf_to_markdown(c.get("body")) if c.get("body") else ""
+            lines.append(f"\n**{author}** ({created}):\n{body}")
+
+    # Include linked issues with summary details
+    issue_links = fields.get("issuelinks") or []
+    if issue_links:
+        lines.append(f"\n## Linked Issues ({len(issue_links)})")
+        for link in issue_links:
+            link_type = link.get("type", {}).get("name", "Related")
+            if "outwardIssue" in link:
+                linked = link["outwardIssue"]
+                direction = link.get("type", {}).get("outward", "relates to")
+            elif "inwardIssue" in link:
+                linked = link["inwardIssue"]
+                direction = link.get("type", {}).get("inward", "relates to")
+            else:
+                continue
+            linked_key = linked.get("key", "")
+            linked_summary = linked.get("fields", {}).get("summary", "")
+            linked_status = linked.get("fields", {}).get("status", {}).get("name", "")
+            linked_type = linked.get("fields", {}).get("issuetype", {}).get("name", "")
+            lines.append(f"- **{linked_key}** ({linked_type} | {linked_status}) — {direction}")
+            lines.append(f"  {linked_summary}")
+
+    # Include attachments
+    attachments = fields.get("attachment") or []
+    if attachments:
+        lines.append(f"\n## Attachments ({len(attachments)})")
+        for att in attachments:
+            att_name = att.get("filename", "unknown")
+            att_size = att.get("size", 0)
+            att_author = att.get("author", {}).get("displayName", "Unknown")
+            att_created = att.get("created", "")[:10]
+            lines.append(f"- **{att_name}** ({att_size} bytes) — uploaded by {att_author} on {att_created}")
+
+    return "\n".join(lines)
+
+
+# ---------- JSON ----------
+
+
+def to_json(data) -> str:
+    """Serialize tool output as compact JSON (no whitespace, UTF-8 kept as-is)."""
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False, default=str)
+
+
+def simplify_value(value):
+    """Reduce a Jira field value to plain data.
+
+    ADF documents become Markdown, objects such as users, statuses and
+    options become their display name, and lists are simplified item by item.
+    """
+    if isinstance(value, dict):
+        if value.get("type") == "doc":
+            return adf_to_markdown(value).strip()
+        for key in _DISPLAY_KEYS:
+            if key in value:
+                return value[key]
+        return value
+    if isinstance(value, list):
+        return [simplify_value(v) for v in value]
+    return value
+
+
+@timed()
+def search_result_data(issue: dict) -> dict:
+    """Compact dict for a search hit, holding only the fields present in the payload."""
+    data = {"key": issue["key"], "url": f"{JIRA_BASE_URL}/browse/{issue['key']}"}
+    for field_id, value in issue.get("fields", {}).items():
+        data[field_id] = simplify_value(value)
+    return data
+
+
+@timed()
+def issue_data(issue: dict) -> dict:
+    """Compact dict for a full issue, holding only the fields present in the payload.
+
+    Comments, links and attachments keep their useful attributes; every
+    other field goes through :func:`simplify_value`.
+    """
+    key = issue.get("key", "")
+    data = {"key": key, "url": f"{JIRA_BASE_URL}/browse/{key}"}
+    for field_id, value in issue.get("fields", {}).items():
+        if field_id == "comment":
+            data["comments"] = [_comment_data(c) for c in (value or {}).get("comments", [])]
+            data["comment_total"] = max((value or {}).get("total", 0), len(data["comments"]))
+        elif field_id == "issuelinks":
+            data["links"] = [link for link in map(_link_data, value or []) if link]
+        elif field_id == "attachment":
+            data["attachments"] = [
+                {
+                    "filename": att.get("filename", ""),
+                    "size": att.get("size", 0),
+                    "author": (att.get("author") or {}).get("displayName"),
+                    "created": att.get("created", ""),
+                }
+                for att in value or []
+            ]
+        else:
+            data[field_id] = simplify_value(value)
+    return data
+
+
+def _comment_data(comment: dict) -> dict:
+    return {
+        "author": (comment.get("author") or {}).get("displayName"),
+        "created": comment.get("created", ""),
+        "body": adf_to_markdown(comment["body"]).strip() if comment.get("body") else "",
+    }
+
+
+def _link_data(link: dict) -> dict | None:
+    link_type = link.get("type", {})
+    if "outwardIssue" in link:
+        linked, direction = link["outwardIssue"], link_type.get("outward", "relates to")
+    elif "inwardIssue" in link:
+        linked, direction = link["inwardIssue"], link_type.get("inward", "relates to")
+    else:
+        return None
+    linked_fields = linked.get("fields", {})
+    return {
+        "key": linked.get("key", ""),
+        "direction": direction,
+        "type": (linked_fields.get("issuetype") or {}).get("name"),
+        "status": (linked_fields.get("status") or {}).get("name"),
+        "summary": linked_fields.get("summary", ""),
+    }
@@ -0,0 +1,115 @@
+"""Issue fetches (single and bulk) backed by an in-process TTL cache."""
+
+import logging
+
+from jira_api.cache import TTLCache
+from jira_api.concurrency import map_concurrent
+from jira_api.config import JIRA_ISSUE_CACHE_SIZE, JIRA_ISSUE_CACHE_TTL
+from jira_api.lazy import lazy_import
+from jira_api.search import iter_issues
+from jira_api.transitions import remember_issue_context
+from jira_api.transport import get_transport
+
+requests = lazy_import("requests")
+
+logger = logging.getLogger(__name__)
+
+# Keys per `key in (...)` JQL request — Jira's page size for full issues
+BULK_BATCH_SIZE = 100
+
+# Keyed by (ISSUE-KEY, fields, expand)
+issue_cache = TTLCache(maxsize=JIRA_ISSUE_CACHE_SIZE, ttl=JIRA_ISSUE_CACHE_TTL)
+
+
+def fetch_issue(issue_key: str, fields: str = "", expand: str = "", use_cache: bool = True) -> dict:
+    """GET ``issue/{key}``, serving repeat requests from the issue cache.
+
+    A fresh cache entry is returned without a request. A stale entry is
+    revalidated with a lightweight ``fields=updated`` GET: if the issue's
+    ``updated`` timestamp is unchanged the cached body is reused, otherwise
+    the issue is refetched. Stale entries without ``updated`` (a narrower
+    ``fields`` list) are refetched directly. Jira does not send ETags on issue resources, so
+    ``updated`` serves as the validator.
+
+    Args:
+        issue_key: The Jira issue key (e.g. 'LAE-123')
+        fields: Comma-separated field list. Empty for all fields
+        expand: Comma-separated expand list. Empty for none
+        use_cache: Set False to bypass the cache (the fresh result is still stored)
+    """
+    cache_key = (issue_key.upper(), fields, expand)
+    params = {k: v for k, v in (("fields", fields), ("expand", expand)) if v}
+    transport = get_transport()
+
+    if use_cache:
+        cached = issue_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        stale = issue_cache.get_stale(cache_key)
+        # Without ``updated`` in the cached body there is nothing to compare: refetch directly
+        cached_updated = (stale or {}).get("fields", {}).get("updated")
+        if cached_updated:
+            current = transport.get(f"issue/{issue_key}", params={"fields": "updated"})
+            if current.get("fields", {}).get("updated") == cached_updated:
+                issue_cache.touch(cache_key)
+                return stale
+
+    data = transport.get(f"issue/{issue_key}", params=params or None)
+    issue_cache.set(cache_key, data)
+    remember_issue_context(data)
+    return data
+
+
+def invalidate_issue(*issue_keys: str) -> None:
+    """Drop every cached response for the given issue keys (after a write)."""
+    keys = {k.upper() for k in issue_keys if k}
+    dropped = issue_cache.invalidate(lambda cache_key: cache_key[0] in keys)
+    if dropped:
+        logger.debug("Invalidated %d cached response(s) for %s", dropped, ", ".join(sorted(keys)))
+
+
+def fetch_issues(issue_keys: list[str], fields: str = "", max_workers: int | None = None) -> dict[str, dict]:
+    """Fetch many issues in ``key in (...)`` JQL batches of 100, run concurrently.
+
+    Fetched issues are stored in the issue cache under the same key that
+    :func:`fetch_issue` uses for ``fields``, so later single-issue reads hit.
+    A batch rejected with 400 (JQL fails outright when one key does not
+    exist) is retried key by key, skipping keys that return 404.
+
+    Args:
+        issue_keys: Issue keys; duplicates are fetched once
+        fields: Comma-separated field list. Empty for Jira's navigable fields
+        max_workers: Concurrent batch requests (default JIRA_MAX_WORKERS)
+
+    Returns:
+        Issues by key. Keys that were not found are absent.
+    """
+    keys = list(dict.fromkeys(k.strip().upper() for k in issue_keys if k.strip()))
+    batches = [keys[i:i + BULK_BATCH_SIZE] for i in range(0, len(keys), BULK_BATCH_SIZE)]
+    field_list = fields.split(",") if fields else None
+
+    def fetch_batch(batch: list[str]) -> list[dict]:
+        try:
+            return list(iter_issues(f"key in ({', '.join(batch)})", field_list, page_size=BULK_BATCH_SIZE))
+        except requests.HTTPError as e:
+            if e.response is None or e.response.status_code != 400:
+                raise
+        logger.info("Bulk fetch of %d key(s) rejected; falling back to single fetches", len(batch))
+        found = []
+        for key in batch:
+            try:
+                found.append(fetch_issue(key, fields))
+            except requests.HTTPError as e:
+                if e.response is None or e.response.status_code != 404:
+                    raise
+        return found
+
+    issues: dict[str, dict] = {}
+    for batch_issues, error in map_concurrent(fetch_batch, batches, max_workers=max_workers):
+        if error is not None:
+            raise error
+        for issue in batch_issues:
+            issues[issue["key"]] = issue
+            issue_cache.set((issue["key"].upper(), fields, ""), issue)
+            remember_issue_context(issue)
+    return issues
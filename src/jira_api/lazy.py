@@ -0,0 +1,26 @@
+"""Deferred imports of heavy dependencies, to keep server startup fast."""
+
+import importlib
+import sys
+import types
+
+
+class LazyModule(types.ModuleType):
+    """Stands in for a module until one of its attributes is first used.
+
+    The real import then happens once (guarded by the import system's
+    lock, so concurrent first uses are safe) and its namespace is copied
+    in, so later attribute lookups cost the same as on the real module.
+    Module-level code must not touch the module (including annotations
+    evaluated at definition time, which should be quoted).
+    """
+
+    def __getattr__(self, attr: str):
+        module = importlib.import_module(self.__name__)
+        self.__dict__.update(vars(module))
+        return getattr(module, attr)
+
+
+def lazy_import(name: str) -> types.ModuleType:
+    """Return ``name`` if it is already imported, else a :class:`LazyModule` for it."""
+    return sys.modules.get(name) or LazyModule(name)
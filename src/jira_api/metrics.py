@@ -0,0 +1,284 @@
+"""In-process latency histograms and counters for tools, Jira requests and formatters."""
+
+import atexit
+import functools
+import json
+import logging
+import re
+import threading
+import time
+from bisect import bisect_left
+from pathlib import Path
+
+from jira_api.config import JIRA_METRICS_DUMP_INTERVAL, JIRA_METRICS_FILE, JIRA_SLOW_CALL_SECONDS
+
+logger = logging.getLogger(__name__)
+
+# Histogram bucket upper bounds in seconds (Prometheus defaults plus 30s)
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# Endpoint path segments replaced by placeholders, so per-endpoint series stay few
+_ISSUE_KEY_RE = re.compile(r"\b[A-Z][A-Z0-9_]+-\d+\b")
+_NUMERIC_ID_RE = re.compile(r"(?<=/)\d+(?=/|$)")
+
+
+class Histogram:
+    """Counts of observations per latency bucket, plus their sum and maximum."""
+
+    __slots__ = ("counts", "count", "total", "max")
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self.counts[bisect_left(BUCKETS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def quantile(self, q: float) -> float:
+        """Estimate a quantile by interpolating within its bucket."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            if n and seen + n >= rank:
+                lower = BUCKETS[i - 1] if i else 0.0
+                upper = BUCKETS[i] if i < len(BUCKETS) else self.max
+                return min(self.max, lower + (upper - lower) * (rank - seen) / n)
+            seen += n
+        return self.max
+
+    def snapshot(self) -> dict:
+        return {
+            "count": self.count,
+            "sum": self.total,
+            "max": self.max,
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "p99": self.quantile(0.99),
+            "buckets": list(self.counts),
+        }
+
+
+class Metrics:
+    """Thread-safe registry of timings and counters for the server.
+
+    Three kinds of call are timed: MCP ``tool`` invocations, Jira HTTP
+    ``request`` attempts (per method and endpoint, with status codes and
+    byte counts) and ``format`` calls. Calls slower than
+    JIRA_SLOW_CALL_SECONDS are logged as warnings and counted.
+    """
+
+    def __init__(self, slow_seconds: float = 2.0):
+        self.slow_seconds = slow_seconds
+        self.started = time.time()
+        self._lock = threading.Lock()
+        self._histograms: dict[tuple[str, tuple], Histogram] = {}
+        self._counters: dict[tuple[str, tuple], float] = {}
+
+    def observe(self, kind: str, labels: tuple, seconds: float) -> None:
+        """Record one timed call; ``labels`` identify the series (e.g. ``("get_jira_issue",)``)."""
+        with self._lock:
+            histogram = self._histograms.get((kind, labels))
+            if histogram is None:
+                histogram = self._histograms[(kind, labels)] = Histogram()
+            histogram.observe(seconds)
+        if self.slow_seconds and seconds >= self.slow_seconds:
+            self.increment("slow_calls", (kind,))
+            logger.warning("Slow %s %s: %.2fs", kind, " ".join(labels), seconds)
+
+    def increment(self, name: str, labels: tuple = (), amount: float = 1) -> None:
+        with self._lock:
+            self._counters[(name, labels)] = self._counters.get((name, labels), 0) + amount
+
+    def observe_request(
+        self,
+        method: str,
+        endpoint: str,
+        status: int | None,
+        seconds: float,
+        bytes_sent: int = 0,
+        bytes_received: int = 0,
+    ) -> None:
+        """Record one HTTP attempt; ``status`` is None when no response arrived."""
+        labels = (method, endpoint_template(endpoint))
+        self.observe("request", labels, seconds)
+        self.increment("responses", labels + (str(status) if status else "error",))
+        if bytes_sent:
+            self.increment("bytes_sent", labels, bytes_sent)
+        if bytes_received:
+            self.increment("bytes_received", labels, bytes_received)
+
+    def time_tool(self, name: str, func):
+        """Wrap an async tool so each call is timed and its outcome counted."""
+        @functools.wraps(func)
+        async def timed(*args, **kwargs):
+            start = time.perf_counter()
+            outcome = "exception"
+            try:
+                result = await func(*args, **kwargs)
+                outcome = "error" if isinstance(result, str) and result.startswith(_ERROR_PREFIXES) else "ok"
+                return result
+            finally:
+                self.observe("tool", (name,), time.perf_counter() - start)
+                self.increment("tool_calls", (name, outcome))
+        return timed
+
+    def snapshot(self) -> dict:
+        """All series as plain data, grouped by kind."""
+        with self._lock:
+            histograms = {key: h.snapshot() for key, h in self._histograms.items()}
+            counters = dict(self._counters)
+        data: dict = {"uptime_seconds": time.time() - self.started, "timings": {}, "counters": {}}
+        for (kind, labels), snap in sorted(histograms.items()):
+            data["timings"].setdefault(kind, {})[" ".join(labels)] = snap
+        for (name, labels), value in sorted(counters.items()):
+            data["counters"].setdefault(name, {})[" ".join(labels)] = value
+        return data
+
+    def reset(self) -> None:
+        with self._lock:
+            self._histograms.clear()
+            self._counters.clear()
+            self.started = time.time()
+
+    def to_prometheus(self, gauges: dict[str, dict[str, float]] | None = None) -> str:
+        """Render every series in the Prometheus text exposition format.
+
+        Args:
+            gauges: Extra point-in-time values as ``{metric: {label value: number}}``
+                (e.g. cache hit rates), exported as ``jira_mcp_<metric>{name="..."}``
+        """
+        with self._lock:
+            histograms = sorted((key, h.snapshot()) for key, h in self._histograms.items())
+            counters = sorted(self._counters.items())
+        lines = []
+        for kind in sorted({kind for (kind, _), _ in histograms}):
+            metric = f"jira_mcp_{kind}_duration_seconds"
+            lines.append(f"# TYPE {metric} histogram")
+            for (k, labels), snap in histograms:
+                if k != kind:
+                    continue
+                base = _label_pairs(_LABEL_NAMES[kind], labels)
+                cumulative = 0
+                for bound, n in zip((*BUCKETS, "+Inf"), snap["buckets"]):
+                    cumulative += n
+                    le = bound if bound == "+Inf" else f"{bound:g}"
+                    lines.append(f'{metric}_bucket{{{base},le="{le}"}} {cumulative}')
+                lines.append(f"{metric}_sum{{{base}}} {snap['sum']:.6f}")
+                lines.append(f"{metric}_count{{{base}}} {snap['count']}")
+        for name in sorted({name for (name, _), _ in counters}):
+            metric = f"jira_mcp_{name}_total"
+            lines.append(f"# TYPE {metric} counter")
+            for (n, labels), value in counters:
+                if n == name:
+                    lines.append(f"{metric}{{{_label_pairs(_LABEL_NAMES[name], labels)}}} {value:g}")
+        for name, values in sorted((gauges or {}).items()):
+            metric = f"jira_mcp_{name}"
+            lines.append(f"# TYPE {metric} gauge")
+            for label, value in sorted(values.items()):
+                lines.append(f'{metric}{{name="{_escape(label)}"}} {value:g}')
+        lines.append("# TYPE jira_mcp_uptime_seconds gauge")
+        lines.append(f"jira_mcp_uptime_seconds {time.time() - self.started:.0f}")
+        return "\n".join(lines) + "\n"
+
+    def dump(self, path: Path, gauges: dict[str, dict[str, float]] | None = None) -> None:
+        """Atomically write the metrics to ``path``: Prometheus text for .prom/.txt, otherwise JSON."""
+        from jira_api.export import atomic_writer
+
+        path = Path(path)
+        if path.suffix in (".prom", ".txt"):
+            content = self.to_prometheus(gauges)
+        else:
+            content = json.dumps({**self.snapshot(), "gauges": gauges or {}}, indent=2)
+        with atomic_writer(path) as f:
+            f.write(content)
+
+
+# Tool results that report a failure rather than raising
+_ERROR_PREFIXES = ("Error", "Jira API error", "Connection error")
+
+_LABEL_NAMES = {
+    "tool": ("tool",),
+    "request": ("method", "endpoint"),
+    "format": ("formatter",),
+    "responses": ("method", "endpoint", "status"),
+    "bytes_sent": ("method", "endpoint"),
+    "bytes_received": ("method", "endpoint"),
+    "tool_calls": ("tool", "outcome"),
+    "slow_calls": ("kind",),
+}
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _label_pairs(names: tuple, values: tuple) -> str:
+    return ",".join(f'{n}="{_escape(v)}"' for n, v in zip(names, values))
+
+
+def endpoint_template(endpoint: str) -> str:
+    """Replace issue keys and numeric IDs in a REST path (``issue/LAE-1/worklog`` -> ``issue/{key}/worklog``)."""
+    return _NUMERIC_ID_RE.sub("{id}", _ISSUE_KEY_RE.sub("{key}", endpoint))
+
+
+def timed(kind: str = "format"):
+    """Decorator recording each call's duration under ``kind`` and the function name."""
+    def decorate(func):
+        labels = (func.__name__,)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                metrics.observe(kind, labels, time.perf_counter() - start)
+        return wrapper
+    return decorate
+
+
+metrics = Metrics(JIRA_SLOW_CALL_SECONDS)
+
+# Extra gauges (e.g. cache statistics) included in the periodic dump file
+_gauge_source = None
+_dump_thread: threading.Thread | None = None
+_dump_lock = threading.Lock()
+
+
+def start_metrics_dump(gauge_source=None) -> None:
+    """Write JIRA_METRICS_FILE every JIRA_METRICS_DUMP_INTERVAL seconds and at exit, if configured.
+
+    Args:
+        gauge_source: Optional callable returning extra gauges for each dump
+    """
+    global _dump_thread, _gauge_source
+    if not JIRA_METRICS_FILE:
+        return
+    with _dump_lock:
+        _gauge_source = gauge_source
+        if _dump_thread is not None:
+            return
+        _dump_thread = threading.Thread(target=_dump_loop, name="metrics-dump", daemon=True)
+        _dump_thread.start()
+        atexit.register(_dump_once)
+    logger.info("Writing metrics to %s every %gs", JIRA_METRICS_FILE, JIRA_METRICS_DUMP_INTERVAL)
+
+
+def _dump_loop() -> None:
+    while True:
+        time.sleep(JIRA_METRICS_DUMP_INTERVAL)
+        _dump_once()
+
+
+def _dump_once() -> None:
+    try:
+        metrics.dump(JIRA_METRICS_FILE, _gauge_source() if _gauge_source else None)
+    except Exception:
+        logger.exception("Could not write metrics to %s", JIRA_METRICS_FILE)
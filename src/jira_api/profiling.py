@@ -0,0 +1,175 @@
+"""Startup profiling for the MCP server: import-time breakdown and measured cold starts."""
+
+import json
+import os
+import queue
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+from jira_api.config import JIRA_STARTUP_BUDGET_MS
+
+SERVER_MODULE = "jira_mcp_server"
+_SRC_DIR = Path(__file__).parent.parent
+
+# Loaded on first use only; seeing one of these at startup is a regression
+DEFERRED_MODULES = ("requests", "urllib3", "sqlite3", "playwright", "cryptography", "automation")
+
+
+def import_times(module: str = SERVER_MODULE) -> list[tuple[str, int, int]]:
+    """Import ``module`` in a fresh interpreter under ``-X importtime``.
+
+    Returns:
+        (module name, self µs, cumulative µs) for every module imported, in import order
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=_SRC_DIR, env=_quiet_env(), capture_output=True, text=True, timeout=120,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed: {proc.stderr.strip().splitlines()[-1:]}")
+    entries = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        entries.append((name.strip(), int(self_us), int(cumulative_us)))
+    return entries
+
+
+def package_times(entries: list[tuple[str, int, int]]) -> list[tuple[str, int]]:
+    """Total self time (µs) per top-level package, slowest first."""
+    totals: dict[str, int] = {}
+    for name, self_us, _ in entries:
+        top = name.split(".")[0]
+        totals[top] = totals.get(top, 0) + self_us
+    return sorted(totals.items(), key=lambda item: item[1], reverse=True)
+
+
+def measure_cold_start(timeout: float = 30.0) -> dict:
+    """Start the server over stdio like an MCP client would and time the handshake.
+
+    Returns:
+        ``initialize_ms`` (process start until the initialize response, i.e.
+        until the server is usable), ``tools_list_ms`` (until the tools/list
+        response) and ``tools`` (number of tools listed)
+    """
+    from mcp.types import LATEST_PROTOCOL_VERSION
+
+    started = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, f"{SERVER_MODULE}.py"],
+        cwd=_SRC_DIR, env=_quiet_env(), text=True,
+        stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+    )
+    # Read stdout on a thread so every wait can time out
+    lines: queue.Queue = queue.Queue()
+
+    def read() -> None:
+        for line in proc.stdout:
+            lines.put(line)
+        lines.put(None)
+
+    threading.Thread(target=read, daemon=True).start()
+
+    def send(message: dict) -> None:
+        proc.stdin.write(json.dumps(message) + "\n")
+        proc.stdin.flush()
+
+    def response(request_id: int) -> dict:
+        deadline = started + timeout
+        while True:
+            try:
+                line = lines.get(timeout=max(0.0, deadline - time.perf_counter()))
+            except queue.Empty:
+                raise TimeoutError(f"No response from the server within {timeout:g}s") from None
+            if line is None:
+                raise RuntimeError(f"Server exited during startup (exit code {proc.wait()})")
+            message = json.loads(line)
+            if message.get("id") == request_id:
+                return message
+
+    try:
+        send({
+            "jsonrpc": "2.0", "id": 1, "method": "initialize",
+            "params": {
+                "protocolVersion": LATEST_PROTOCOL_VERSION,
+                "capabilities": {},
+                "clientInfo": {"name": "profile-startup", "version": "1"},
+            },
+        })
+        response(1)
+        initialized = time.perf_counter()
+        send({"jsonrpc": "2.0", "method": "notifications/initialized"})
+        send({"jsonrpc": "2.0", "id": 2, "method": "tools/list"})
+        tools = response(2).get("result", {}).get("tools", [])
+        listed = time.perf_counter()
+    finally:
+        proc.stdin.close()
+        try:
+            proc.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+    return {
+        "initialize_ms": round((initialized - started) * 1000),
+        "tools_list_ms": round((listed - started) * 1000),
+        "tools": len(tools),
+    }
+
+
+def profile_startup(budget_ms: float = JIRA_STARTUP_BUDGET_MS, runs: int = 3, top: int = 10) -> tuple[str, bool]:
+    """Measure cold starts and break import time down by package.
+
+    Args:
+        budget_ms: Maximum median time until the initialize response (0 disables the check)
+        runs: Number of cold starts to measure
+        top: Number of packages and modules to list
+
+    Returns:
+        The report as markdown, and whether startup is within budget
+    """
+    starts = [measure_cold_start() for _ in range(max(1, runs))]
+    entries = import_times()
+    total_us = next((cumulative for name, _, cumulative in entries if name == SERVER_MODULE), 0)
+    median_ms = statistics.median(s["initialize_ms"] for s in starts)
+    within_budget = not budget_ms or median_ms <= budget_ms
+
+    lines = [
+        "# Server startup profile",
+        "",
+        f"**Cold start (until initialize response):** median {median_ms:.0f}ms over {len(starts)} run(s) "
+        f"({', '.join(str(s['initialize_ms']) for s in starts)}ms)",
+        f"**Until tools/list:** median {statistics.median(s['tools_list_ms'] for s in starts):.0f}ms "
+        f"({starts[0]['tools']} tools)",
+    ]
+    if budget_ms:
+        verdict = "within budget" if within_budget else "OVER BUDGET"
+        lines.append(f"**Budget:** {budget_ms:.0f}ms (JIRA_STARTUP_BUDGET_MS) — {verdict}")
+    lines += [
+        f"**Import of {SERVER_MODULE}:** {total_us / 1000:.0f}ms, {len(entries)} modules",
+        "",
+        "## Import time by package (self)",
+        "",
+        "| Package | ms | Share |",
+        "|---------|----|-------|",
+    ]
+    for package, self_us in package_times(entries)[:top]:
+        share = f"{self_us / total_us:.0%}" if total_us else "-"
+        lines.append(f"| {package} | {self_us / 1000:.1f} | {share} |")
+
+    lines += ["", "## Slowest modules (self)", "", "| Module | Self ms | Cumulative ms |", "|--------|---------|---------------|"]
+    for name, self_us, cumulative_us in sorted(entries, key=lambda e: e[1], reverse=True)[:top]:
+        lines.append(f"| {name} | {self_us / 1000:.1f} | {cumulative_us / 1000:.1f} |")
+
+    eager = sorted({name.split(".")[0] for name, _, _ in entries} & set(DEFERRED_MODULES))
+    if eager:
+        lines += ["", f"**Warning:** imported at startup although only needed on first use: {', '.join(eager)}"]
+    return "\n".join(lines), within_budget
+
+
+def _quiet_env() -> dict:
+    # No metrics file from profiling runs (.env does not override set variables)
+    return {**os.environ, "JIRA_METRICS_FILE": ""}
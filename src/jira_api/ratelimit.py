@@ -0,0 +1,248 @@
+"""Adaptive token-bucket rate limiting and retry scheduling for Jira requests."""
+
+import asyncio
+import logging
+import random
+import threading
+import time
+
+from jira_api.config import (
+    JIRA_MAX_RETRIES,
+    JIRA_MAX_RETRY_AFTER,
+    JIRA_RATE_BURST,
+    JIRA_RATE_LIMIT,
+    JIRA_RETRY_BACKOFF,
+)
+from jira_api.lazy import lazy_import
+
+requests = lazy_import("requests")
+
+logger = logging.getLogger(__name__)
+
+# Methods that can be repeated without changing the result
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+# POST endpoints that only read (JQL search, bulk worklog/issue reads)
+READ_ONLY_POSTS = {"search/jql", "search", "worklog/list", "issue/bulkfetch", "jql/parse"}
+# Transient server responses worth retrying for idempotent calls
+RETRYABLE_STATUSES = {429, 502, 503, 504}
+
+
+class TokenBucket:
+    """A thread-safe token bucket whose rate adapts to Jira's 429 responses.
+
+    ``acquire`` blocks until a token is available. When Jira throttles a
+    request, :meth:`throttle` empties the bucket until the ``Retry-After``
+    deadline and halves the refill rate; each later success restores a
+    little of it (additive increase, multiplicative decrease), so sustained
+    throughput settles just under the limit Jira actually enforces.
+    A rate of 0 disables limiting.
+    """
+
+    def __init__(self, rate: float, burst: int):
+        self.max_rate = rate
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Take one token, sleeping as needed; return the seconds waited."""
+        waited = 0.0
+        while delay := self._reserve():
+            time.sleep(delay)
+            waited += delay
+        return waited
+
+    async def acquire_async(self) -> float:
+        """Like :meth:`acquire`, but waits without blocking the event loop."""
+        waited = 0.0
+        while delay := self._reserve():
+            await asyncio.sleep(delay)
+            waited += delay
+        return waited
+
+    def _reserve(self) -> float:
+        """Take a token and return 0, or return how long to wait before trying again."""
+        if not self.max_rate:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            if now < self._paused_until:
+                return self._paused_until - now
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+            return (1 - self._tokens) / self.rate
+
+    def throttle(self, delay: float) -> None:
+        """Pause every caller for ``delay`` seconds and halve the refill rate."""
+        if not self.max_rate:
+            return
+        with self._lock:
+            now = time.monotonic()
+            self._paused_until = max(self._paused_until, now + delay)
+            self._tokens = 0.0
+            self._updated = self._paused_until
+            self.rate = max(self.max_rate / 16, self.rate / 2)
+
+    def succeed(self) -> None:
+        """Recover part of the refill rate after a successful request."""
+        if self.rate < self.max_rate:
+            with self._lock:
+                self.rate = min(self.max_rate, self.rate + self.max_rate / 50)
+
+
+class RetryScheduler:
+    """Rate-limits and retries Jira requests, counting what happened.
+
+    Every request waits for a token first. A 429 is always retried, because
+    Jira rejected it without acting on it. Other transient failures
+    (502/503/504, connection errors, timeouts) are retried only for
+    idempotent calls. The wait is the ``Retry-After`` header when present
+    (capped at JIRA_MAX_RETRY_AFTER), otherwise exponential backoff with
+    full jitter.
+    """
+
+    def __init__(self, bucket: TokenBucket, max_retries: int = 4, backoff: float = 1.0):
+        self.bucket = bucket
+        self.max_retries = max(0, max_retries)
+        self.backoff = backoff
+        self._lock = threading.Lock()
+        self._counters = {"throttled": 0, "retried": 0, "failed": 0}
+        self._wait_seconds = 0.0
+
+    def run(self, send, method: str, endpoint: str) -> "requests.Response":
+        """Call ``send()`` until it returns a successful response or retries run out.
+
+        ``send`` returns a response exposing ``status_code`` and ``headers``
+        and raises :mod:`requests` exceptions for connection failures.
+
+        Raises:
+            requests.HTTPError: The final response was an error status
+            requests.RequestException: The final attempt failed to connect
+        """
+        idempotent = is_idempotent(method, endpoint)
+        attempt = 0
+        while True:
+            self._add_wait(self.bucket.acquire())
+            try:
+                resp = send()
+                _raise_for_status(resp)
+            except requests.RequestException as e:
+                delay = self._retry_delay(e, attempt, idempotent)
+                if delay is None:
+                    raise
+            else:
+                self.bucket.succeed()
+                return resp
+            attempt += 1
+            self._log_retry(method, endpoint, delay, attempt)
+            time.sleep(delay)
+            self._add_wait(delay)
+
+    async def run_async(self, send, method: str, endpoint: str):
+        """Async counterpart of :meth:`run`; ``send`` is a coroutine function."""
+        idempotent = is_idempotent(method, endpoint)
+        attempt = 0
+        while True:
+            self._add_wait(await self.bucket.acquire_async())
+            try:
+                resp = await send()
+                _raise_for_status(resp)
+            except requests.RequestException as e:
+                delay = self._retry_delay(e, attempt, idempotent)
+                if delay is None:
+                    raise
+            else:
+                self.bucket.succeed()
+                return resp
+            attempt += 1
+            self._log_retry(method, endpoint, delay, attempt)
+            await asyncio.sleep(delay)
+            self._add_wait(delay)
+
+    def _retry_delay(self, error: "requests.RequestException", attempt: int, idempotent: bool) -> float | None:
+        """Count a failed attempt; return how long to wait before retrying, or None to give up."""
+        if isinstance(error, requests.HTTPError):
+            status = error.response.status_code if error.response is not None else None
+            if status == 429:
+                self._count("throttled")
+            retryable = status == 429 or (idempotent and status in RETRYABLE_STATUSES)
+        else:
+            status = None
+            retryable = idempotent and isinstance(error, (requests.ConnectionError, requests.Timeout))
+        if not retryable or attempt >= self.max_retries:
+            self._count("failed")
+            return None
+        delay = self._delay(attempt, error.response if status else None)
+        if status == 429:
+            self.bucket.throttle(delay)
+        self._count("retried")
+        return delay
+
+    def _log_retry(self, method: str, endpoint: str, delay: float, attempt: int) -> None:
+        logger.info("Retrying %s %s in %.1fs (retry %d/%d)", method, endpoint, delay, attempt, self.max_retries)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                **self._counters,
+                "wait_seconds": self._wait_seconds,
+                "rate_limit": self.bucket.max_rate,
+                "current_rate": self.bucket.rate,
+                "burst": self.bucket.burst,
+                "max_retries": self.max_retries,
+            }
+
+    def _delay(self, attempt: int, resp: "requests.Response | None") -> float:
+        backoff = random.uniform(0, self.backoff * 2 ** attempt)
+        if resp is None or "Retry-After" not in resp.headers:
+            return min(backoff, JIRA_MAX_RETRY_AFTER)
+        try:
+            delay = float(resp.headers["Retry-After"])
+        except ValueError:
+            delay = backoff
+        return max(0.0, min(delay, JIRA_MAX_RETRY_AFTER))
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._counters[name] += 1
+
+    def _add_wait(self, seconds: float) -> None:
+        if seconds:
+            with self._lock:
+                self._wait_seconds += seconds
+
+
+def is_idempotent(method: str, endpoint: str) -> bool:
+    """True if repeating the call cannot create or change anything twice."""
+    method = method.upper()
+    return method in IDEMPOTENT_METHODS or (method == "POST" and endpoint in READ_ONLY_POSTS)
+
+
+def _raise_for_status(resp) -> None:
+    """Raise requests.HTTPError for a 4xx/5xx response (requests or httpx)."""
+    if resp.status_code >= 400:
+        raise requests.HTTPError(f"{resp.status_code} Error for url: {resp.url}", response=resp)
+
+
+_scheduler: RetryScheduler | None = None
+_scheduler_lock = threading.Lock()
+
+
+def get_scheduler() -> RetryScheduler:
+    """Return the process-wide scheduler shared by the sync and async transports."""
+    global _scheduler
+    if _scheduler is None:
+        with _scheduler_lock:
+            if _scheduler is None:
+                _scheduler = RetryScheduler(
+                    TokenBucket(JIRA_RATE_LIMIT, JIRA_RATE_BURST),
+                    max_retries=JIRA_MAX_RETRIES,
+                    backoff=JIRA_RETRY_BACKOFF,
+                )
+    return _scheduler
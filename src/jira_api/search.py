@@ -0,0 +1,71 @@
+"""Paginated JQL search over the search/jql endpoint."""
+
+import logging
+from collections.abc import Iterator
+
+from jira_api.transport import get_transport
+
+logger = logging.getLogger(__name__)
+
+# Jira returns at most 100 issues per page when fields are requested,
+# and up to 5000 when only IDs/keys are requested.
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 5000
+
+
+def iter_issue_pages(
+    jql: str,
+    fields: list[str] | None = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    limit: int | None = None,
+    expand: str = "",
+) -> Iterator[list[dict]]:
+    """Yield search results one page at a time, following ``nextPageToken``.
+
+    Only one page is held in memory at a time, so arbitrarily large JQL
+    result sets can be streamed.
+
+    Args:
+        jql: JQL query string
+        fields: Fields to return for each issue (default: Jira's navigable fields)
+        page_size: Issues requested per page (capped at 5000; Jira may return fewer)
+        limit: Hard cap on the total number of issues yielded. None for no cap
+        expand: Optional comma-separated expand parameter (e.g. 'renderedFields')
+    """
+    page_size = max(1, min(page_size, MAX_PAGE_SIZE))
+    transport = get_transport()
+    token = None
+    yielded = 0
+    while limit is None or yielded < limit:
+        payload: dict = {"jql": jql, "maxResults": page_size if limit is None else min(page_size, limit - yielded)}
+        if fields is not None:
+            payload["fields"] = fields
+        if expand:
+            payload["expand"] = expand
+        if token:
+            payload["nextPageToken"] = token
+
+        data = transport.post("search/jql", payload)
+        issues = data.get("issues", [])
+        if limit is not None:
+            issues = issues[:limit - yielded]
+        if issues:
+            yielded += len(issues)
+            yield issues
+
+        token = data.get("nextPageToken")
+        if not token or data.get("isLast", False) or not issues:
+            break
+    logger.debug("JQL search yielded %d issue(s): %s", yielded, jql)
+
+
+def iter_issues(
+    jql: str,
+    fields: list[str] | None = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    limit: int | None = None,
+    expand: str = "",
+) -> Iterator[dict]:
+    """Yield individual issues from :func:`iter_issue_pages`."""
+    for page in iter_issue_pages(jql, fields, page_size=page_size, limit=limit, expand=expand):
+        yield from page
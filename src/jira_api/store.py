@@ -0,0 +1,368 @@
+"""Local SQLite mirror of Jira issues with incremental sync."""
+
+import json
+import logging
+import math
+import re
+import threading
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from jira_api.comments import fetch_comments
+from jira_api.concurrency import map_concurrent
+from jira_api.config import JIRA_STORE_PATH
+from jira_api.lazy import lazy_import
+from jira_api.search import iter_issue_pages
+from jira_api.worklogs import fetch_issue_worklogs
+
+sqlite3 = lazy_import("sqlite3")
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS issues (
+    key TEXT PRIMARY KEY,
+    id TEXT,
+    project TEXT,
+    summary TEXT,
+    status TEXT,
+    priority TEXT,
+    issuetype TEXT,
+    assignee TEXT,
+    reporter TEXT,
+    created TEXT,
+    updated TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS issues_project ON issues (project, updated);
+CREATE TABLE IF NOT EXISTS comments (
+    id TEXT PRIMARY KEY,
+    issue_key TEXT NOT NULL,
+    author TEXT,
+    created TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS comments_issue ON comments (issue_key, created);
+CREATE TABLE IF NOT EXISTS worklogs (
+    id TEXT PRIMARY KEY,
+    issue_key TEXT NOT NULL,
+    author TEXT,
+    started TEXT,
+    time_spent_seconds INTEGER,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS worklogs_issue ON worklogs (issue_key);
+CREATE INDEX IF NOT EXISTS worklogs_started ON worklogs (started);
+CREATE TABLE IF NOT EXISTS links (
+    issue_key TEXT NOT NULL,
+    link_id TEXT NOT NULL,
+    link_type TEXT,
+    direction TEXT,
+    other_key TEXT,
+    PRIMARY KEY (issue_key, link_id)
+);
+CREATE TABLE IF NOT EXISTS sync_state (
+    project TEXT PRIMARY KEY,
+    last_sync TEXT NOT NULL,
+    issue_count INTEGER NOT NULL
+);
+"""
+
+# JQL field name -> issues column, for the offline query subset
+_QUERY_COLUMNS = {
+    "project": "project",
+    "key": "key",
+    "issuekey": "key",
+    "status": "status",
+    "priority": "priority",
+    "issuetype": "issuetype",
+    "type": "issuetype",
+    "assignee": "assignee",
+    "reporter": "reporter",
+    "summary": "summary",
+    "text": "summary",
+    "created": "created",
+    "updated": "updated",
+}
+_CLAUSE_RE = re.compile(
+    r"^\s*(?P<field>\w+)\s*(?P<op>!=|=|~|>=|<=|>|<|not\s+in|in)\s*(?P<value>.+?)\s*$",
+    re.IGNORECASE,
+)
+_ORDER_RE = re.compile(r"\s+ORDER\s+BY\s+(?P<field>\w+)(?:\s+(?P<dir>ASC|DESC))?\s*$", re.IGNORECASE)
+# Columns holding Jira timestamps (2024-05-01T09:30:00.000+0200)
+_DATE_COLUMNS = {"created", "updated"}
+_ABSOLUTE_DATE_RE = re.compile(r"^(\d{4})[-/](\d{2})[-/](\d{2})(?:\s+(\d{2}):(\d{2}))?$")
+_RELATIVE_DATE_RE = re.compile(r"^([-+]?)(\d+)([wdhm])$")
+_RELATIVE_UNITS = {"w": "weeks", "d": "days", "h": "hours", "m": "minutes"}
+
+
+class IssueStore:
+    """A SQLite file mirroring issues, comments, worklogs and links.
+
+    Each issue row keeps the raw REST payload (``{"key", "fields", ...}``) so
+    it can be rendered exactly like a live response, plus indexed columns for
+    the offline JQL subset supported by :meth:`search`.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+
+    # ---------- Sync ----------
+
+    def sync_project(self, project: str, full: bool = False, max_workers: int | None = None) -> int:
+        """Pull issues of ``project`` updated since its last sync; return how many were stored.
+
+        The incremental window uses a relative JQL duration (``updated >= -Nm``)
+        so it is independent of the Jira user's timezone. Overlap with the
+        previous sync is harmless because rows are upserted.
+        """
+        started_at = datetime.now(timezone.utc)
+        last_sync = None if full else self.last_sync(project)
+        jql = f"project = {project}"
+        if last_sync:
+            minutes = math.ceil((started_at - last_sync).total_seconds() / 60) + 1
+            jql += f" AND updated >= -{minutes}m"
+        jql += " ORDER BY updated ASC"
+
+        count = 0
+        for page in iter_issue_pages(jql, ["*all"], page_size=100):
+            self._complete_truncated(page, max_workers)
+            with self._lock, self._conn:
+                for issue in page:
+                    self._upsert_issue(issue)
+            count += len(page)
+
+        with self._lock, self._conn:
+            total = self._conn.execute("SELECT COUNT(*) FROM issues WHERE project = ?", (project,)).fetchone()[0]
+            self._conn.execute(
+                "INSERT OR REPLACE INTO sync_state (project, last_sync, issue_count) VALUES (?, ?, ?)",
+                (project, started_at.isoformat(), total),
+            )
+        logger.info("Synced %d issue(s) for project %s (%s)", count, project, "full" if not last_sync else "incremental")
+        return count
+
+    def _complete_truncated(self, page: list[dict], max_workers: int | None) -> None:
+        """Replace truncated embedded worklogs and comments with the complete, paged lists."""
+        jobs = []
+        for issue in page:
+            fields = issue["fields"]
+            worklog = fields.get("worklog")
+            if worklog and worklog.get("total", 0) > len(worklog.get("worklogs", [])):
+                jobs.append((issue, "worklog"))
+            comment = fields.get("comment")
+            if comment and comment.get("total", 0) > len(comment.get("comments", [])):
+                jobs.append((issue, "comment"))
+        if not jobs:
+            return
+
+        def complete(job: tuple[dict, str]) -> list[dict]:
+            issue, field = job
+            if field == "worklog":
+                return fetch_issue_worklogs(issue["key"])
+            return fetch_comments(issue["key"])[0]
+
+        for (issue, field), (items, error) in zip(jobs, map_concurrent(complete, jobs, max_workers=max_workers)):
+            if error is not None:
+                raise error
+            list_key = "worklogs" if field == "worklog" else "comments"
+            issue["fields"][field][list_key] = items
+
+    def _upsert_issue(self, issue: dict) -> None:
+        key = issue["key"]
+        fields = issue.get("fields", {})
+        self._conn.execute(
+            "INSERT OR REPLACE INTO issues VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                key,
+                issue.get("id"),
+                (fields.get("project") or {}).get("key", key.split("-")[0]),
+                fields.get("summary", ""),
+                (fields.get("status") or {}).get("name"),
+                (fields.get("priority") or {}).get("name"),
+                (fields.get("issuetype") or {}).get("name"),
+                (fields.get("assignee") or {}).get("displayName"),
+                (fields.get("reporter") or {}).get("displayName"),
+                fields.get("created"),
+                fields.get("updated"),
+                json.dumps(issue, separators=(",", ":")),
+            ),
+        )
+
+        self._conn.execute("DELETE FROM comments WHERE issue_key = ?", (key,))
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO comments VALUES (?, ?, ?, ?, ?)",
+            [
+                (c["id"], key, (c.get("author") or {}).get("displayName"), c.get("created"), json.dumps(c))
+                for c in (fields.get("comment") or {}).get("comments", [])
+            ],
+        )
+
+        self._conn.execute("DELETE FROM worklogs WHERE issue_key = ?", (key,))
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO worklogs VALUES (?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    w["id"], key, (w.get("author") or {}).get("displayName"), w.get("started"),
+                    w.get("timeSpentSeconds"), json.dumps(w),
+                )
+                for w in (fields.get("worklog") or {}).get("worklogs", [])
+            ],
+        )
+
+        self._conn.execute("DELETE FROM links WHERE issue_key = ?", (key,))
+        link_rows = []
+        for link in fields.get("issuelinks") or []:
+            if "outwardIssue" in link:
+                direction, other = "outward", link["outwardIssue"]
+            elif "inwardIssue" in link:
+                direction, other = "inward", link["inwardIssue"]
+            else:
+                continue
+            link_rows.append((key, link["id"], (link.get("type") or {}).get("name"), direction, other.get("key")))
+        self._conn.executemany("INSERT OR REPLACE INTO links VALUES (?, ?, ?, ?, ?)", link_rows)
+
+    def last_sync(self, project: str) -> datetime | None:
+        """Return when ``project`` was last synced, or None if never."""
+        with self._lock:
+            row = self._conn.execute("SELECT last_sync FROM sync_state WHERE project = ?", (project,)).fetchone()
+        return datetime.fromisoformat(row["last_sync"]) if row else None
+
+    def sync_status(self) -> list[dict]:
+        """Return per-project sync time and issue counts."""
+        with self._lock:
+            rows = self._conn.execute("SELECT project, last_sync, issue_count FROM sync_state ORDER BY project").fetchall()
+        return [dict(row) for row in rows]
+
+    # ---------- Queries ----------
+
+    def get_issue(self, issue_key: str) -> dict | None:
+        """Return the stored issue payload with all stored comments, or None if not mirrored."""
+        with self._lock:
+            row = self._conn.execute("SELECT data FROM issues WHERE key = ?", (issue_key.upper(),)).fetchone()
+            if row is None:
+                return None
+            comments = self._conn.execute(
+                "SELECT data FROM comments WHERE issue_key = ? ORDER BY created", (issue_key.upper(),)
+            ).fetchall()
+        issue = json.loads(row["data"])
+        if comments:
+            all_comments = [json.loads(c["data"]) for c in comments]
+            issue["fields"]["comment"] = {"comments": all_comments, "total": len(all_comments)}
+        return issue
+
+    def search(self, jql: str, limit: int | None = None) -> list[dict]:
+        """Run a JQL query against the mirror.
+
+        Supports ``AND``-joined clauses on project, key, status, priority,
+        issuetype, assignee, reporter, created and updated with ``=``, ``!=``,
+        ``in``, ``not in`` and comparison operators, ``summary ~``/``text ~``,
+        and a single ``ORDER BY`` field. Dates must be absolute
+        (``YYYY-MM-DD[ HH:MM]``) or relative durations (``-7d``, ``-4h``);
+        anything else, including date functions, raises ValueError.
+        """
+        sql, params = _jql_to_sql(jql)
+        if limit:
+            sql += " LIMIT ?"
+            params.append(limit)
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [json.loads(row["data"]) for row in rows]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def _jql_to_sql(jql: str) -> tuple[str, list]:
+    """Translate the supported JQL subset into a SELECT over the issues table."""
+    order = "updated DESC"
+    order_match = _ORDER_RE.search(jql)
+    if order_match:
+        column = _QUERY_COLUMNS.get(order_match.group("field").lower())
+        if column is None:
+            raise ValueError(f"Cannot order by '{order_match.group('field')}' offline")
+        order = f"{column} {(order_match.group('dir') or 'ASC').upper()}"
+        jql = jql[:order_match.start()]
+
+    if re.search(r"\s+OR\s+", jql, flags=re.IGNORECASE):
+        raise ValueError("OR is not supported by the local store")
+
+    where, params = [], []
+    for clause in filter(None, (c.strip() for c in re.split(r"\s+AND\s+", jql, flags=re.IGNORECASE))):
+        match = _CLAUSE_RE.match(clause)
+        column = _QUERY_COLUMNS.get(match.group("field").lower()) if match else None
+        if column is None:
+            raise ValueError(f"Unsupported clause for local store: '{clause}'")
+        op = " ".join(match.group("op").lower().split())
+        value = match.group("value")
+        if column in _DATE_COLUMNS:
+            if op in ("in", "not in", "~"):
+                raise ValueError(f"Unsupported operator for a date in the local store: '{clause}'")
+            where.append(f"{column} {op} ?")
+            params.append(_date_operand(_unquote(value)))
+        elif op in ("in", "not in"):
+            values = [_unquote(v) for v in value.strip("()").split(",") if v.strip()]
+            where.append(f"{column} COLLATE NOCASE {op.upper()} ({', '.join('?' * len(values))})")
+            params.extend(values)
+        elif op == "~":
+            where.append(f"{column} LIKE ?")
+            params.append(f"%{_unquote(value)}%")
+        else:
+            literal = _unquote(value)
+            if literal == value.strip() and (" " in literal or "(" in literal):
+                raise ValueError(f"Unsupported value for local store: '{value}'")
+            where.append(f"{column} COLLATE NOCASE {op} ?")
+            params.append(literal)
+
+    sql = "SELECT data FROM issues"
+    if where:
+        sql += " WHERE " + " AND ".join(where)
+    return sql + f" ORDER BY {order}", params
+
+
+def _date_operand(value: str) -> str:
+    """Turn a JQL date (``2024-05-01``, ``2024-05-01 09:30``, ``-7d``) into a comparable timestamp prefix.
+
+    Relative durations are resolved against the local clock, like Jira does
+    in the user's time zone. Date functions (``startOfDay()``...) raise
+    ValueError rather than being compared as strings.
+    """
+    absolute = _ABSOLUTE_DATE_RE.match(value)
+    if absolute:
+        year, month, day, hour, minute = absolute.groups()
+        return f"{year}-{month}-{day}" + (f"T{hour}:{minute}" if hour else "")
+    relative = _RELATIVE_DATE_RE.match(value)
+    if relative:
+        sign, amount, unit = relative.groups()
+        delta = timedelta(**{_RELATIVE_UNITS[unit]: int(amount)})
+        moment = datetime.now() - delta if sign == "-" else datetime.now() + delta
+        return moment.strftime("%Y-%m-%dT%H:%M")
+    raise ValueError(
+        f"Unsupported date for local store: '{value}'. Use YYYY-MM-DD[ HH:MM] or a duration such as -7d"
+    )
+
+
+def _unquote(value: str) -> str:
+    value = value.strip()
+    if len(value) >= 2 and value[0] == value[-1] and value[0] in "'\"":
+        return value[1:-1]
+    return value
+
+
+_store: IssueStore | None = None
+_store_lock = threading.Lock()
+
+
+def get_store() -> IssueStore:
+    """Return the process-wide store at JIRA_STORE_PATH, opening it on first use."""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = IssueStore(JIRA_STORE_PATH)
+    return _store
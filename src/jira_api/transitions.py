@@ -0,0 +1,139 @@
+"""Workflow transition lookup with a (project, issue type, status) cache."""
+
+import logging
+import threading
+
+from jira_api.cache import TTLCache
+from jira_api.config import JIRA_ISSUE_CACHE_SIZE, JIRA_TRANSITION_CACHE_TTL
+from jira_api.lazy import lazy_import
+from jira_api.transport import get_transport
+
+requests = lazy_import("requests")
+
+logger = logging.getLogger(__name__)
+
+# (project key, issue type name, status name) -> available transitions.
+# Workflows rarely change, so one lookup serves every issue in that state.
+transition_cache = TTLCache(maxsize=512, ttl=JIRA_TRANSITION_CACHE_TTL)
+# Issue key -> (project key, issue type name, status name), learned from any
+# issue payload the server has seen and updated after each transition.
+issue_context = TTLCache(maxsize=JIRA_ISSUE_CACHE_SIZE * 8, ttl=JIRA_TRANSITION_CACHE_TTL)
+
+_context_locks: dict[tuple[str, str, str], threading.Lock] = {}
+_context_locks_guard = threading.Lock()
+
+# Statuses Jira uses when a transition ID is not valid for the issue's current state
+_REJECTED_STATUSES = {400, 404, 409}
+
+
+def remember_issue_context(issue: dict) -> None:
+    """Record an issue's project/type/status so its transitions can come from the cache."""
+    fields = issue.get("fields") or {}
+    context = _context_from_fields(fields)
+    if context and issue.get("key"):
+        issue_context.set(issue["key"].upper(), context)
+
+
+def transition_issue(issue_key: str, status: str) -> tuple[bool, list[dict]]:
+    """Transition an issue to ``status`` (matched on transition or target status name).
+
+    Transitions come from the cache when the issue's current context is
+    known; otherwise one GET fetches both the context and the transitions.
+    If a cached transition is missing or rejected by Jira, the cache entry
+    is dropped and the lookup is repeated live before giving up.
+
+    Returns:
+        (transitioned, transitions that were available for the issue)
+    """
+    transitions, from_cache = _transitions_for(issue_key)
+    match = _match(transitions, status)
+    if match is None and from_cache:
+        transitions, from_cache = _transitions_for(issue_key, refresh=True)
+        match = _match(transitions, status)
+    if match is None:
+        return False, transitions
+
+    try:
+        _post_transition(issue_key, match)
+    except requests.HTTPError as e:
+        if not from_cache or e.response is None or e.response.status_code not in _REJECTED_STATUSES:
+            raise
+        logger.info("Cached transition %s rejected for %s; refetching", match["id"], issue_key)
+        transitions, _ = _transitions_for(issue_key, refresh=True)
+        match = _match(transitions, status)
+        if match is None:
+            return False, transitions
+        _post_transition(issue_key, match)
+    return True, transitions
+
+
+def _transitions_for(issue_key: str, refresh: bool = False) -> tuple[list[dict], bool]:
+    """Return (transitions, came_from_cache) for an issue's current state."""
+    key = issue_key.upper()
+    # A stale context may no longer be the issue's workflow state: fetch live
+    context = issue_context.get(key)
+    if context is None:
+        return _fetch_transitions(issue_key), False
+    if refresh:
+        transition_cache.invalidate(lambda k: k == context)
+        return _fetch_transitions(issue_key), False
+
+    cached = transition_cache.get(context)
+    if cached is not None:
+        return cached, True
+    # Single-flight per workflow state: concurrent bulk updates of issues in
+    # the same state wait for one lookup instead of each fetching their own
+    with _context_lock(context):
+        # Another thread may have fetched this state while we waited
+        cached = transition_cache.get(context)
+        if cached is not None and issue_context.get(key) == context:
+            return cached, True
+        return _fetch_transitions(issue_key), False
+
+
+def _fetch_transitions(issue_key: str) -> list[dict]:
+    """GET an issue's context and transitions in one request and cache both."""
+    data = get_transport().get(
+        f"issue/{issue_key}",
+        params={"fields": "project,issuetype,status", "expand": "transitions"},
+    )
+    transitions = data.get("transitions", [])
+    context = _context_from_fields(data.get("fields") or {})
+    if context:
+        issue_context.set(issue_key.upper(), context)
+        transition_cache.set(context, transitions)
+    return transitions
+
+
+def _context_lock(context: tuple[str, str, str]) -> threading.Lock:
+    with _context_locks_guard:
+        return _context_locks.setdefault(context, threading.Lock())
+
+
+def _post_transition(issue_key: str, transition: dict) -> None:
+    get_transport().post(f"issue/{issue_key}/transitions", {"transition": {"id": transition["id"]}})
+    # The issue is now in the transition's target status
+    context = issue_context.get(issue_key.upper())
+    target = (transition.get("to") or {}).get("name")
+    if context and target:
+        issue_context.set(issue_key.upper(), (context[0], context[1], target))
+    else:
+        issue_context.invalidate(lambda k: k == issue_key.upper())
+
+
+def _match(transitions: list[dict], status: str) -> dict | None:
+    wanted = status.lower()
+    return next(
+        (t for t in transitions
+         if t.get("name", "").lower() == wanted or (t.get("to") or {}).get("name", "").lower() == wanted),
+        None,
+    )
+
+
+def _context_from_fields(fields: dict) -> tuple[str, str, str] | None:
+    project = (fields.get("project") or {}).get("key")
+    issue_type = (fields.get("issuetype") or {}).get("name")
+    status = (fields.get("status") or {}).get("name")
+    if project and issue_type and status:
+        return project, issue_type, status
+    return None
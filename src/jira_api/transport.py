@@ -0,0 +1,170 @@
+"""Pooled, keep-alive HTTP transport for the Jira REST API."""
+
+import logging
+import threading
+import time
+from base64 import b64encode
+
+from jira_api.config import JIRA_API_TOKEN, JIRA_BASE_URL, JIRA_EMAIL, JIRA_POOL_SIZE, JIRA_TIMEOUT
+from jira_api.lazy import lazy_import
+from jira_api.metrics import metrics
+from jira_api.ratelimit import RetryScheduler, get_scheduler
+
+requests = lazy_import("requests")
+
+logger = logging.getLogger(__name__)
+
+
+class JiraTransport:
+    """A shared, connection-pooled HTTP session for Jira REST API calls.
+
+    A single ``requests.Session`` is reused for every call, so TCP/TLS
+    handshakes happen once per pooled connection instead of once per request.
+    The auth header is computed once at construction. The session may be
+    shared between threads: each request checks a connection out of the pool
+    and returns it when the response has been read. Every call goes through
+    a :class:`~jira_api.ratelimit.RetryScheduler` (rate limit + retries).
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        email: str,
+        api_token: str,
+        pool_size: int = 10,
+        timeout: int = 30,
+        scheduler: RetryScheduler | None = None,
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.api_url = f"{self.base_url}/rest/api/3/"
+        self.pool_size = max(1, pool_size)
+        self.timeout = timeout
+        self.scheduler = scheduler or get_scheduler()
+
+        token = b64encode(f"{email}:{api_token}".encode()).decode()
+        self._session = requests.Session()
+        self._session.headers.update({
+            "Authorization": f"Basic {token}",
+            "Accept": "application/json",
+            "Accept-Encoding": "gzip, deflate",
+            "Connection": "keep-alive",
+        })
+        # pool_block=True makes pool_size a hard cap: callers wait for a free
+        # connection instead of opening throwaway ones that are never reused.
+        self._adapter = requests.adapters.HTTPAdapter(pool_connections=2, pool_maxsize=self.pool_size, pool_block=True)
+        self._session.mount("https://", self._adapter)
+        self._session.mount("http://", self._adapter)
+
+        self._lock = threading.Lock()
+        self._request_count = 0
+        self._requests_by_method: dict[str, int] = {}
+
+    def request(
+        self,
+        method: str,
+        endpoint: str,
+        params: dict | None = None,
+        json_data: dict | list | None = None,
+    ) -> "requests.Response":
+        """Send a request to ``/rest/api/3/{endpoint}`` and raise on HTTP errors.
+
+        Throttled (429) and, for idempotent calls, transiently failing
+        requests are retried before the error is raised.
+        """
+        def send() -> "requests.Response":
+            with self._lock:
+                self._request_count += 1
+                self._requests_by_method[method] = self._requests_by_method.get(method, 0) + 1
+            start = time.perf_counter()
+            try:
+                resp = self._session.request(
+                    method,
+                    self.api_url + endpoint,
+                    params=params,
+                    json=json_data,
+                    timeout=self.timeout,
+                )
+            except requests.RequestException:
+                metrics.observe_request(method, endpoint, None, time.perf_counter() - start)
+                raise
+            metrics.observe_request(
+                method, endpoint, resp.status_code, time.perf_counter() - start,
+                len(resp.request.body or b""), len(resp.content),
+            )
+            return resp
+
+        return self.scheduler.run(send, method, endpoint)
+
+    def get(self, endpoint: str, params: dict | None = None) -> dict:
+        """GET an endpoint and return the decoded JSON body."""
+        return _decode(self.request("GET", endpoint, params=params))
+
+    def post(self, endpoint: str, json_data: dict | list) -> dict:
+        """POST a JSON body and return the decoded JSON body ({} if empty)."""
+        return _decode(self.request("POST", endpoint, json_data=json_data))
+
+    def put(self, endpoint: str, json_data: dict | list) -> None:
+        """PUT a JSON body, discarding the response."""
+        self.request("PUT", endpoint, json_data=json_data)
+
+    def delete(self, endpoint: str, params: dict | None = None) -> None:
+        """DELETE an endpoint, discarding the response."""
+        self.request("DELETE", endpoint, params=params)
+
+    def pool_stats(self) -> dict:
+        """Return request counters and per-host connection pool state."""
+        pools = []
+        pool_manager = self._adapter.poolmanager
+        for pool_key in list(pool_manager.pools.keys()):
+            pool = pool_manager.pools.get(pool_key)
+            if pool is None:
+                continue
+            # Empty pool slots are held as None placeholders in the queue
+            idle = sum(1 for conn in list(pool.pool.queue) if conn is not None) if pool.pool is not None else 0
+            pools.append({
+                "host": f"{pool.scheme}://{pool.host}:{pool.port}",
+                "connections_opened": pool.num_connections,
+                "requests_sent": pool.num_requests,
+                "idle_connections": idle,
+                "max_size": self.pool_size,
+            })
+        with self._lock:
+            return {
+                "pool_size": self.pool_size,
+                "requests": self._request_count,
+                "requests_by_method": dict(self._requests_by_method),
+                "pools": pools,
+                "retries": self.scheduler.stats(),
+            }
+
+    def close(self) -> None:
+        """Close all pooled connections."""
+        self._session.close()
+
+
+def _decode(resp: "requests.Response") -> dict:
+    """Decode a JSON response body, treating an empty body (e.g. 204) as {}."""
+    if not resp.content:
+        return {}
+    return resp.json()
+
+
+_transport: JiraTransport | None = None
+_transport_lock = threading.Lock()
+
+
+def get_transport() -> JiraTransport:
+    """Return the process-wide transport, creating it on first use."""
+    global _transport
+    if _transport is None:
+        with _transport_lock:
+            if _transport is None:
+                logger.info("Creating Jira HTTP transport (pool_size=%d, timeout=%ds)", JIRA_POOL_SIZE, JIRA_TIMEOUT)
+                _transport = JiraTransport(
+                    JIRA_BASE_URL,
+                    JIRA_EMAIL,
+                    JIRA_API_TOKEN,
+                    pool_size=JIRA_POOL_SIZE,
+                    timeout=JIRA_TIMEOUT,
+                )
+    return _transport
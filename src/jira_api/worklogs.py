@@ -0,0 +1,188 @@
+"""Worklog retrieval: date windows via the bulk endpoints, and paged per-issue lists."""
+
+import logging
+from collections.abc import Iterator
+from datetime import datetime, timedelta, timezone
+
+from jira_api.async_transport import get_async_transport
+from jira_api.concurrency import map_concurrent
+from jira_api.transport import get_transport
+
+logger = logging.getLogger(__name__)
+
+# Jira accepts at most 1000 IDs per worklog/list request
+WORKLOG_LIST_BATCH = 1000
+# Issue ID -> key lookups go through JQL `id in (...)`
+ISSUE_KEY_BATCH = 100
+# issue/{key}/worklog returns at most 5000 worklogs per page
+ISSUE_WORKLOG_PAGE_SIZE = 5000
+
+
+def fetch_worklogs_in_window(
+    start_date: str,
+    end_date: str,
+    projects: list[str] | None = None,
+    max_workers: int | None = None,
+) -> list[tuple[str, dict]]:
+    """Return ``(issue_key, worklog)`` pairs for worklogs started within a date window.
+
+    Uses ``worklog/updated`` to list only worklog IDs changed since the start
+    of the window, then ``worklog/list`` to fetch those worklogs in batches of
+    up to 1000. Nothing older than the window is downloaded, unlike scanning
+    every worklog on every matching issue.
+
+    A worklog that was created before ``start_date`` but dated inside the
+    window (logged in advance) is not returned by ``worklog/updated``.
+
+    Args:
+        start_date: First day of the window, YYYY-MM-DD (inclusive)
+        end_date: Last day of the window, YYYY-MM-DD (inclusive)
+        projects: Optional project keys; worklogs on other projects are dropped
+        max_workers: Concurrency for the batch requests (default JIRA_MAX_WORKERS)
+
+    Returns:
+        Pairs sorted by (started, issue key, worklog ID).
+    """
+    # Start a day early: worklog/updated works in UTC, `started` is local time
+    since = datetime.strptime(start_date, "%Y-%m-%d").replace(tzinfo=timezone.utc) - timedelta(days=1)
+    worklog_ids = _updated_worklog_ids(int(since.timestamp() * 1000))
+    if not worklog_ids:
+        return []
+
+    batches = [worklog_ids[i:i + WORKLOG_LIST_BATCH] for i in range(0, len(worklog_ids), WORKLOG_LIST_BATCH)]
+    worklogs = []
+    for result, error in map_concurrent(_list_worklogs, batches, max_workers=max_workers):
+        if error is not None:
+            raise error
+        worklogs.extend(
+            log for log in result
+            if start_date <= log.get("started", "")[:10] <= end_date
+        )
+    if not worklogs:
+        return []
+
+    issue_keys = _issue_keys({log["issueId"] for log in worklogs}, projects, max_workers)
+    pairs = [(issue_keys[log["issueId"]], log) for log in worklogs if log["issueId"] in issue_keys]
+    pairs.sort(key=lambda p: (p[1].get("started", ""), p[0], int(p[1].get("id", 0))))
+    logger.info("Fetched %d worklog(s) in window %s..%s from %d updated ID(s)",
+                len(pairs), start_date, end_date, len(worklog_ids))
+    return pairs
+
+
+def _updated_worklog_ids(since_ms: int) -> list[int]:
+    """Page through worklog/updated and collect every worklog ID changed since ``since_ms``."""
+    transport = get_transport()
+    ids: list[int] = []
+    while True:
+        page = transport.get("worklog/updated", params={"since": since_ms})
+        ids.extend(v["worklogId"] for v in page.get("values", []))
+        if page.get("lastPage", True) or "until" not in page:
+            return ids
+        since_ms = page["until"]
+
+
+def _list_worklogs(ids: list[int]) -> list[dict]:
+    """Fetch full worklog records for up to 1000 IDs."""
+    return get_transport().post("worklog/list", {"ids": ids}) or []
+
+
+def _issue_keys(issue_ids: set[str], projects: list[str] | None, max_workers: int | None) -> dict[str, str]:
+    """Map issue IDs to keys, dropping issues outside ``projects``."""
+    ids = sorted(issue_ids, key=int)
+    batches = [ids[i:i + ISSUE_KEY_BATCH] for i in range(0, len(ids), ISSUE_KEY_BATCH)]
+    project_clause = f" AND project in ({', '.join(projects)})" if projects else ""
+
+    def lookup(batch: list[str]) -> dict:
+        return get_transport().post("search/jql", {
+            "jql": f"id in ({', '.join(batch)}){project_clause}",
+            "maxResults": len(batch),
+            "fields": ["key"],
+        })
+
+    keys = {}
+    for result, error in map_concurrent(lookup, batches, max_workers=max_workers):
+        if error is not None:
+            raise error
+        keys.update({issue["id"]: issue["key"] for issue in result.get("issues", [])})
+    return keys
+
+
+def iter_issue_worklog_pages(
+    issue_key: str,
+    started_after: datetime | None = None,
+    started_before: datetime | None = None,
+    page_size: int = ISSUE_WORKLOG_PAGE_SIZE,
+) -> Iterator[list[dict]]:
+    """Yield an issue's worklogs one page at a time from ``issue/{key}/worklog``.
+
+    ``started_after``/``started_before`` are applied by Jira, so worklogs
+    outside the window are never downloaded.
+    """
+    transport = get_transport()
+    params = _worklog_window_params(started_after, started_before)
+    start = 0
+    while True:
+        page = transport.get(f"issue/{issue_key}/worklog", params={**params, "startAt": start, "maxResults": page_size})
+        worklogs = page.get("worklogs", [])
+        if worklogs:
+            yield worklogs
+        start += len(worklogs)
+        if not worklogs or start >= page.get("total", start):
+            return
+
+
+def fetch_issue_worklogs(
+    issue_key: str,
+    started_after: datetime | None = None,
+    started_before: datetime | None = None,
+) -> list[dict]:
+    """Fetch every worklog of an issue (all pages), optionally limited to a started window.
+
+    Args:
+        issue_key: Issue key
+        started_after: Only worklogs started at or after this time
+        started_before: Only worklogs started before this time
+    """
+    worklogs = []
+    for page in iter_issue_worklog_pages(issue_key, started_after, started_before):
+        worklogs.extend(page)
+    return worklogs
+
+
+async def fetch_issue_worklogs_async(
+    issue_key: str,
+    started_after: datetime | None = None,
+    started_before: datetime | None = None,
+) -> list[dict]:
+    """Async counterpart of :func:`fetch_issue_worklogs`."""
+    transport = get_async_transport()
+    params = _worklog_window_params(started_after, started_before)
+    worklogs: list[dict] = []
+    while True:
+        page = await transport.get(f"issue/{issue_key}/worklog", params={
+            **params, "startAt": len(worklogs), "maxResults": ISSUE_WORKLOG_PAGE_SIZE,
+        })
+        batch = page.get("worklogs", [])
+        worklogs.extend(batch)
+        if not batch or len(worklogs) >= page.get("total", len(worklogs)):
+            return worklogs
+
+
+def date_window(start_date: str, end_date: str) -> tuple[datetime, datetime]:
+    """Widen a YYYY-MM-DD date range by a day each side for ``startedAfter``/``startedBefore``.
+
+    ``started`` is in the worklog author's timezone while the filter is in
+    UTC; callers still filter on ``started[:10]`` for the exact range.
+    """
+    start = datetime.strptime(start_date, "%Y-%m-%d").replace(tzinfo=timezone.utc) - timedelta(days=1)
+    end = datetime.strptime(end_date, "%Y-%m-%d").replace(tzinfo=timezone.utc) + timedelta(days=2)
+    return start, end
+
+
+def _worklog_window_params(started_after: datetime | None, started_before: datetime | None) -> dict:
+    params = {}
+    if started_after is not None:
+        params["startedAfter"] = int(started_after.timestamp() * 1000)
+    if started_before is not None:
+        params["startedBefore"] = int(started_before.timestamp() * 1000)
+    return params
@@ -1,294 +1,467 @@
+import argparse
+import asyncio
+import functools
+import itertools
 import logging
-import os
-from base64 import b64encode
+import threading
+import time
+from datetime import datetime
 from pathlib import Path
 
-import requests
-from dotenv import load_dotenv
 from mcp.server.fastmcp import FastMCP
 
+from jira_api.analytics import WorklogTable, format_duration, worklog_seconds
+from jira_api.async_transport import get_async_transport
+from jira_api.comments import fetch_comments, is_before, parse_since
+from jira_api.concurrency import gather_limited, map_concurrent
+from jira_api.config import JIRA_API_TOKEN, JIRA_BASE_URL, JIRA_STORE_PROJECTS
+from jira_api.export import EXPORT_FORMATS, atomic_writer, export_path, write_records
+from jira_api.fields import get_field_registry
+from jira_api.formatting import (
+    ISSUE_REPORT_FIELDS,
+    JSON,
+    OUTPUT_FORMATS,
+    format_issue,
+    format_search_result,
+    issue_data,
+    search_result_data,
+    to_json,
+)
+from jira_api.issues import fetch_issue, fetch_issues, invalidate_issue, issue_cache
+from jira_api.lazy import lazy_import
+from jira_api.metrics import metrics, start_metrics_dump
+from jira_api.search import MAX_PAGE_SIZE, iter_issue_pages, iter_issues
+from jira_api.store import get_store
+from jira_api.transitions import remember_issue_context, transition_cache, transition_issue
+from jira_api.transport import get_transport
+from jira_api.worklogs import date_window, fetch_issue_worklogs, fetch_issue_worklogs_async, fetch_worklogs_in_window
+
+# Only needed once a tool runs (mostly in except clauses), not to start serving
+requests = lazy_import("requests")
+sqlite3 = lazy_import("sqlite3")
+
 # Configure logging to stderr (never stdout for stdio MCP servers)
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+# httpx logs every request at INFO
+logging.getLogger("httpx").setLevel(logging.WARNING)
 logger = logging.getLogger(__name__)
 
-# Load credentials — .env is at project root (one level up from src/)
-load_dotenv(Path(__file__).parent.parent / ".env")
-
-JIRA_BASE_URL = os.getenv("JIRA_BASE_URL", "").rstrip("/")
-JIRA_EMAIL = os.getenv("JIRA_EMAIL", "")
-JIRA_API_TOKEN = os.getenv("JIRA_API_TOKEN", "")
-
-# Output directory — at project root (one level up from src/)
+# Output directory — at project root (one level up from src/); created by the
+# first write (atomic_writer creates parent directories), not at startup
 OUTPUT_DIR = Path(__file__).parent.parent / "output"
-OUTPUT_DIR.mkdir(exist_ok=True)
+# Characters handed to the file stream per write call
+_WRITE_CHUNK = 1 << 20
+# Issues whose worklogs are held in memory at once during a worklog export
+_EXPORT_ISSUE_PAGE = 200
 
 # Initialize MCP server — name must match the config key in ~/.claude/settings.json
 # so tools register consistently as mcp__jira__* in every session
 mcp = FastMCP("jira")
 
 
-def _jira_headers() -> dict:
-    """Build auth headers for Jira REST API."""
-    token = b64encode(f"{JIRA_EMAIL}:{JIRA_API_TOKEN}".encode()).decode()
-    return {
-        "Authorization": f"Basic {token}",
-        "Content-Type": "application/json",
-        "Accept": "application/json",
-    }
+def _tool():
+    """Register a tool, timed in the server metrics, running blocking tools on a worker thread.
+
+    FastMCP calls sync tools directly on its event loop, so one slow tool
+    would stall every other request. A sync tool is registered as an async
+    wrapper around ``asyncio.to_thread``; async tools are registered as-is.
+    The undecorated function is returned, so scripts can still call it
+    directly.
+    """
+    def register(func):
+        if asyncio.iscoroutinefunction(func):
+            mcp.tool()(metrics.time_tool(func.__name__, func))
+            return func
+
+        @functools.wraps(func)
+        async def run_in_thread(*args, **kwargs):
+            return await asyncio.to_thread(func, *args, **kwargs)
+
+        mcp.tool()(metrics.time_tool(func.__name__, run_in_thread))
+        return func
+    return register
 
 
 def _jira_get(endpoint: str, params: dict | None = None) -> dict:
     """Make an authenticated GET request to Jira REST API."""
-    url = f"{JIRA_BASE_URL}/rest/api/3/{endpoint}"
-    resp = requests.get(url, headers=_jira_headers(), params=params, timeout=30)
-    resp.raise_for_status()
-    return resp.json()
+    return get_transport().get(endpoint, params=params)
 
 
 def _jira_post(endpoint: str, json_data: dict) -> dict:
     """Make an authenticated POST request to Jira REST API."""
-    url = f"{JIRA_BASE_URL}/rest/api/3/{endpoint}"
-    resp = requests.post(url, headers=_jira_headers(), json=json_data, timeout=30)
-    resp.raise_for_status()
-    return resp.json()
+    return get_transport().post(endpoint, json_data)
 
 
 def _jira_put(endpoint: str, json_data: dict) -> None:
     """Make an authenticated PUT request to Jira REST API."""
-    url = f"{JIRA_BASE_URL}/rest/api/3/{endpoint}"
-    resp = requests.put(url, headers=_jira_headers(), json=json_data, timeout=30)
-    resp.raise_for_status()
+    get_transport().put(endpoint, json_data)
 
 
 # ---------- Tools ----------
 
 
-@mcp.tool()
-def search_jira_issues(jql: str, max_results: int = 20) -> str:
+# Fields shown for each search result
+# (issuetype is not shown, but lets status changes reuse cached workflow transitions)
+_SEARCH_FIELDS = ["summary", "status", "priority", "assignee", "reporter", "created", "updated", "project", "fixVersions", "versions", "issuetype"]
+# Inline results are returned in the MCP message; larger sets go to a file
+_SEARCH_INLINE_DEFAULT = 20
+_SEARCH_INLINE_MAX = 1000
+
+
+@_tool()
+def search_jira_issues(
+    jql: str,
+    max_results: int = 0,
+    page_size: int = 100,
+    output_file: str = "",
+    use_local_store: bool = False,
+    fields: str = "",
+    expand: str = "",
+    output_format: str = "markdown",
+) -> str:
     """Search Jira issues using a JQL query.
 
+    Results are paged through Jira's nextPageToken, so large result sets are supported.
+    With output_file, the first page is returned immediately and every result
+    (or the first max_results) is written to that file in the output/ directory in the background.
+
     Args:
         jql: A JQL query string (e.g. 'project = LAE AND assignee = currentUser()')
-        max_results: Maximum number of results to return (default 20, max 100)
+        max_results: Maximum number of results. Leave as 0 for 20 inline results, or for every result
+            with output_file. Inline results are capped at 1000; with output_file this caps the file instead
+        page_size: Issues fetched per request (default 100, Jira's maximum for full issues)
+        output_file: Optional filename (e.g. 'open-bugs.md') to stream all results into. Leave empty to return results inline
+        use_local_store: Answer from the local mirror (see sync_local_store) instead of Jira. Works offline, but
+            only supports AND-joined clauses on project, key, status, priority, issuetype, assignee, reporter,
+            created, updated and summary/text ~, plus one ORDER BY field
+        fields: Fields to fetch and show: a preset ('minimal', 'triage', 'full'), field IDs and/or field names,
+            comma-separated (e.g. 'minimal, Resolution Path'). Leave empty for the standard result fields
+        expand: Optional Jira expand list (e.g. 'renderedFields,changelog')
+        output_format: 'markdown' (default) or 'json' — compact JSON holding only the fetched fields.
+            With output_file, 'json' writes one JSON object per line
     """
+    if output_format not in OUTPUT_FORMATS:
+        return _unknown_format(output_format)
+    try:
+        field_ids, field_names = _resolve_fields(fields or _SEARCH_FIELDS, offline=use_local_store)
+    except ValueError as e:
+        return f"Error: {e}"
+
+    if use_local_store:
+        return _search_local_store(
+            jql, max(1, min(max_results or _SEARCH_INLINE_DEFAULT, _SEARCH_INLINE_MAX)), output_format, field_ids, field_names,
+        )
+
     if not JIRA_BASE_URL or not JIRA_API_TOKEN:
         return "Error: Jira credentials not configured. Please set JIRA_BASE_URL, JIRA_EMAIL, and JIRA_API_TOKEN in .env"
 
-    max_results = min(max_results, 100)
+    if output_file:
+        return _search_to_file(jql, output_file, max_results or None, page_size, output_format, field_ids, field_names, expand)
+
+    max_results = max(1, min(max_results or _SEARCH_INLINE_DEFAULT, _SEARCH_INLINE_MAX))
+    issues = []
     try:
-        payload = {
-            "jql": jql,
-            "maxResults": max_results,
-            "fields": ["summary", "status", "priority", "assignee", "reporter", "created", "updated", "project", "fixVersions", "versions"],
-        }
-        data = _jira_post("search/jql", payload)
+        # Ask for one extra issue to tell whether more results exist
+        for issue in iter_issues(jql, field_ids, page_size=page_size, limit=max_results + 1, expand=expand):
+            remember_issue_context(issue)
+            issues.append(issue)
     except requests.HTTPError as e:
         return f"Jira API error: {e.response.status_code} — {e.response.text[:500]}"
     except requests.RequestException as e:
         return f"Connection error: {e}"
 
-    issues = data.get("issues", [])
-    is_last = data.get("isLast", True)
+    return _format_search(jql, issues, max_results, output_format, field_names)
+
+
+def _resolve_fields(
+    spec: str | list[str], labelled: set[str] | frozenset[str] = frozenset(), offline: bool = False,
+) -> tuple[list[str], dict[str, str]]:
+    """Resolve a fields spec to field IDs, plus display names for the custom fields among them.
+
+    Args:
+        spec: Presets, field IDs and/or field names
+        labelled: Field IDs the formatter labels itself, which need no name
+        offline: Take names from the cached field list only, never fetching it
+            (local store reads)
+
+    Raises:
+        ValueError: A field name or preset could not be resolved
+    """
+    registry = get_field_registry()
+    try:
+        field_ids = registry.resolve_fields(spec)
+    except requests.RequestException as e:
+        raise ValueError(f"Could not load field names to resolve '{spec}': {e}") from e
+    unnamed = [f for f in field_ids if f.startswith("customfield_") and f not in labelled]
+    names = {}
+    if unnamed:
+        lookup = registry.cached if offline else registry.get
+        try:
+            names = {f: (lookup(f) or {}).get("name", f) for f in unnamed}
+        except requests.RequestException as e:
+            logger.warning("Field names unavailable, showing field IDs: %s", e)
+    return field_ids, names
+
+
+def _project_fields(issue: dict, field_ids: list[str]) -> dict:
+    """Reduce a stored full payload to the requested fields, as Jira would have returned it."""
+    if any(f.startswith(("*", "-")) for f in field_ids):
+        return issue
+    fields = issue.get("fields", {})
+    return {**issue, "fields": {f: fields.get(f) for f in field_ids}}
+
+
+def _format_search(
+    jql: str,
+    issues: list[dict],
+    max_results: int,
+    output_format: str,
+    field_names: dict[str, str] | None = None,
+    source: str = "",
+) -> str:
+    """Format up to max_results search hits; a hit beyond max_results means more results exist."""
+    more = len(issues) > max_results
+    issues = issues[:max_results]
+    if output_format == JSON:
+        return to_json({
+            "jql": jql,
+            "count": len(issues),
+            "more": more,
+            **({"source": source} if source else {}),
+            "issues": [search_result_data(issue) for issue in issues],
+        })
 
     if not issues:
-        return f"No results found for JQL: {jql}"
-
-    count_label = f"{len(issues)} issue(s)" + ("" if is_last else "+")
-    lines = [f"Found {count_label}:\n"]
-    for issue in issues:
-        key = issue["key"]
-        fields = issue["fields"]
-        summary = fields.get("summary", "")
-        status = fields.get("status", {}).get("name", "Unknown")
-        priority_obj = fields.get("priority")
-        priority = priority_obj.get("name", "None") if priority_obj else "None"
-        assignee = fields.get("assignee", {})
-        assignee_name = assignee.get("displayName", "Unassigned") if assignee else "Unassigned"
-        reporter = fields.get("reporter", {})
-        reporter_name = reporter.get("displayName", "Unknown") if reporter else "Unknown"
-        created = fields.get("created", "")[:10]
-        updated = fields.get("updated", "")[:10]
-        fix_versions = ", ".join(v.get("name", "") for v in fields.get("fixVersions", [])) or "N/A"
-        affect_versions = ", ".join(v.get("name", "") for v in fields.get("versions", [])) or "N/A"
-        url = f"{JIRA_BASE_URL}/browse/{key}"
-
-        lines.append(f"#: {issues.index(issue) + 1}")
-        lines.append(f"Key:            {url}")
-        lines.append(f"Status:         {status}")
-        lines.append(f"Priority:       {priority}")
-        lines.append(f"Reporter:       {reporter_name}")
-        lines.append(f"Assignee:       {assignee_name}")
-        lines.append(f"Fix Version:    {fix_versions}")
-        lines.append(f"Affect Version: {affect_versions}")
-        lines.append(f"Summary:        {summary}")
-        lines.append(f"Created:        {created}")
-        lines.append(f"Updated:        {updated}\n")
+        return f"No results found{' in ' + source if source else ''} for JQL: {jql}"
 
+    count_label = f"{len(issues)} issue(s)" + ("+" if more else "")
+    lines = [f"Found {count_label}{' (' + source + ')' if source else ''}:\n"]
+    for index, issue in enumerate(issues, 1):
+        lines.extend(format_search_result(index, issue, field_names))
     return "\n".join(lines)
 
 
-@mcp.tool()
-def get_jira_issue(issue_key: str) -> str:
+def _unknown_format(output_format: str) -> str:
+    return f"Error: Unknown output_format '{output_format}'. Use 'markdown' or 'json'."
+
+
+def _search_local_store(
+    jql: str, max_results: int, output_format: str, field_ids: list[str], field_names: dict[str, str],
+) -> str:
+    """Run a search against the local mirror and format it like a live search."""
+    try:
+        issues = get_store().search(jql, limit=max_results + 1)
+    except ValueError as e:
+        return f"Error: {e}. Use use_local_store=False to run this query against Jira."
+    except sqlite3.Error as e:
+        return f"Local store error: {e}"
+
+    issues = [_project_fields(issue, field_ids) for issue in issues]
+    return _format_search(jql, issues, max_results, output_format, field_names, source="local store")
+
+
+def _search_to_file(
+    jql: str,
+    filename: str,
+    limit: int | None,
+    page_size: int,
+    output_format: str,
+    field_ids: list[str],
+    field_names: dict[str, str],
+    expand: str,
+) -> str:
+    """Return the first page of results and stream every result to a file in a background thread."""
+    safe_name = _safe_filename(filename)
+    if not safe_name:
+        return "Error: Invalid filename"
+    filepath = OUTPUT_DIR / safe_name
+
+    pages = iter_issue_pages(jql, field_ids, page_size=page_size, limit=limit, expand=expand)
+    try:
+        first_page = next(pages, [])
+    except requests.HTTPError as e:
+        return f"Jira API error: {e.response.status_code} — {e.response.text[:500]}"
+    except requests.RequestException as e:
+        return f"Connection error: {e}"
+
+    if not first_page:
+        return _format_search(jql, [], 0, output_format)
+
+    def write_all() -> None:
+        # The target only appears once it holds the full result set
+        count = 0
+        try:
+            with atomic_writer(filepath) as f:
+                if output_format != JSON:
+                    f.write(f"# JQL: {jql}\n\n")
+                for page in itertools.chain([first_page], pages):
+                    for issue in page:
+                        count += 1
+                        if output_format == JSON:
+                            f.write(to_json(search_result_data(issue)) + "\n")
+                        else:
+                            f.write("\n".join(format_search_result(count, issue, field_names)) + "\n")
+                if output_format != JSON:
+                    f.write(f"\nTotal: {count} issue(s)\n")
+            logger.info("Wrote %d search result(s) to %s", count, filepath)
+        except (requests.RequestException, OSError) as e:
+            logger.error("Search export to %s failed after %d issue(s): %s", filepath, count, e)
+
+    threading.Thread(target=write_all, name="jira-search-export", daemon=True).start()
+
+    if output_format == JSON:
+        return to_json({
+            "jql": jql,
+            "file": str(filepath),
+            "limit": limit,
+            "count": len(first_page),
+            "issues": [search_result_data(issue) for issue in first_page],
+        })
+    written = f"the first {limit} result(s) are" if limit else "all results are"
+    lines = [
+        f"First {len(first_page)} issue(s) shown; {written} being written to {filepath} "
+        "(the file appears once the export is complete).\n"
+    ]
+    for index, issue in enumerate(first_page, 1):
+        lines.extend(format_search_result(index, issue, field_names))
+    return "\n".join(lines)
+
+
+@_tool()
+def get_jira_issue(
+    issue_key: str,
+    use_cache: bool = True,
+    use_local_store: bool = False,
+    fields: str = "full",
+    expand: str = "",
+    comments_limit: int = 0,
+    comments_since: str = "",
+    output_format: str = "markdown",
+) -> str:
     """Get detailed information about a single Jira issue.
 
+    Repeat requests for the same issue are served from an in-process cache,
+    revalidated against the issue's updated timestamp once the entry expires.
+
     Args:
         issue_key: The Jira issue key (e.g. 'LAE-123')
+        use_cache: Set False to force a fresh fetch from Jira
+        use_local_store: Read the issue from the local mirror (see sync_local_store). Falls back to Jira if not mirrored
+        fields: Fields to fetch and show: a preset — 'minimal' (status, type, priority, assignee), 'triage'
+            (adds people, dates, versions, description, Resolution Path) or 'full' (default; adds comments, links,
+            attachments) — and/or field IDs or names, comma-separated (e.g. 'minimal, Resolution Path')
+        expand: Optional Jira expand list (e.g. 'renderedFields,changelog')
+        comments_limit: Only include the newest N comments. 0 (default) includes all comments — pages past
+            Jira's embedded limit are fetched, so long tickets stay complete
+        comments_since: Only include comments created at or after this date or ISO timestamp (e.g. '2026-02-01')
+        output_format: 'markdown' (default) or 'json' — compact JSON with ADF rendered as Markdown
     """
-    if not JIRA_BASE_URL or not JIRA_API_TOKEN:
+    if output_format not in OUTPUT_FORMATS:
+        return _unknown_format(output_format)
+
+    data = None
+    if use_local_store:
+        try:
+            data = get_store().get_issue(issue_key)
+        except sqlite3.Error as e:
+            logger.warning("Local store lookup for %s failed: %s", issue_key, e)
+
+    if data is None and (not JIRA_BASE_URL or not JIRA_API_TOKEN):
         return "Error: Jira credentials not configured. Please set JIRA_BASE_URL, JIRA_EMAIL, and JIRA_API_TOKEN in .env"
 
     try:
-        data = _jira_get(f"issue/{issue_key}", params={
-            "fields": "summary,description,status,priority,assignee,reporter,created,updated,issuetype,project,labels,components,fixVersions,versions,comment,resolution,resolutiondate,issuelinks,attachment,customfield_12000,customfield_13981",
-        })
+        field_ids, field_names = _resolve_fields(fields or "full", ISSUE_REPORT_FIELDS, offline=data is not None)
+        since = parse_since(comments_since) if comments_since else None
+    except ValueError as e:
+        return f"Error: {e}"
+
+    from_store = data is not None
+    try:
+        if from_store:
+            data = _project_fields(data, field_ids)
+        else:
+            data = fetch_issue(issue_key, fields=",".join(field_ids), expand=expand, use_cache=use_cache)
+        if "comment" in data.get("fields", {}):
+            data = _select_comments(data, comments_limit, since, fetched=not from_store)
     except requests.HTTPError as e:
         return f"Jira API error: {e.response.status_code} — {e.response.text[:500]}"
     except requests.RequestException as e:
         return f"Connection error: {e}"
 
-    fields = data.get("fields", {})
-    key = data.get("key", issue_key)
+    return to_json(issue_data(data)) if output_format == JSON else format_issue(data, field_names)
 
-    assignee = fields.get("assignee")
-    reporter = fields.get("reporter")
-    desc = fields.get("description")
-    resolution = fields.get("resolution")
 
-    # Convert Atlassian Document Format to plain text
-    desc_text = _adf_to_text(desc) if desc else "No description"
+def _select_comments(data: dict, limit: int, since: datetime | None, fetched: bool) -> dict:
+    """Return a copy of the issue whose comment field holds the requested comments.
 
-    lines = [
-        f"# {key}: {fields.get('summary', '')}",
-        f"**URL:** {JIRA_BASE_URL}/browse/{key}",
-        f"**Type:** {fields.get('issuetype', {}).get('name', '')}",
-        f"**Status:** {fields.get('status', {}).get('name', '')}",
-        f"**Priority:** {fields.get('priority', {}).get('name', '')}",
-        f"**Resolution:** {resolution.get('name', 'Unresolved') if resolution else 'Unresolved'}",
-        f"**Resolution Date:** {fields.get('resolutiondate', 'N/A') or 'N/A'}",
-        f"**Project:** {fields.get('project', {}).get('name', '')} ({fields.get('project', {}).get('key', '')})",
-        f"**Assignee:** {assignee.get('displayName', 'Unassigned') if assignee else 'Unassigned'}",
-        f"**Reporter:** {reporter.get('displayName', 'Unknown') if reporter else 'Unknown'}",
-        f"**Created:** {fields.get('created', '')[:10]}",
-        f"**Updated:** {fields.get('updated', '')[:10]}",
-    ]
+    Jira embeds only the first comments of an issue; when more exist (or
+    only the newest/recent ones are wanted) they are paged from the
+    comment endpoint. Local-store issues hold every comment already.
+    """
+    embedded = data["fields"].get("comment") or {}
+    comments = embedded.get("comments", [])
+    total = max(embedded.get("total", 0), len(comments))
+    if fetched and (limit or since or total > len(comments)):
+        comments, total = fetch_comments(data["key"], newest=limit or None, since=since)
+    else:
+        if since:
+            comments = [c for c in comments if not is_before(c, since)]
+        if limit:
+            comments = comments[-limit:]
+    return {**data, "fields": {**data["fields"], "comment": {"comments": comments, "total": total}}}
+
+
+@_tool()
+def get_jira_issues(
+    issue_keys: list[str],
+    concurrency: int = 0,
+    fields: str = "full",
+    output_format: str = "markdown",
+) -> str:
+    """Get detailed information about many Jira issues in one call.
 
-    labels = fields.get("labels", [])
-    if labels:
-        lines.append(f"**Labels:** {', '.join(labels)}")
+    Keys are fetched in batches of 100 per request (batches run in parallel)
+    and each issue is formatted exactly as get_jira_issue formats it.
 
-    components = fields.get("components", [])
-    if components:
-        lines.append(f"**Components:** {', '.join(c.get('name', '') for c in components)}")
+    Args:
+        issue_keys: List of issue keys (e.g. ['LAE-123', 'LAE-124'])
+        concurrency: Number of batch requests to run in parallel. Leave as 0 to use JIRA_MAX_WORKERS from .env
+        fields: Preset ('minimal', 'triage', 'full') and/or field IDs or names, as for get_jira_issue
+        output_format: 'markdown' (default) or 'json' — {"issues": [...], "missing": [...]}
+    """
+    if output_format not in OUTPUT_FORMATS:
+        return _unknown_format(output_format)
+    if not JIRA_BASE_URL or not JIRA_API_TOKEN:
+        return "Error: Jira credentials not configured. Please set JIRA_BASE_URL, JIRA_EMAIL, and JIRA_API_TOKEN in .env"
 
-    fix_versions = fields.get("fixVersions", [])
-    if fix_versions:
-        lines.append(f"**Fix Versions:** {', '.join(v.get('name', '') for v in fix_versions)}")
-
-    affect_versions = fields.get("versions", [])
-    if affect_versions:
-        lines.append(f"**Affect Versions:** {', '.join(v.get('name', '') for v in affect_versions)}")
-
-    customer_commitment = fields.get("customfield_13981")
-    if customer_commitment:
-        values = [item.get("value", "") for item in customer_commitment if isinstance(item, dict)]
-        if values:
-            lines.append(f"**Customer Commitment:** {', '.join(values)}")
-
-    # Resolution Path (customfield_12000)
-    resolution_path = fields.get("customfield_12000")
-    if resolution_path:
-        resolution_path_text = _adf_to_text(resolution_path) if isinstance(resolution_path, dict) else str(resolution_path)
-        lines.append(f"\n## Resolution Path\n{resolution_path_text}")
-
-    lines.append(f"\n## Description\n{desc_text}")
-
-    # Include ALL comments
-    comments_data = fields.get("comment", {}).get("comments", [])
-    if comments_data:
-        lines.append(f"\n## Comments ({len(comments_data)} total)")
-        for c in comments_data:
-            author = c.get("author", {}).get("displayName", "Unknown")
-            created = c.get("created", "")[:16]
-            body = _adf_to_text(c.get("body")) if c.get("body") else ""
-            lines.append(f"\n**{author}** ({created}):\n{body}")
-
-    # Include linked issues with summary details
-    issue_links = fields.get("issuelinks", [])
-    if issue_links:
-        lines.append(f"\n## Linked Issues ({len(issue_links)})")
-        for link in issue_links:
-            link_type = link.get("type", {}).get("name", "Related")
-            if "outwardIssue" in link:
-                linked = link["outwardIssue"]
-                direction = link.get("type", {}).get("outward", "relates to")
-            elif "inwardIssue" in link:
-                linked = link["inwardIssue"]
-                direction = link.get("type", {}).get("inward", "relates to")
-            else:
-                continue
-            linked_key = linked.get("key", "")
-            linked_summary = linked.get("fields", {}).get("summary", "")
-            linked_status = linked.get("fields", {}).get("status", {}).get("name", "")
-            linked_type = linked.get("fields", {}).get("issuetype", {}).get("name", "")
-            lines.append(f"- **{linked_key}** ({linked_type} | {linked_status}) — {direction}")
-            lines.append(f"  {linked_summary}")
-
-    # Include attachments
-    attachments = fields.get("attachment", [])
-    if attachments:
-        lines.append(f"\n## Attachments ({len(attachments)})")
-        for att in attachments:
-            att_name = att.get("filename", "unknown")
-            att_size = att.get("size", 0)
-            att_author = att.get("author", {}).get("displayName", "Unknown")
-            att_created = att.get("created", "")[:10]
-            lines.append(f"- **{att_name}** ({att_size} bytes) — uploaded by {att_author} on {att_created}")
+    requested = list(dict.fromkeys(k.strip().upper() for k in issue_keys if k.strip()))
+    if not requested:
+        return "Error: No issue keys provided"
 
-    return "\n".join(lines)
+    try:
+        field_ids, field_names = _resolve_fields(fields or "full", ISSUE_REPORT_FIELDS)
+    except ValueError as e:
+        return f"Error: {e}"
 
+    try:
+        issues = fetch_issues(requested, fields=",".join(field_ids), max_workers=concurrency)
+    except requests.HTTPError as e:
+        return f"Jira API error: {e.response.status_code} — {e.response.text[:500]}"
+    except requests.RequestException as e:
+        return f"Connection error: {e}"
 
-def _adf_to_text(node: dict | list | None) -> str:
-    """Convert Atlassian Document Format (ADF) to plain text."""
-    if node is None:
-        return ""
-    if isinstance(node, list):
-        return "".join(_adf_to_text(n) for n in node)
-    if isinstance(node, str):
-        return node
-    if not isinstance(node, dict):
-        return str(node)
-
-    node_type = node.get("type", "")
-    text = node.get("text", "")
-    content = node.get("content", [])
-
-    if node_type == "mention":
-        attrs = node.get("attrs", {})
-        return attrs.get("text", "")
-    if text:
-        return text
-    if node_type == "hardBreak":
-        return "\n"
-    if node_type in ("paragraph", "heading"):
-        return _adf_to_text(content) + "\n"
-    if node_type == "bulletList":
-        items = []
-        for item in content:
-            items.append("- " + _adf_to_text(item.get("content", [])).strip())
-        return "\n".join(items) + "\n"
-    if node_type == "orderedList":
-        items = []
-        for i, item in enumerate(content, 1):
-            items.append(f"{i}. " + _adf_to_text(item.get("content", [])).strip())
-        return "\n".join(items) + "\n"
-    if node_type == "codeBlock":
-        code = _adf_to_text(content)
-        return f"```\n{code}```\n"
-
-    return _adf_to_text(content)
-
-
-@mcp.tool()
+    found = [key for key in requested if key in issues]
+    missing = [key for key in requested if key not in issues]
+    if output_format == JSON:
+        return to_json({"issues": [issue_data(issues[key]) for key in found], "missing": missing})
+    sections = [f"Found {len(found)} of {len(requested)} issue(s)."]
+    if missing:
+        sections[0] += f" Not found or not accessible: {', '.join(missing)}"
+    sections.extend(format_issue(issues[key], field_names) for key in found)
+    return "\n\n---\n\n".join(sections)
+
+
+@_tool()
 def create_jira_issue(
     project_key: str,
     summary: str,
@@ -318,6 +491,35 @@ def create_jira_issue(
     if not JIRA_BASE_URL or not JIRA_API_TOKEN:
         return "Error: Jira credentials not configured. Please set JIRA_BASE_URL, JIRA_EMAIL, and JIRA_API_TOKEN in .env"
 
+    fields = _build_create_fields(
+        project_key, summary, issue_type, description, priority, assignee_id,
+        labels, fix_versions, affect_versions, custom_fields,
+    )
+
+    try:
+        data = _jira_post("issue", {"fields": fields})
+    except requests.HTTPError as e:
+        return f"Jira API error: {e.response.status_code} — {e.response.text[:500]}"
+    except requests.RequestException as e:
+        return f"Connection error: {e}"
+
+    new_key = data.get("key", "")
+    return f"Issue created: **{new_key}** — {JIRA_BASE_URL}/browse/{new_key}"
+
+
+def _build_create_fields(
+    project_key: str,
+    summary: str,
+    issue_type: str = "Task",
+    description: str = "",
+    priority: str = "",
+    assignee_id: str = "",
+    labels: list[str] | None = None,
+    fix_versions: list[str] | None = None,
+    affect_versions: list[str] | None = None,
+    custom_fields: dict | None = None,
+) -> dict:
+    """Build the fields payload for creating an issue (shared by the single and bulk tools)."""
     fields: dict = {
         "project": {"key": project_key},
         "summary": summary,
@@ -343,19 +545,94 @@ def create_jira_issue(
         fields["versions"] = [{"name": v} for v in affect_versions]
     if custom_fields:
         fields.update(custom_fields)
+    return fields
 
-    try:
-        data = _jira_post("issue", {"fields": fields})
-    except requests.HTTPError as e:
-        return f"Jira API error: {e.response.status_code} — {e.response.text[:500]}"
-    except requests.RequestException as e:
-        return f"Connection error: {e}"
 
-    new_key = data.get("key", "")
-    return f"Issue created: **{new_key}** — {JIRA_BASE_URL}/browse/{new_key}"
+# Jira's issue/bulk endpoint accepts at most 50 issues per request
+_BULK_CREATE_BATCH = 50
+
+
+@_tool()
+def create_jira_issues(issues: list[dict], concurrency: int = 0) -> str:
+    """Create many Jira issues using the bulk create endpoint (50 issues per request).
+
+    Args:
+        issues: List of issues to create. Each item takes the same keys as create_jira_issue:
+            project_key and summary (required), issue_type, description, priority, assignee_id,
+            labels, fix_versions, affect_versions, custom_fields
+        concurrency: Number of bulk requests to run in parallel. Leave as 0 to use JIRA_MAX_WORKERS from .env
+    """
+    if not JIRA_BASE_URL or not JIRA_API_TOKEN:
+        return "Error: Jira credentials not configured. Please set JIRA_BASE_URL, JIRA_EMAIL, and JIRA_API_TOKEN in .env"
+    if not issues:
+        return "Error: No issues provided"
+
+    # outcome[i] = (succeeded, key or error message)
+    outcome: list[tuple[bool, str] | None] = [None] * len(issues)
+    payloads = []
+    for index, item in enumerate(issues):
+        try:
+            payloads.append((index, {"fields": _build_create_fields(**item)}))
+        except TypeError as e:
+            outcome[index] = (False, _invalid_item(e))
+
+    for index, result in _bulk_create(payloads, concurrency).items():
+        outcome[index] = result
+
+    rows = [
+        (issues[i].get("summary", "") if isinstance(issues[i], dict) else "", result)
+        for i, result in enumerate(outcome)
+    ]
+    created_count = sum(1 for _, (ok, _) in rows if ok)
+    lines = [
+        f"Created {created_count} of {len(issues)} issue(s).\n",
+        "| # | Summary | Result | Key / Error |",
+        "| --- | --- | --- | --- |",
+    ]
+    for i, (summary, (ok, detail)) in enumerate(rows, 1):
+        detail = f"[{detail}]({JIRA_BASE_URL}/browse/{detail})" if ok else detail
+        lines.append(f"| {i} | {_table_cell(summary)} | {'Created' if ok else 'Failed'} | {_table_cell(detail)} |")
+    return "\n".join(lines)
+
+
+def _bulk_create(payloads: list[tuple[int, dict]], concurrency: int = 0) -> dict[int, tuple[bool, str]]:
+    """POST ``(index, {"fields": ...})`` payloads to issue/bulk in concurrent batches.
+
+    Returns ``index -> (succeeded, new key or error message)`` for every payload.
+    """
+    outcome: dict[int, tuple[bool, str]] = {}
+    batches = [payloads[i:i + _BULK_CREATE_BATCH] for i in range(0, len(payloads), _BULK_CREATE_BATCH)]
+    results = map_concurrent(
+        lambda batch: _jira_post("issue/bulk", {"issueUpdates": [payload for _, payload in batch]}),
+        batches,
+        max_workers=concurrency,
+    )
+    for batch, (data, error) in zip(batches, results):
+        if error is not None:
+            message = _describe_error(error)
+            for index, _ in batch:
+                outcome[index] = (False, message)
+            continue
+
+        failed = {}
+        for err in data.get("errors", []):
+            element_errors = err.get("elementErrors", {})
+            details = list(element_errors.get("errorMessages", [])) + [
+                f"{field}: {msg}" for field, msg in element_errors.get("errors", {}).items()
+            ]
+            failed[err.get("failedElementNumber")] = "; ".join(details) or f"HTTP {err.get('status', '?')}"
+        # Created issues are returned in request order, skipping failed elements
+        created = iter(data.get("issues", []))
+        for position, (index, _) in enumerate(batch):
+            if position in failed:
+                outcome[index] = (False, failed[position])
+            else:
+                new_issue = next(created, None)
+                outcome[index] = (True, new_issue["key"]) if new_issue else (False, "No issue returned")
+    return outcome
 
 
-@mcp.tool()
+@_tool()
 def update_jira_issue(
     issue_key: str,
     summary: str = "",
@@ -392,7 +669,46 @@ def update_jira_issue(
     if not JIRA_BASE_URL or not JIRA_API_TOKEN:
         return "Error: Jira credentials not configured. Please set JIRA_BASE_URL, JIRA_EMAIL, and JIRA_API_TOKEN in .env"
 
+    try:
+        results, _ = _apply_issue_update(
+            issue_key, summary, description, status, priority, assignee_id, reporter_id,
+            labels, fix_versions, affect_versions, comment, custom_fields,
+        )
+    except _FieldUpdateError as e:
+        return str(e)
+
+    if not results:
+        return f"No changes specified for {issue_key}."
+
+    return f"**{issue_key}** updated — {JIRA_BASE_URL}/browse/{issue_key}\n" + "\n".join(f"- {r}" for r in results)
+
+
+class _FieldUpdateError(Exception):
+    """The field PUT of an issue update failed; later steps were skipped."""
+
+
+def _apply_issue_update(
+    issue_key: str,
+    summary: str = "",
+    description: str = "",
+    status: str = "",
+    priority: str = "",
+    assignee_id: str = "",
+    reporter_id: str = "",
+    labels: list[str] | None = None,
+    fix_versions: list[str] | None = None,
+    affect_versions: list[str] | None = None,
+    comment: str = "",
+    custom_fields: dict | None = None,
+) -> tuple[list[str], int]:
+    """Apply field, status and comment changes to one issue.
+
+    Returns:
+        (result lines, number of failed steps). Raises _FieldUpdateError if
+        the field update itself fails, since nothing else is attempted then.
+    """
     results = []
+    failures = 0
 
     # Build fields payload
     fields: dict = {}
@@ -425,29 +741,26 @@ def update_jira_issue(
             _jira_put(f"issue/{issue_key}", {"fields": fields})
             results.append(f"Fields updated: {', '.join(fields.keys())}")
         except requests.HTTPError as e:
-            return f"Jira API error updating fields: {e.response.status_code} — {e.response.text[:500]}"
+            raise _FieldUpdateError(f"Jira API error updating fields: {e.response.status_code} — {e.response.text[:500]}") from e
         except requests.RequestException as e:
-            return f"Connection error: {e}"
+            raise _FieldUpdateError(f"Connection error: {e}") from e
 
     # Transition status if requested
     if status:
         try:
-            transitions = _jira_get(f"issue/{issue_key}/transitions")
-            match = next(
-                (t for t in transitions.get("transitions", [])
-                 if t["name"].lower() == status.lower() or t["to"]["name"].lower() == status.lower()),
-                None,
-            )
-            if match:
-                _jira_post(f"issue/{issue_key}/transitions", {"transition": {"id": match["id"]}})
+            transitioned, transitions = transition_issue(issue_key, status)
+            if transitioned:
                 results.append(f"Status transitioned to: {status}")
             else:
-                available = [t["name"] for t in transitions.get("transitions", [])]
+                available = [t["name"] for t in transitions]
                 results.append(f"Status '{status}' not available. Available transitions: {', '.join(available)}")
+                failures += 1
         except requests.HTTPError as e:
             results.append(f"Error transitioning status: {e.response.status_code} — {e.response.text[:500]}")
+            failures += 1
         except requests.RequestException as e:
             results.append(f"Connection error during transition: {e}")
+            failures += 1
 
     # Add comment if requested
     if comment:
@@ -463,60 +776,110 @@ def update_jira_issue(
             results.append("Comment added")
         except requests.HTTPError as e:
             results.append(f"Error adding comment: {e.response.status_code} — {e.response.text[:500]}")
+            failures += 1
         except requests.RequestException as e:
             results.append(f"Connection error adding comment: {e}")
+            failures += 1
 
-    if not results:
-        return f"No changes specified for {issue_key}."
+    if results:
+        invalidate_issue(issue_key)
+    return results, failures
 
-    return f"**{issue_key}** updated — {JIRA_BASE_URL}/browse/{issue_key}\n" + "\n".join(f"- {r}" for r in results)
 
+@_tool()
+def update_jira_issues(updates: list[dict], concurrency: int = 0) -> str:
+    """Update many Jira issues in parallel.
 
-@mcp.tool()
-def copy_jira_issue(
-    source_issue_key: str,
+    Each update runs the same steps as update_jira_issue (field update, status
+    transition, comment) on a bounded worker pool.
+
+    Args:
+        updates: List of updates. Each item takes the same keys as update_jira_issue: issue_key (required),
+            summary, description, status, priority, assignee_id, reporter_id, labels, fix_versions,
+            affect_versions, comment, custom_fields
+        concurrency: Number of issues to update in parallel. Leave as 0 to use JIRA_MAX_WORKERS from .env
+    """
+    if not JIRA_BASE_URL or not JIRA_API_TOKEN:
+        return "Error: Jira credentials not configured. Please set JIRA_BASE_URL, JIRA_EMAIL, and JIRA_API_TOKEN in .env"
+    if not updates:
+        return "Error: No updates provided"
+
+    def run(item: dict) -> tuple[bool, str]:
+        if not isinstance(item, dict) or not item.get("issue_key"):
+            return False, "Invalid item: issue_key is required"
+        try:
+            results, failures = _apply_issue_update(**item)
+        except TypeError as e:
+            return False, _invalid_item(e)
+        except _FieldUpdateError as e:
+            return False, str(e)
+        if not results:
+            return False, "No changes specified"
+        return failures == 0, "; ".join(results)
+
+    outcomes = map_concurrent(run, updates, max_workers=concurrency)
+    rows = []
+    for item, (result, error) in zip(updates, outcomes):
+        key = item.get("issue_key", "") if isinstance(item, dict) else ""
+        rows.append((key, result if error is None else (False, _describe_error(error))))
+
+    succeeded = sum(1 for _, (ok, _) in rows if ok)
+    lines = [
+        f"Updated {succeeded} of {len(updates)} issue(s).\n",
+        "| # | Key | Result | Details |",
+        "| --- | --- | --- | --- |",
+    ]
+    for i, (key, (ok, detail)) in enumerate(rows, 1):
+        lines.append(f"| {i} | {key} | {'Updated' if ok else 'Failed'} | {_table_cell(detail)} |")
+    return "\n".join(lines)
+
+
+def _describe_error(error: Exception) -> str:
+    """Format an exception from a Jira call the way the tools report errors."""
+    if isinstance(error, requests.HTTPError) and error.response is not None:
+        return f"Jira API error: {error.response.status_code} — {error.response.text[:500]}"
+    if isinstance(error, requests.RequestException):
+        return f"Connection error: {error}"
+    return f"{type(error).__name__}: {error}"
+
+
+def _invalid_item(error: TypeError) -> str:
+    """Describe a bulk item whose keys don't match the tool's arguments."""
+    # "func() got an unexpected keyword argument 'x'" -> "got an unexpected keyword argument 'x'"
+    return f"Invalid item: {str(error).split('() ', 1)[-1]}"
+
+
+def _table_cell(value: str) -> str:
+    """Make a value safe for a single Markdown table cell."""
+    return str(value).replace("|", "\\|").replace("\n", " ")
+
+
+def _build_copy_fields(
+    source: dict,
     target_project_key: str = "",
     summary_override: str = "",
     description_override: str = "",
     issue_type_override: str = "",
     custom_fields: dict | None = None,
-) -> str:
-    """Copy (clone) an existing Jira issue into a new issue.
+    summary_prefix: str = "[Copy] ",
+) -> tuple[dict, list[str]]:
+    """Build the create payload for a copy of ``source``.
 
-    Fetches the source issue and creates a new issue with the same fields.
-    Optionally override the target project, summary, description, or issue type.
-    Custom fields from the source are automatically carried over. Use custom_fields to override or add additional custom fields.
+    Fields copied from the source are filtered against createmeta for the
+    target project and issue type, so fields that are not on the create
+    screen (or are Jira-managed) never reach the POST. Explicit
+    ``custom_fields`` overrides are always sent.
 
-    Args:
-        source_issue_key: The issue key to copy from (e.g. 'LAE-123')
-        target_project_key: Target project key. Leave empty to use same project as source
-        summary_override: Override the summary. Leave empty to copy original (prefixed with '[Copy] ')
-        description_override: Override the description. Leave empty to copy original
-        issue_type_override: Override the issue type. Leave empty to copy original
-        custom_fields: Dictionary of custom field IDs to values (e.g. {"customfield_10100": "value"}). Overrides source custom fields if same key. Values are passed directly to the Jira API.
+    Returns:
+        (fields, IDs of source fields that were dropped)
     """
-    if not JIRA_BASE_URL or not JIRA_API_TOKEN:
-        return "Error: Jira credentials not configured. Please set JIRA_BASE_URL, JIRA_EMAIL, and JIRA_API_TOKEN in .env"
-
-    # Fetch source issue (include all fields to capture custom fields)
-    try:
-        source = _jira_get(f"issue/{source_issue_key}")
-    except requests.HTTPError as e:
-        return f"Error fetching source issue: {e.response.status_code} — {e.response.text[:500]}"
-    except requests.RequestException as e:
-        return f"Connection error: {e}"
-
     src_fields = source.get("fields", {})
 
     project_key = target_project_key or src_fields.get("project", {}).get("key", "")
-    summary = summary_override or f"[Copy] {src_fields.get('summary', '')}"
+    summary = summary_override or f"{summary_prefix}{src_fields.get('summary', '')}"
     issue_type = issue_type_override or src_fields.get("issuetype", {}).get("name", "Task")
 
-    fields: dict = {
-        "project": {"key": project_key},
-        "summary": summary,
-        "issuetype": {"name": issue_type},
-    }
+    fields: dict = {"summary": summary}
 
     # Copy description (already in ADF) or use override
     if description_override:
@@ -544,88 +907,240 @@ def copy_jira_issue(
     if fix_versions:
         fields["fixVersions"] = [{"name": v.get("name", "")} for v in fix_versions]
 
-    # Carry over custom fields from source (customfield_XXXXX)
-    # Skip fields that are read-only or cause errors during creation
-    _SKIP_CUSTOM_FIELDS = {
-        "customfield_10007",  # Rank (Lexorank — causes rankBeforeIssue/rankAfterIssue errors)
-        "customfield_10019",  # Rank (alternate ID in some Jira instances)
-        "customfield_10016",  # Sprint (managed by board)
-    }
+    # Carry over custom fields from source (customfield_XXXXX), skipping
+    # types Jira manages itself (rank, sprint, request type, SLA...) by schema
+    registry = get_field_registry()
+    try:
+        registry.fields()
+        have_metadata = True
+    except requests.RequestException as e:
+        logger.warning("Field metadata unavailable, copying all custom fields: %s", e)
+        have_metadata = False
     for key, value in src_fields.items():
         if not key.startswith("customfield_") or value is None:
             continue
-        if key in _SKIP_CUSTOM_FIELDS:
-            continue
-        # Skip complex objects that are likely read-only (e.g., requestType, SLA)
-        if isinstance(value, dict) and "requestType" in str(value):
+        if have_metadata and not registry.is_copyable(key):
             continue
         fields[key] = value
 
+    # Keep only what the target create screen accepts. An empty createmeta
+    # means the issue type is missing from the project; Jira reports that itself.
+    dropped = []
+    try:
+        creatable = registry.creatable_fields(project_key, issue_type)
+    except requests.RequestException as e:
+        logger.warning("Createmeta unavailable for %s/%s, sending all fields: %s", project_key, issue_type, e)
+        creatable = set()
+    if creatable:
+        dropped = sorted(k for k in fields if k not in creatable)
+        for key in dropped:
+            del fields[key]
+        if dropped:
+            logger.info("Copy of %s: skipped fields not on the create screen: %s", source.get("key"), dropped)
+
+    fields["project"] = {"key": project_key}
+    fields["issuetype"] = {"name": issue_type}
+
     # Apply custom field overrides (these take priority over source values)
     if custom_fields:
         fields.update(custom_fields)
+    return fields, dropped
 
-    # Attempt creation — if it fails due to invalid fields, strip them and retry
-    max_retries = 3
-    data = None
-    for attempt in range(max_retries):
-        try:
-            data = _jira_post("issue", {"fields": fields})
-            break
-        except requests.HTTPError as e:
-            if e.response.status_code == 400 and attempt < max_retries - 1:
-                try:
-                    err = e.response.json()
-                    bad_fields = list(err.get("errors", {}).keys())
-                    if bad_fields:
-                        for bf in bad_fields:
-                            # Remove by error key (e.g. "rankBeforeIssue")
-                            fields.pop(bf, None)
-                            # Also remove any customfield_ that might map to this error
-                            to_remove = [k for k in fields if k.startswith("customfield_") and bf.lower() in str(fields[k]).lower()]
-                            for k in to_remove:
-                                fields.pop(k, None)
-                        logger.info(f"Copy retry {attempt + 1}: removed fields {bad_fields}")
-                        continue
-                except (ValueError, KeyError):
-                    pass
-            return f"Jira API error: {e.response.status_code} — {e.response.text[:500]}"
-        except requests.RequestException as e:
-            return f"Connection error: {e}"
 
-    if data is None:
-        return f"Error: Failed to create copy of {source_issue_key} after {max_retries} retries"
+@_tool()
+def copy_jira_issue(
+    source_issue_key: str,
+    target_project_key: str = "",
+    summary_override: str = "",
+    description_override: str = "",
+    issue_type_override: str = "",
+    custom_fields: dict | None = None,
+) -> str:
+    """Copy (clone) an existing Jira issue into a new issue.
+
+    Fetches the source issue and creates a new issue with the same fields.
+    Optionally override the target project, summary, description, or issue type.
+    Custom fields from the source are automatically carried over when the target create screen accepts them.
+    Use custom_fields to override or add additional custom fields.
+
+    Args:
+        source_issue_key: The issue key to copy from (e.g. 'LAE-123')
+        target_project_key: Target project key. Leave empty to use same project as source
+        summary_override: Override the summary. Leave empty to copy original (prefixed with '[Copy] ')
+        description_override: Override the description. Leave empty to copy original
+        issue_type_override: Override the issue type. Leave empty to copy original
+        custom_fields: Dictionary of custom field IDs to values (e.g. {"customfield_10100": "value"}). Overrides source custom fields if same key. Values are passed directly to the Jira API.
+    """
+    if not JIRA_BASE_URL or not JIRA_API_TOKEN:
+        return "Error: Jira credentials not configured. Please set JIRA_BASE_URL, JIRA_EMAIL, and JIRA_API_TOKEN in .env"
+
+    # Fetch source issue (include all fields to capture custom fields)
+    try:
+        source = fetch_issue(source_issue_key)
+    except requests.HTTPError as e:
+        return f"Error fetching source issue: {e.response.status_code} — {e.response.text[:500]}"
+    except requests.RequestException as e:
+        return f"Connection error: {e}"
+
+    fields, dropped = _build_copy_fields(
+        source, target_project_key, summary_override, description_override, issue_type_override, custom_fields,
+    )
+    try:
+        data = _jira_post("issue", {"fields": fields})
+    except requests.HTTPError as e:
+        return f"Jira API error: {e.response.status_code} — {e.response.text[:500]}"
+    except requests.RequestException as e:
+        return f"Connection error: {e}"
 
     new_key = data.get("key", "")
-    return f"Issue copied: **{source_issue_key}** → **{new_key}** — {JIRA_BASE_URL}/browse/{new_key}"
+    invalidate_issue(source_issue_key, new_key)
+    result = f"Issue copied: **{source_issue_key}** → **{new_key}** — {JIRA_BASE_URL}/browse/{new_key}"
+    if dropped:
+        result += f"\nSkipped field(s) not on the target create screen: {', '.join(dropped)}"
+    return result
+
+
+@_tool()
+def copy_jira_issues(
+    source_issue_keys: list[str] | None = None,
+    epic_key: str = "",
+    target_project_key: str = "",
+    summary_prefix: str = "[Copy] ",
+    copy_links: bool = True,
+    concurrency: int = 0,
+) -> str:
+    """Copy many Jira issues at once, or an epic together with its child issues.
 
+    Sources are fetched in bulk and created through the bulk create endpoint.
+    A copied child is attached to the copy of its parent; links between two
+    copied issues are re-created between their copies.
 
-@mcp.tool()
-def get_custom_fields(search: str = "") -> str:
+    Args:
+        source_issue_keys: Issue keys to copy (e.g. ['LAE-1', 'LAE-2'])
+        epic_key: Epic (or any parent) to copy together with all of its child issues
+        target_project_key: Target project key. Leave empty to keep each issue's project
+        summary_prefix: Prefix for copied summaries. Default '[Copy] '
+        copy_links: Re-create issue links whose both ends were copied
+        concurrency: Number of requests to run in parallel. Leave as 0 to use JIRA_MAX_WORKERS from .env
+    """
+    if not JIRA_BASE_URL or not JIRA_API_TOKEN:
+        return "Error: Jira credentials not configured. Please set JIRA_BASE_URL, JIRA_EMAIL, and JIRA_API_TOKEN in .env"
+
+    keys = [k.strip().upper() for k in source_issue_keys or [] if k.strip()]
+    try:
+        if epic_key:
+            epic_key = epic_key.strip().upper()
+            keys = [epic_key] + keys + [issue["key"] for issue in iter_issues(f"parent = {epic_key}", ["key"])]
+        keys = list(dict.fromkeys(keys))
+        if not keys:
+            return "Error: No issues to copy. Provide source_issue_keys or epic_key"
+        sources = fetch_issues(keys, "*all", max_workers=concurrency)
+    except requests.HTTPError as e:
+        return f"Error fetching source issues: {e.response.status_code} — {e.response.text[:500]}"
+    except requests.RequestException as e:
+        return f"Connection error: {e}"
+
+    # outcome[key] = (succeeded, new key or error message)
+    outcome: dict[str, tuple[bool, str]] = {k: (False, "Not found") for k in keys if k not in sources}
+    payloads: dict[str, dict] = {}
+    parents: dict[str, str] = {}
+    for key, source in sources.items():
+        fields, _ = _build_copy_fields(source, target_project_key, summary_prefix=summary_prefix)
+        payloads[key] = fields
+        parent = (source["fields"].get("parent") or {}).get("key")
+        if parent in sources:
+            parents[key] = parent
+
+    # Create in waves so that a parent's copy exists before its children
+    pending = set(payloads)
+    while pending:
+        wave = [k for k in payloads if k in pending and parents.get(k) not in pending]
+        if not wave:
+            break
+        pending.difference_update(wave)
+        batch_keys, batch = [], []
+        for key in wave:
+            fields = payloads[key]
+            parent = parents.get(key)
+            if parent:
+                parent_ok, parent_copy = outcome[parent]
+                if not parent_ok:
+                    outcome[key] = (False, f"Parent {parent} was not copied")
+                    continue
+                fields["parent"] = {"key": parent_copy}
+            batch.append((len(batch_keys), {"fields": fields}))
+            batch_keys.append(key)
+        for index, result in _bulk_create(batch, concurrency).items():
+            outcome[batch_keys[index]] = result
+
+    copies = {key: new_key for key, (ok, new_key) in outcome.items() if ok}
+    link_requests = []
+    if copy_links:
+        # Every link appears on both issues; take it from the side where it is outward.
+        # The POST body mirrors the GET view: inwardIssue is the issue holding the outward link.
+        for key, source in sources.items():
+            for link in source["fields"].get("issuelinks") or []:
+                other = (link.get("outwardIssue") or {}).get("key")
+                if key in copies and other in copies:
+                    link_requests.append({
+                        "type": {"name": (link.get("type") or {}).get("name", "")},
+                        "inwardIssue": {"key": copies[key]},
+                        "outwardIssue": {"key": copies[other]},
+                    })
+    link_results = map_concurrent(lambda body: _jira_post("issueLink", body), link_requests, max_workers=concurrency)
+    link_errors = [
+        f"{body['inwardIssue']['key']} → {body['outwardIssue']['key']} ({body['type']['name']}): {_describe_error(error)}"
+        for body, (_, error) in zip(link_requests, link_results) if error is not None
+    ]
+
+    lines = [
+        f"Copied {len(copies)} of {len(keys)} issue(s).\n",
+        "| # | Source | Result | Copy / Error |",
+        "| --- | --- | --- | --- |",
+    ]
+    for i, key in enumerate(keys, 1):
+        ok, detail = outcome.get(key, (False, "Not created"))
+        detail = f"[{detail}]({JIRA_BASE_URL}/browse/{detail})" if ok else detail
+        lines.append(f"| {i} | {key} | {'Copied' if ok else 'Failed'} | {_table_cell(detail)} |")
+    if link_requests:
+        lines.append(f"\nRe-created {len(link_requests) - len(link_errors)} of {len(link_requests)} link(s).")
+        lines.extend(f"- Failed link {error}" for error in link_errors)
+    return "\n".join(lines)
+
+
+@_tool()
+def get_custom_fields(search: str = "", refresh: bool = False, output_format: str = "markdown") -> str:
     """List available Jira custom fields and their IDs.
 
+    Field metadata is loaded once and cached (in memory and on disk) for JIRA_FIELD_CACHE_TTL seconds.
+
     Args:
         search: Optional search string to filter fields by name (case-insensitive). Leave empty to list all custom fields.
+        refresh: Reload the field list from Jira instead of using the cache
+        output_format: 'markdown' (default) or 'json' — [{"id", "name", "type"}, ...]
     """
+    if output_format not in OUTPUT_FORMATS:
+        return _unknown_format(output_format)
     if not JIRA_BASE_URL or not JIRA_API_TOKEN:
         return "Error: Jira credentials not configured. Please set JIRA_BASE_URL, JIRA_EMAIL, and JIRA_API_TOKEN in .env"
 
+    registry = get_field_registry()
     try:
-        all_fields = _jira_get("field")
+        registry.fields(refresh=refresh)
     except requests.HTTPError as e:
         return f"Jira API error: {e.response.status_code} — {e.response.text[:500]}"
     except requests.RequestException as e:
         return f"Connection error: {e}"
 
-    custom = [f for f in all_fields if f.get("custom", False)]
-    if search:
-        search_lower = search.lower()
-        custom = [f for f in custom if search_lower in f.get("name", "").lower()]
-
+    custom = registry.find(search, custom_only=True)
+    if output_format == JSON:
+        return to_json([
+            {"id": f.get("id", ""), "name": f.get("name", ""), "type": f.get("schema", {}).get("type", "unknown")}
+            for f in custom
+        ])
     if not custom:
         return f"No custom fields found matching '{search}'" if search else "No custom fields found"
 
-    custom.sort(key=lambda f: f.get("name", ""))
     lines = [f"Found {len(custom)} custom field(s):\n"]
     for f in custom:
         lines.append(f"- **{f.get('name', '')}** — `{f.get('id', '')}` (type: {f.get('schema', {}).get('type', 'unknown')})")
@@ -633,7 +1148,7 @@ def get_custom_fields(search: str = "") -> str:
     return "\n".join(lines)
 
 
-@mcp.tool()
+@_tool()
 def log_work_on_issue(
     issue_key: str,
     time_spent: str,
@@ -678,6 +1193,8 @@ def log_work_on_issue(
     except requests.RequestException as e:
         return f"Connection error: {e}"
 
+    invalidate_issue(issue_key)
+
     worklog_id = data.get("id", "")
     time_logged = data.get("timeSpent", time_spent)
     author = data.get("author", {}).get("displayName", "")
@@ -692,109 +1209,206 @@ def log_work_on_issue(
     )
 
 
-@mcp.tool()
-def get_worklogs_by_date(start_date: str, end_date: str, assignee_names: list[str] | None = None, projects: list[str] | None = None) -> str:
-    """Get work logs for a date range, optionally filtered by assignee names and projects.
+@_tool()
+async def get_worklogs_by_date(
+    start_date: str,
+    end_date: str,
+    assignee_names: list[str] | None = None,
+    projects: list[str] | None = None,
+    concurrency: int = 0,
+    mode: str = "issues",
+    group_by: str = "",
+    sort_by: str = "",
+    pivot: bool = False,
+    output_format: str = "markdown",
+) -> str:
+    """Get work logs for a date range, optionally filtered by assignee names and projects, with totals.
+
+    Without group_by, lists each worklog by date and person with per-person, per-day and overall totals.
+    With group_by, returns only the aggregated time per group (e.g. 'person,week' for a weekly timesheet).
 
     Args:
         start_date: Start date in YYYY-MM-DD format (e.g., '2026-02-20')
         end_date: End date in YYYY-MM-DD format (e.g., '2026-02-23')
         assignee_names: Optional list of assignee names to filter by (e.g., ['Abdul Ghani', 'Samra Ejaz'])
         projects: Optional list of project keys to search in (default: ['LAE', 'NCS'])
+        concurrency: Number of worklog requests to run in parallel. Leave as 0 to use JIRA_MAX_WORKERS from .env
+        mode: 'issues' (default) finds issues with work logged in the range and reads each issue's worklogs.
+            'worklogs' uses the bulk worklog/updated + worklog/list endpoints to fetch only worklogs changed
+            since start_date — much less data on large projects, but misses worklogs logged before start_date
+            for dates inside the range.
+        group_by: Comma-separated dimensions to total by: person, day, week, ticket, project (e.g. 'person,week')
+        sort_by: 'time' or 'count' (largest first) or one of the group_by dimensions; prefix '-' to reverse.
+            Default: by the group_by dimensions in order
+        pivot: With exactly two group_by dimensions, show a Markdown grid with the second dimension as
+            columns (e.g. group_by='person,day' gives one row per person and one column per day)
+        output_format: 'markdown' (default) or 'json' — a flat list of {"issue", "author", "date",
+            "time_spent", "seconds"} records, or {"group": {...}, "seconds", "time_spent", "worklogs"} groups
+            with group_by, plus total_seconds and any issues that failed
     """
+    if output_format not in OUTPUT_FORMATS:
+        return _unknown_format(output_format)
     if not JIRA_BASE_URL or not JIRA_API_TOKEN:
         return "Error: Jira credentials not configured. Please set JIRA_BASE_URL, JIRA_EMAIL, and JIRA_API_TOKEN in .env"
 
     if projects is None:
         projects = ["LAE", "NCS"]
-
     try:
-        # Search for issues updated in the date range
-        payload = {
-            "jql": f"project in ({', '.join(projects)}) AND updated >= {start_date} AND updated <= {end_date} ORDER BY updated DESC",
-            "maxResults": 500,
-            "fields": ["key"]
-        }
-        search_data = _jira_post("search/jql", payload)
-        issues = search_data.get("issues", [])
-    except requests.HTTPError as e:
-        return f"Jira API error searching issues: {e.response.status_code} — {e.response.text[:500]}"
-    except requests.RequestException as e:
-        return f"Connection error: {e}"
-
-    if not issues:
-        return f"No issues found updated between {start_date} and {end_date}"
-
-    worklogs_by_person = {}
-    worklogs_by_date = {}
-
-    # Fetch worklogs for each issue
-    for issue in issues:
-        key = issue["key"]
+        date_window(start_date, end_date)
+    except ValueError:
+        return "Error: start_date and end_date must be in YYYY-MM-DD format"
+    if mode not in ("issues", "worklogs"):
+        return f"Error: Unknown mode '{mode}'. Use 'issues' or 'worklogs'."
+    dimensions = [d.strip().lower() for d in group_by.split(",") if d.strip()]
+    try:
+        # Validate grouping up front rather than after the fetch
+        WorklogTable().group(dimensions, sort_by)
+    except ValueError as e:
+        return f"Error: {e}"
+    if pivot and len(dimensions) != 2:
+        return "Error: pivot needs exactly two group_by dimensions (e.g. group_by='person,day')"
+
+    # Issues whose worklogs could not be fetched even after retries
+    failed: list[str] = []
+    if mode == "worklogs":
         try:
-            worklog_data = _jira_get(f"issue/{key}/worklog")
-            worklogs = worklog_data.get("worklogs", [])
-
-            for log in worklogs:
-                author = log.get("author", {}).get("displayName", "Unknown")
-                started = log.get("started", "")[:10]
+            entries = await asyncio.to_thread(
+                fetch_worklogs_in_window, start_date, end_date, projects, max_workers=concurrency
+            )
+        except requests.HTTPError as e:
+            return f"Jira API error fetching worklogs: {e.response.status_code} — {e.response.text[:500]}"
+        except requests.RequestException as e:
+            return f"Connection error: {e}"
+    else:
+        try:
+            # Search for issues with work logged in the date range (all pages)
+            project_list = ", ".join(projects)
+            jql = f'project in ({project_list}) AND worklogDate >= "{start_date}" AND worklogDate <= "{end_date}" ORDER BY updated DESC'
+            issues = await asyncio.to_thread(lambda: list(iter_issues(jql, ["key"], page_size=MAX_PAGE_SIZE)))
+        except requests.HTTPError as e:
+            return f"Jira API error searching issues: {e.response.status_code} — {e.response.text[:500]}"
+        except requests.RequestException as e:
+            return f"Connection error: {e}"
 
-                # Filter by assignee names if provided
-                if assignee_names and not any(name.lower() in author.lower() for name in assignee_names):
+        if not issues:
+            return f"No issues found with work logged between {start_date} and {end_date}"
+
+        # Fetch every page of each issue's worklogs, limited by Jira to the date window,
+        # concurrently on the event loop; results come back in search order, so
+        # merging below produces the same output as a serial loop.
+        keys = [issue["key"] for issue in issues]
+        started_after, started_before = date_window(start_date, end_date)
+        results = await gather_limited(
+            lambda k: fetch_issue_worklogs_async(k, started_after, started_before), keys, max_workers=concurrency,
+        )
+
+        entries = []
+        for key, (worklog_data, error) in zip(keys, results):
+            if error is not None:
+                if isinstance(error, requests.RequestException):
+                    failed.append(f"{key}: {_describe_error(error)}")
                     continue
+                raise error
+            entries.extend((key, log) for log in worklog_data)
+
+    table = WorklogTable.from_entries(entries, start_date, end_date, assignee_names)
+    total = table.total()
+
+    if output_format == JSON:
+        result = {"start_date": start_date, "end_date": end_date}
+        if dimensions:
+            result["groups"] = [
+                {"group": dict(zip(dimensions, labels)), "seconds": seconds, "time_spent": format_duration(seconds), "worklogs": count}
+                for labels, seconds, count in table.group(dimensions, sort_by)
+            ]
+        else:
+            result["worklogs"] = [
+                {"issue": ticket, "author": person, "date": day, "time_spent": format_duration(seconds), "seconds": seconds}
+                for day, person, ticket, seconds in table.rows()
+            ]
+        result["total_seconds"] = total
+        result["failed"] = failed
+        return to_json(result)
+
+    warning = ""
+    if failed:
+        warning = (
+            f"\n\n**Warning:** worklogs of {len(failed)} issue(s) could not be fetched and are missing above:\n"
+            + "\n".join(f"- {_table_cell(f)}" for f in failed)
+        )
+
+    if not len(table):
+        return f"No work logs found for the specified criteria between {start_date} and {end_date}" + warning
 
-                time_spent = log.get("timeSpent", "0")
-
-                # Group by person
-                if author not in worklogs_by_person:
-                    worklogs_by_person[author] = []
-                worklogs_by_person[author].append({
-                    "ticket": key,
-                    "date": started,
-                    "time_spent": time_spent
-                })
-
-                # Group by date
-                if started not in worklogs_by_date:
-                    worklogs_by_date[started] = {}
-                if author not in worklogs_by_date[started]:
-                    worklogs_by_date[started][author] = []
-                worklogs_by_date[started][author].append({
-                    "ticket": key,
-                    "time_spent": time_spent
-                })
-        except requests.HTTPError:
-            pass  # Skip issues that fail
-        except requests.RequestException:
-            pass
-
-    if not worklogs_by_person:
-        return f"No work logs found for the specified criteria between {start_date} and {end_date}"
-
-    # Format output by date
     lines = [f"# Work Logs: {start_date} to {end_date}\n"]
-
-    for date in sorted(worklogs_by_date.keys(), reverse=True):
-        lines.append(f"\n## {date}\n")
-        for person in sorted(worklogs_by_date[date].keys()):
-            logs = worklogs_by_date[date][person]
-            lines.append(f"\n**{person}**")
-            for log in logs:
-                lines.append(f"- {log['ticket']}: {log['time_spent']}")
-
-    return "\n".join(lines)
-
-
-@mcp.tool()
-def save_to_file(filename: str, content: str, output_dir: str = "") -> str:
+    if pivot:
+        lines.extend(_worklog_pivot(table, dimensions))
+    elif dimensions:
+        lines.extend(_worklog_groups(table, dimensions, sort_by))
+    else:
+        lines.extend(_worklog_listing(table))
+    lines.append(f"\n**Total: {format_duration(total)}** ({len(table)} worklog(s))")
+    return "\n".join(lines) + warning
+
+
+def _worklog_listing(table: WorklogTable) -> list[str]:
+    """Worklogs by date (newest first) and person, with day and person subtotals."""
+    by_day: dict[str, dict[str, list[tuple[str, int]]]] = {}
+    for day, person, ticket, seconds in table.rows():
+        by_day.setdefault(day, {}).setdefault(person, []).append((ticket, seconds))
+    day_totals = {labels[0]: seconds for labels, seconds, _ in table.group(["day"])}
+
+    lines = []
+    for day in sorted(by_day, reverse=True):
+        lines.append(f"\n## {day} — {format_duration(day_totals[day])}\n")
+        for person in sorted(by_day[day]):
+            logs = by_day[day][person]
+            lines.append(f"\n**{person}** — {format_duration(sum(s for _, s in logs))}")
+            for ticket, seconds in logs:
+                lines.append(f"- {ticket}: {format_duration(seconds)}")
+    return lines
+
+
+def _worklog_groups(table: WorklogTable, dimensions: list[str], sort_by: str) -> list[str]:
+    header = [d.capitalize() for d in dimensions] + ["Time", "Hours", "Worklogs"]
+    lines = ["| " + " | ".join(header) + " |", "|" + " --- |" * len(header)]
+    for labels, seconds, count in table.group(dimensions, sort_by):
+        cells = [_table_cell(label) for label in labels]
+        lines.append(f"| {' | '.join(cells)} | {format_duration(seconds)} | {seconds / 3600:.2f} | {count} |")
+    return lines
+
+
+def _worklog_pivot(table: WorklogTable, dimensions: list[str]) -> list[str]:
+    """A grid of hours with the first dimension as rows and the second as columns, plus totals."""
+    rows, cols, cells = table.pivot(*dimensions)
+    header = [dimensions[0].capitalize()] + cols + ["Total"]
+    lines = ["| " + " | ".join(_table_cell(h) for h in header) + " |", "|" + " --- |" * len(header)]
+    col_totals = dict.fromkeys(cols, 0)
+    for row in rows:
+        values = [cells.get((row, col), 0) for col in cols]
+        for col, value in zip(cols, values):
+            col_totals[col] += value
+        hours = [f"{v / 3600:.2f}" if v else "" for v in values]
+        lines.append(f"| {_table_cell(row)} | {' | '.join(hours)} | {sum(values) / 3600:.2f} |")
+    totals = [f"{col_totals[col] / 3600:.2f}" for col in cols]
+    lines.append(f"| **Total** | {' | '.join(totals)} | {sum(col_totals.values()) / 3600:.2f} |")
+    return lines
+
+
+@_tool()
+def save_to_file(filename: str, content: str, output_dir: str = "", compress: bool = False) -> str:
     """Save content to a file in the output/ directory.
 
+    The file is written to a temporary name and renamed into place, so it never exists half-written.
+    For large issue or worklog exports use export_jira_issues / export_worklogs instead of passing the content here.
+
     Args:
         filename: Name of the file to save (e.g. 'PROJ-123-analysis.md')
         content: The content to write to the file
         output_dir: Optional directory to save to. If omitted, saves to the default output/ directory.
+        compress: gzip the file (adds '.gz' to the name)
     """
-    safe_name = "".join(c for c in filename if c.isalnum() or c in ".-_")
+    safe_name = _safe_filename(filename)
     if not safe_name:
         return "Error: Invalid filename"
 
@@ -805,9 +1419,417 @@ def save_to_file(filename: str, content: str, output_dir: str = "") -> str:
         target_dir = OUTPUT_DIR
 
     filepath = target_dir / safe_name
-    filepath.write_text(content, encoding="utf-8")
+    if compress and not safe_name.endswith(".gz"):
+        filepath = filepath.with_name(safe_name + ".gz")
+    try:
+        with atomic_writer(filepath, compress) as f:
+            for start in range(0, len(content), _WRITE_CHUNK):
+                f.write(content[start:start + _WRITE_CHUNK])
+    except OSError as e:
+        return f"Error writing {filepath}: {e}"
     return f"File saved successfully: {filepath}"
 
 
+@_tool()
+def export_jira_issues(
+    jql: str,
+    filename: str,
+    export_format: str = "csv",
+    fields: str = "",
+    max_results: int = 0,
+    compress: bool = False,
+) -> str:
+    """Stream every issue matching a JQL query into a CSV, JSON Lines or Markdown file in the output/ directory.
+
+    Issues are written page by page as they arrive, so exports of any size use constant memory,
+    and the file only appears (atomically) once the export is complete. Only the path and a summary are returned.
+
+    Args:
+        jql: A JQL query string (e.g. 'project = LAE AND updated >= -30d')
+        filename: Output file name (e.g. 'lae-issues.csv'); the format's extension is added if missing
+        export_format: 'csv' (default), 'jsonl' or 'markdown' (a table)
+        fields: Preset ('minimal', 'triage', 'full'), field IDs and/or names, comma-separated. Leave empty for the
+            standard search fields
+        max_results: Maximum number of issues to export. 0 (default) exports all matches
+        compress: gzip the file (adds '.gz')
+    """
+    if not JIRA_BASE_URL or not JIRA_API_TOKEN:
+        return "Error: Jira credentials not configured. Please set JIRA_BASE_URL, JIRA_EMAIL, and JIRA_API_TOKEN in .env"
+    if export_format not in EXPORT_FORMATS:
+        return f"Error: Unknown export_format '{export_format}'. Use one of: {', '.join(EXPORT_FORMATS)}"
+    safe_name = _safe_filename(filename)
+    if not safe_name:
+        return "Error: Invalid filename"
+    try:
+        field_ids, field_names = _resolve_fields(fields or _SEARCH_FIELDS)
+    except ValueError as e:
+        return f"Error: {e}"
+
+    filepath = export_path(OUTPUT_DIR, safe_name, export_format, compress)
+    columns = ["key", "url"] + [f for f in field_ids if not f.startswith(("*", "-"))]
+
+    def records():
+        for page in iter_issue_pages(jql, field_ids, page_size=100, limit=max_results or None):
+            for issue in page:
+                yield search_result_data(issue)
+
+    started = time.monotonic()
+    try:
+        count = write_records(filepath, records(), export_format, columns, field_names, compress)
+    except requests.HTTPError as e:
+        return f"Jira API error: {e.response.status_code} — {e.response.text[:500]} (nothing was written)"
+    except requests.RequestException as e:
+        return f"Connection error: {e} (nothing was written)"
+    except OSError as e:
+        return f"Error writing {filepath}: {e}"
+    return _export_summary(filepath, count, "issue(s)", started)
+
+
+@_tool()
+def export_worklogs(
+    start_date: str,
+    end_date: str,
+    filename: str,
+    export_format: str = "csv",
+    assignee_names: list[str] | None = None,
+    projects: list[str] | None = None,
+    mode: str = "issues",
+    concurrency: int = 0,
+    compress: bool = False,
+) -> str:
+    """Stream the worklogs of a date range into a CSV, JSON Lines or Markdown file in the output/ directory.
+
+    One row per worklog: issue, author, date, started, time_spent, seconds, worklog_id. Rows are written as
+    each page of issues is processed and the file appears atomically when complete; only the path and a summary
+    are returned. Filters and modes are the same as get_worklogs_by_date.
+
+    Args:
+        start_date: Start date in YYYY-MM-DD format
+        end_date: End date in YYYY-MM-DD format
+        filename: Output file name (e.g. 'worklogs-feb.csv'); the format's extension is added if missing
+        export_format: 'csv' (default), 'jsonl' or 'markdown' (a table)
+        assignee_names: Optional list of author names to include
+        projects: Optional list of project keys (default: ['LAE', 'NCS'])
+        mode: 'issues' (default) or 'worklogs', as for get_worklogs_by_date
+        concurrency: Number of worklog requests to run in parallel. Leave as 0 to use JIRA_MAX_WORKERS from .env
+        compress: gzip the file (adds '.gz')
+    """
+    if not JIRA_BASE_URL or not JIRA_API_TOKEN:
+        return "Error: Jira credentials not configured. Please set JIRA_BASE_URL, JIRA_EMAIL, and JIRA_API_TOKEN in .env"
+    if export_format not in EXPORT_FORMATS:
+        return f"Error: Unknown export_format '{export_format}'. Use one of: {', '.join(EXPORT_FORMATS)}"
+    if mode not in ("issues", "worklogs"):
+        return f"Error: Unknown mode '{mode}'. Use 'issues' or 'worklogs'."
+    safe_name = _safe_filename(filename)
+    if not safe_name:
+        return "Error: Invalid filename"
+    try:
+        date_window(start_date, end_date)
+    except ValueError:
+        return "Error: start_date and end_date must be in YYYY-MM-DD format"
+
+    filepath = export_path(OUTPUT_DIR, safe_name, export_format, compress)
+    failed: list[str] = []
+    records = _worklog_records(start_date, end_date, assignee_names, projects or ["LAE", "NCS"], mode, concurrency, failed)
+    started = time.monotonic()
+    try:
+        count = write_records(filepath, records, export_format, list(_WORKLOG_COLUMNS), compress=compress)
+    except requests.HTTPError as e:
+        return f"Jira API error: {e.response.status_code} — {e.response.text[:500]} (nothing was written)"
+    except requests.RequestException as e:
+        return f"Connection error: {e} (nothing was written)"
+    except OSError as e:
+        return f"Error writing {filepath}: {e}"
+
+    summary = _export_summary(filepath, count, "worklog(s)", started)
+    if failed:
+        summary += f"\n\n**Warning:** worklogs of {len(failed)} issue(s) could not be fetched and are missing:\n"
+        summary += "\n".join(f"- {_table_cell(f)}" for f in failed)
+    return summary
+
+
+_WORKLOG_COLUMNS = ("issue", "author", "date", "started", "time_spent", "seconds", "worklog_id")
+
+
+def _worklog_records(
+    start_date: str,
+    end_date: str,
+    assignee_names: list[str] | None,
+    projects: list[str],
+    mode: str,
+    concurrency: int,
+    failed: list[str],
+):
+    """Yield one export record per worklog in the range, a page of issues at a time.
+
+    Issues whose worklogs cannot be fetched are appended to ``failed``.
+    """
+    def keep(log: dict) -> bool:
+        author = (log.get("author") or {}).get("displayName", "Unknown")
+        if not start_date <= log.get("started", "")[:10] <= end_date:
+            return False
+        return not assignee_names or any(name.lower() in author.lower() for name in assignee_names)
+
+    def record(key: str, log: dict) -> dict:
+        return {
+            "issue": key,
+            "author": (log.get("author") or {}).get("displayName", "Unknown"),
+            "date": log.get("started", "")[:10],
+            "started": log.get("started", ""),
+            "time_spent": log.get("timeSpent", ""),
+            "seconds": worklog_seconds(log),
+            "worklog_id": log.get("id", ""),
+        }
+
+    if mode == "worklogs":
+        for key, log in fetch_worklogs_in_window(start_date, end_date, projects, max_workers=concurrency):
+            if keep(log):
+                yield record(key, log)
+        return
+
+    started_after, started_before = date_window(start_date, end_date)
+    project_list = ", ".join(projects)
+    jql = f'project in ({project_list}) AND worklogDate >= "{start_date}" AND worklogDate <= "{end_date}" ORDER BY key ASC'
+    for page in iter_issue_pages(jql, ["key"], page_size=_EXPORT_ISSUE_PAGE):
+        keys = [issue["key"] for issue in page]
+        results = map_concurrent(
+            lambda k: fetch_issue_worklogs(k, started_after, started_before), keys, max_workers=concurrency,
+        )
+        for key, (worklogs, error) in zip(keys, results):
+            if error is not None:
+                if isinstance(error, requests.RequestException):
+                    failed.append(f"{key}: {_describe_error(error)}")
+                    continue
+                raise error
+            for log in worklogs:
+                if keep(log):
+                    yield record(key, log)
+
+
+def _export_summary(filepath: Path, count: int, noun: str, started: float) -> str:
+    size = filepath.stat().st_size
+    return (
+        f"Exported {count} {noun} to {filepath} "
+        f"({size / 1024:.1f} KiB, {time.monotonic() - started:.1f}s)"
+    )
+
+
+@_tool()
+def sync_local_store(projects: list[str] | None = None, full: bool = False) -> str:
+    """Mirror Jira issues (with comments, worklogs and links) into the local SQLite store.
+
+    Only issues updated since the project's last sync are downloaded. Once synced,
+    search_jira_issues and get_jira_issue can answer from the mirror with use_local_store=True.
+
+    Args:
+        projects: Project keys to sync (default: JIRA_STORE_PROJECTS from .env)
+        full: Re-download every issue instead of only those updated since the last sync
+    """
+    if not JIRA_BASE_URL or not JIRA_API_TOKEN:
+        return "Error: Jira credentials not configured. Please set JIRA_BASE_URL, JIRA_EMAIL, and JIRA_API_TOKEN in .env"
+
+    projects = projects or JIRA_STORE_PROJECTS
+    if not projects:
+        return "Error: No projects given. Pass projects or set JIRA_STORE_PROJECTS in .env"
+
+    store = get_store()
+    results = []
+    for project in projects:
+        try:
+            count = store.sync_project(project, full=full)
+            results.append(f"- **{project}**: {count} issue(s) updated")
+        except requests.HTTPError as e:
+            results.append(f"- **{project}**: Jira API error {e.response.status_code} — {e.response.text[:200]}")
+        except requests.RequestException as e:
+            results.append(f"- **{project}**: Connection error: {e}")
+
+    status = {row["project"]: row for row in store.sync_status()}
+    lines = [f"# Local store sync — {store.path}\n"] + results + ["\n## Mirror status"]
+    for project, row in status.items():
+        lines.append(f"- {project}: {row['issue_count']} issue(s), last synced {row['last_sync'][:19]} UTC")
+    return "\n".join(lines)
+
+
+@_tool()
+def get_client_stats() -> str:
+    """Show HTTP connection pool and cache statistics for the Jira client (for debugging)."""
+    stats = get_transport().pool_stats()
+    by_method = ", ".join(f"{m} {n}" for m, n in sorted(stats["requests_by_method"].items())) or "none"
+    lines = [
+        "# Jira Client Stats\n",
+        f"- Pool size: {stats['pool_size']}",
+        f"- Requests sent: {stats['requests']} ({by_method}), async: {get_async_transport().stats()['requests']}",
+    ]
+    for pool in stats["pools"]:
+        lines.append(
+            f"- **{pool['host']}** — {pool['connections_opened']} connection(s) opened, "
+            f"{pool['requests_sent']} request(s), {pool['idle_connections']}/{pool['max_size']} idle"
+        )
+
+    retries = stats["retries"]
+    lines.append(
+        f"- Rate limit: {retries['current_rate']:g}/{retries['rate_limit']:g} req/s (burst {retries['burst']}), "
+        f"{retries['throttled']} throttled, {retries['retried']} retried, {retries['failed']} failed, "
+        f"{retries['wait_seconds']:.1f}s spent waiting"
+    )
+
+    cache = issue_cache.stats()
+    lines.append(
+        f"- Issue cache: {cache['size']}/{cache['maxsize']} entries (TTL {cache['ttl']:g}s), "
+        f"{cache['hits']} hit(s), {cache['misses']} miss(es) ({cache['hit_rate']:.0%}), "
+        f"{cache['revalidations']} revalidated, {cache['invalidations']} invalidated"
+    )
+    transitions = transition_cache.stats()
+    lines.append(
+        f"- Transition cache: {transitions['size']} workflow state(s) (TTL {transitions['ttl']:g}s), "
+        f"{transitions['hits']} hit(s), {transitions['misses']} miss(es) ({transitions['hit_rate']:.0%})"
+    )
+    registry = get_field_registry().stats()
+    age = f"{registry['age'] / 60:.0f} min old" if registry["age"] is not None else "not loaded"
+    lines.append(
+        f"- Field registry: {registry['fields']} field(s), {age}, "
+        f"{registry['createmeta_entries']} createmeta entr(ies) — {registry['path']}"
+    )
+    return "\n".join(lines)
+
+
+@_tool()
+def get_server_metrics(output_format: str = "markdown", dump_file: str = "", reset: bool = False) -> str:
+    """Show where tool time goes: per-tool and per-Jira-endpoint latency, status codes, bytes and cache hit rates.
+
+    Latencies are estimated from histograms (p50/p95 and max). Jira requests are counted per attempt,
+    so a retried call appears once per try; issue keys and numeric IDs in endpoints are shown as {key}/{id}.
+
+    Args:
+        output_format: 'markdown' (default), 'json', or 'prometheus' (text exposition format)
+        dump_file: Optional file name to also write the metrics to in the output/ directory —
+            Prometheus text for '.prom'/'.txt', JSON otherwise
+        reset: Clear all timings and counters after reading them
+    """
+    if output_format not in (*OUTPUT_FORMATS, "prometheus"):
+        return f"Error: Unknown output_format '{output_format}'. Use 'markdown', 'json' or 'prometheus'."
+    gauges = _metrics_gauges()
+    snapshot = metrics.snapshot()
+    if output_format == JSON:
+        result = to_json({**snapshot, "gauges": gauges})
+    elif output_format == "prometheus":
+        result = metrics.to_prometheus(gauges)
+    else:
+        result = _format_metrics(snapshot, gauges)
+
+    if dump_file:
+        safe_name = _safe_filename(dump_file)
+        if not safe_name:
+            return "Error: Invalid dump_file name"
+        try:
+            metrics.dump(OUTPUT_DIR / safe_name, gauges)
+        except OSError as e:
+            return f"Error writing {OUTPUT_DIR / safe_name}: {e}"
+        result += f"\n\nMetrics written to {OUTPUT_DIR / safe_name}"
+    if reset:
+        metrics.reset()
+    return result
+
+
+def _metrics_gauges() -> dict[str, dict[str, float]]:
+    """Point-in-time cache and retry statistics exported next to the timings."""
+    caches = {"issue": issue_cache.stats(), "transition": transition_cache.stats()}
+    retries = get_transport().scheduler.stats()
+    return {
+        "cache_hits": {name: c["hits"] for name, c in caches.items()},
+        "cache_misses": {name: c["misses"] for name, c in caches.items()},
+        "cache_hit_ratio": {name: c["hit_rate"] for name, c in caches.items()},
+        "cache_entries": {name: c["size"] for name, c in caches.items()},
+        "field_registry_fields": {"fields": get_field_registry().stats()["fields"]},
+        "http_retry_events": {k: retries[k] for k in ("throttled", "retried", "failed")},
+        "http_rate_limit": {"current": retries["current_rate"], "max": retries["rate_limit"]},
+    }
+
+
+def _format_metrics(snapshot: dict, gauges: dict[str, dict[str, float]]) -> str:
+    timings, counters = snapshot["timings"], snapshot["counters"]
+    lines = [f"# Server Metrics (uptime {snapshot['uptime_seconds'] / 60:.0f} min)\n"]
+
+    tool_calls = counters.get("tool_calls", {})
+    lines.append("## Tools\n")
+    if timings.get("tool"):
+        lines.append("| Tool | Calls | Errors | p50 | p95 | Max | Total |")
+        lines.append("| --- | --- | --- | --- | --- | --- | --- |")
+        for name, t in sorted(timings["tool"].items(), key=lambda item: -item[1]["sum"]):
+            errors = sum(n for label, n in tool_calls.items() if label.startswith(f"{name} ") and not label.endswith(" ok"))
+            lines.append(
+                f"| {name} | {t['count']} | {errors:g} | {_ms(t['p50'])} | {_ms(t['p95'])} | {_ms(t['max'])} | {t['sum']:.2f}s |"
+            )
+    else:
+        lines.append("No tool calls yet.")
+
+    lines.append("\n## Jira requests\n")
+    if timings.get("request"):
+        statuses: dict[str, list[str]] = {}
+        for label, n in sorted(counters.get("responses", {}).items()):
+            series, status = label.rsplit(" ", 1)
+            statuses.setdefault(series, []).append(f"{status}×{n:g}")
+        sent, received = counters.get("bytes_sent", {}), counters.get("bytes_received", {})
+        lines.append("| Request | Calls | p50 | p95 | Max | Statuses | KiB in / out |")
+        lines.append("| --- | --- | --- | --- | --- | --- | --- |")
+        for series, t in sorted(timings["request"].items(), key=lambda item: -item[1]["sum"]):
+            lines.append(
+                f"| {series} | {t['count']} | {_ms(t['p50'])} | {_ms(t['p95'])} | {_ms(t['max'])} | "
+                f"{', '.join(statuses.get(series, []))} | {received.get(series, 0) / 1024:.1f} / {sent.get(series, 0) / 1024:.1f} |"
+            )
+    else:
+        lines.append("No Jira requests yet.")
+
+    if timings.get("format"):
+        lines.append("\n## Formatters\n")
+        lines.append("| Formatter | Calls | p50 | p95 | Total |")
+        lines.append("| --- | --- | --- | --- | --- |")
+        for name, t in sorted(timings["format"].items(), key=lambda item: -item[1]["sum"]):
+            lines.append(f"| {name} | {t['count']} | {_ms(t['p50'])} | {_ms(t['p95'])} | {t['sum']:.3f}s |")
+
+    lines.append("\n## Caches and retries\n")
+    for name in gauges["cache_hits"]:
+        lines.append(
+            f"- {name.capitalize()} cache: {gauges['cache_hit_ratio'][name]:.0%} hit rate "
+            f"({gauges['cache_hits'][name]} hit(s), {gauges['cache_misses'][name]} miss(es), "
+            f"{gauges['cache_entries'][name]} entries)"
+        )
+    retry = gauges["http_retry_events"]
+    lines.append(
+        f"- Jira requests: {retry['throttled']} throttled, {retry['retried']} retried, {retry['failed']} failed; "
+        f"rate {gauges['http_rate_limit']['current']:g}/{gauges['http_rate_limit']['max']:g} req/s"
+    )
+    slow = counters.get("slow_calls", {})
+    lines.append(
+        f"- Slow calls (≥ {metrics.slow_seconds:g}s): "
+        + (", ".join(f"{n:g} {kind}" for kind, n in sorted(slow.items())) or "none")
+    )
+    return "\n".join(lines)
+
+
+def _ms(seconds: float) -> str:
+    return f"{seconds * 1000:.0f}ms" if seconds < 10 else f"{seconds:.1f}s"
+
+
+def _safe_filename(filename: str) -> str:
+    """Strip a filename down to alphanumerics and '.-_' (empty if nothing is left)."""
+    return "".join(c for c in filename if c.isalnum() or c in ".-_")
+
+
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Jira MCP server (stdio).")
+    parser.add_argument(
+        "--profile-startup", action="store_true",
+        help="measure cold starts and the import-time breakdown instead of serving; "
+             "exits with status 1 when over JIRA_STARTUP_BUDGET_MS",
+    )
+    args = parser.parse_args()
+    if args.profile_startup:
+        from jira_api.profiling import profile_startup
+
+        report, within_budget = profile_startup()
+        print(report)
+        raise SystemExit(0 if within_budget else 1)
+
+    start_metrics_dump(_metrics_gauges)
     mcp.run(transport="stdio")
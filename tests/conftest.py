@@ -0,0 +1,30 @@
+"""Make the server modules in src/ importable, as when running from src/."""
+
+import sys
+from pathlib import Path
+
+import pytest
+import requests
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from jira_api import fields  # noqa: E402
+
+
+class FieldEndpointDown:
+    """A transport whose every GET fails to connect."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def get(self, endpoint, params=None):
+        self.calls += 1
+        raise requests.ConnectionError(f"GET {endpoint}: connection refused")
+
+
+@pytest.fixture
+def field_endpoint_down(monkeypatch):
+    """Make the field registry's transport unreachable; returns it to count calls."""
+    transport = FieldEndpointDown()
+    monkeypatch.setattr(fields, "get_transport", lambda: transport)
+    return transport
@@ -0,0 +1,83 @@
+"""Browser pool workers when Chromium fails to launch."""
+
+import pytest
+
+pytest.importorskip("playwright.sync_api")
+
+from automation import pool as pool_module  # noqa: E402
+from automation.pool import BrowserPool  # noqa: E402
+
+
+class FakeBrowser:
+    def is_connected(self):
+        return True
+
+    def new_context(self, storage_state=None, **options):
+        return FakeContext()
+
+    def close(self):
+        pass
+
+
+class FakeContext:
+    def new_page(self):
+        return FakePage()
+
+    def close(self):
+        pass
+
+
+class FakePage:
+    def set_default_timeout(self, timeout):
+        pass
+
+    def set_default_navigation_timeout(self, timeout):
+        pass
+
+    def on(self, event, handler):
+        pass
+
+    def route(self, pattern, handler):
+        pass
+
+
+class FakeDriver:
+    """A started Playwright driver whose first ``launch_failures`` launches raise."""
+
+    started: list["FakeDriver"] = []
+    launch_failures = 1
+
+    def __init__(self):
+        self.stopped = False
+        self.chromium = self
+        FakeDriver.started.append(self)
+
+    def launch(self, headless=True):
+        if FakeDriver.launch_failures:
+            FakeDriver.launch_failures -= 1
+            raise RuntimeError("Executable doesn't exist")
+        return FakeBrowser()
+
+    def stop(self):
+        self.stopped = True
+
+
+@pytest.fixture
+def failing_launch(monkeypatch):
+    FakeDriver.started, FakeDriver.launch_failures = [], 1
+    monkeypatch.setattr(pool_module, "sync_playwright", lambda: type("Start", (), {"start": lambda self: FakeDriver()})())
+    return FakeDriver
+
+
+def test_failed_launch_stops_the_driver_and_the_next_job_relaunches(failing_launch):
+    pool = BrowserPool(size=1, memory_budget_mb=0, auth=None)
+    try:
+        with pytest.raises(RuntimeError, match="Executable"):
+            pool.run(lambda page: "unreachable")
+        assert pool.run(lambda page: "ok") == "ok"
+    finally:
+        pool.close()
+
+    first, second = failing_launch.started
+    assert first.stopped
+    assert pool.stats()["launches"] == 1
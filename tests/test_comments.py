@@ -0,0 +1,40 @@
+"""Selecting comments by creation time."""
+
+from datetime import datetime, timezone
+
+import jira_mcp_server as server
+from jira_api.comments import is_before
+
+SINCE = datetime(2026, 2, 1, tzinfo=timezone.utc)
+
+
+def comment(body, created):
+    return {"body": body, "created": created} if created is not None else {"body": body}
+
+
+def test_comments_without_a_parseable_timestamp_are_kept():
+    assert not is_before(comment("a", None), SINCE)
+    assert not is_before(comment("b", ""), SINCE)
+    assert not is_before(comment("c", "yesterday"), SINCE)
+    assert is_before(comment("d", "2026-01-31T23:00:00.000+0000"), SINCE)
+
+
+def test_local_store_issue_with_unparseable_comment_dates(monkeypatch):
+    stored = {
+        "key": "LAE-9",
+        "fields": {
+            "summary": "Imported issue",
+            "comment": {"comments": [
+                comment("old", "2026-01-01T09:00:00.000+0000"),
+                comment("undated", None),
+                comment("new", "2026-02-10T09:00:00.000+0000"),
+            ]},
+        },
+    }
+    monkeypatch.setattr(server, "get_store", lambda: type("Store", (), {"get_issue": lambda self, key: stored})())
+
+    data = server._select_comments(stored, 0, SINCE, fetched=False)
+
+    assert [c["body"] for c in data["fields"]["comment"]["comments"]] == ["undated", "new"]
+    report = server.get_jira_issue("LAE-9", use_local_store=True, fields="summary,comment", comments_since="2026-02-01")
+    assert not report.startswith("Error")
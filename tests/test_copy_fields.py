@@ -0,0 +1,61 @@
+"""Copying issues while Jira's field metadata endpoints are unreachable."""
+
+import pytest
+
+import jira_mcp_server as server
+from jira_api.fields import FieldRegistry
+
+SOURCE = {
+    "key": "LAE-1",
+    "fields": {
+        "summary": "Broken login",
+        "project": {"key": "LAE"},
+        "issuetype": {"name": "Bug"},
+        "labels": ["auth"],
+        "customfield_10100": "keep me",
+        "customfield_10200": None,
+    },
+}
+
+
+@pytest.fixture
+def offline_fields(field_endpoint_down, monkeypatch, tmp_path):
+    monkeypatch.setattr(server, "get_field_registry", lambda: FieldRegistry(tmp_path / "fields.json", ttl=60))
+    monkeypatch.setattr(server, "JIRA_BASE_URL", "https://jira.example.com")
+    monkeypatch.setattr(server, "JIRA_API_TOKEN", "token")
+    return field_endpoint_down
+
+
+def test_build_copy_fields_copies_all_custom_fields_without_metadata(offline_fields):
+    copy, dropped = server._build_copy_fields(SOURCE)
+
+    assert copy["summary"] == "[Copy] Broken login"
+    assert copy["customfield_10100"] == "keep me"
+    assert "customfield_10200" not in copy
+    assert copy["project"] == {"key": "LAE"}
+    assert dropped == []
+
+
+def test_copy_jira_issue_with_field_endpoint_down(offline_fields, monkeypatch):
+    posted = []
+    monkeypatch.setattr(server, "fetch_issue", lambda key: SOURCE)
+    monkeypatch.setattr(server, "_jira_post", lambda endpoint, body: posted.append(body) or {"key": "LAE-2"})
+
+    result = server.copy_jira_issue("LAE-1")
+
+    assert "LAE-1** → **LAE-2" in result
+    assert posted[0]["fields"]["customfield_10100"] == "keep me"
+
+
+def test_copy_jira_issues_with_field_endpoint_down(offline_fields, monkeypatch):
+    def post(endpoint, body):
+        assert endpoint == "issue/bulk"
+        return {"issues": [{"key": f"LAE-{100 + i}"} for i, _ in enumerate(body["issueUpdates"])]}
+
+    monkeypatch.setattr(server, "fetch_issues", lambda keys, fields, max_workers=0: {k: SOURCE for k in keys})
+    monkeypatch.setattr(server, "_jira_post", post)
+
+    result = server.copy_jira_issues(["LAE-1"])
+
+    assert "Copied 1 of 1 issue(s)" in result
+    assert "LAE-100" in result
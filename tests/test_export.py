@@ -0,0 +1,27 @@
+"""Atomic export writes."""
+
+import os
+
+from jira_api.export import atomic_writer
+
+
+def test_new_file_gets_the_umask_default_mode(tmp_path):
+    umask = os.umask(0o022)
+    os.umask(umask)
+    target = tmp_path / "out.csv"
+
+    with atomic_writer(target) as f:
+        f.write("key\n")
+
+    assert target.stat().st_mode & 0o777 == 0o666 & ~umask
+
+
+def test_replaced_file_keeps_its_mode(tmp_path):
+    target = tmp_path / "out.csv"
+    target.write_text("old")
+    target.chmod(0o640)
+
+    with atomic_writer(target, compress=True) as f:
+        f.write("new")
+
+    assert target.stat().st_mode & 0o777 == 0o640
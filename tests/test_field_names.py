@@ -0,0 +1,69 @@
+"""Field name lookups when Jira's field endpoint is unreachable."""
+
+import pytest
+import requests
+
+import jira_mcp_server as server
+from jira_api.fields import FieldRegistry
+
+STORED = {
+    "key": "LAE-7",
+    "fields": {
+        "summary": "Offline read",
+        "status": {"name": "Open"},
+        "customfield_12000": "Restart the service",
+        "customfield_10500": "extra",
+    },
+}
+
+
+@pytest.fixture
+def registry(monkeypatch, tmp_path):
+    registry = FieldRegistry(tmp_path / "fields.json", ttl=60)
+    monkeypatch.setattr(server, "get_field_registry", lambda: registry)
+    return registry
+
+
+def test_local_store_read_never_fetches_field_names(registry, field_endpoint_down, monkeypatch):
+    monkeypatch.setattr(server, "get_store", lambda: type("Store", (), {"get_issue": lambda self, key: STORED})())
+
+    report = server.get_jira_issue("LAE-7", fields="full, customfield_10500", use_local_store=True)
+
+    assert "Restart the service" in report
+    assert "customfield_10500" in report
+    assert field_endpoint_down.calls == 0
+
+
+def test_labelled_fields_need_no_names(registry, field_endpoint_down):
+    _, names = server._resolve_fields("full", server.ISSUE_REPORT_FIELDS)
+
+    assert names == {}
+    assert field_endpoint_down.calls == 0
+
+
+def test_failed_field_list_fetch_is_not_retried_within_backoff(registry, field_endpoint_down):
+    for _ in range(3):
+        with pytest.raises(requests.ConnectionError):
+            registry.fields()
+
+    assert field_endpoint_down.calls == 1
+
+
+def test_expired_field_list_is_served_when_refresh_fails(registry, field_endpoint_down):
+    registry._set_fields([{"id": "customfield_10500", "name": "Extra"}], fetched_at=0.0)
+    registry._loaded_from_disk = True
+
+    assert registry.get("customfield_10500")["name"] == "Extra"
+    assert field_endpoint_down.calls == 1
+
+
+def test_field_names_are_resolved_unless_they_are_system_field_ids(registry, field_endpoint_down):
+    registry._set_fields([{"id": "customfield_10020", "name": "Sprint"}], fetched_at=float("inf"))
+    registry._loaded_from_disk = True
+
+    assert registry.resolve_fields("sprint, Status, -comment, customfield_1") == [
+        "customfield_10020", "status", "-comment", "customfield_1",
+    ]
+    with pytest.raises(ValueError, match="storyPoints"):
+        registry.resolve_fields("storyPoints")
+    assert field_endpoint_down.calls == 0
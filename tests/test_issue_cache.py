@@ -0,0 +1,45 @@
+"""Revalidation of stale issue cache entries."""
+
+import time
+
+import pytest
+
+from jira_api import issues
+
+
+class FakeTransport:
+    def __init__(self, updated="2024-05-01T10:00:00.000+0000"):
+        self.updated = updated
+        self.requests = []
+
+    def get(self, endpoint, params=None):
+        fields = (params or {}).get("fields")
+        self.requests.append(fields)
+        issue = {"summary": "Cached", "updated": self.updated}
+        return {"key": "LAE-1", "fields": {k: v for k, v in issue.items() if not fields or k in fields.split(",")}}
+
+
+@pytest.fixture
+def transport(monkeypatch):
+    transport = FakeTransport()
+    monkeypatch.setattr(issues, "get_transport", lambda: transport)
+    monkeypatch.setattr(issues, "remember_issue_context", lambda issue: None)
+    monkeypatch.setattr(issues.issue_cache, "ttl", 0.01)
+    issues.issue_cache.invalidate(lambda key: True)
+    return transport
+
+
+def test_unchanged_issue_is_revalidated_with_updated_only(transport):
+    issues.fetch_issue("LAE-1", fields="summary,updated")
+    time.sleep(0.02)
+    issues.fetch_issue("LAE-1", fields="summary,updated")
+
+    assert transport.requests == ["summary,updated", "updated"]
+
+
+def test_entry_without_updated_is_refetched_directly(transport):
+    issues.fetch_issue("LAE-1", fields="summary")
+    time.sleep(0.02)
+    issues.fetch_issue("LAE-1", fields="summary")
+
+    assert transport.requests == ["summary", "summary"]
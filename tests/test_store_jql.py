@@ -0,0 +1,28 @@
+"""Offline JQL translation of the local issue store."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from jira_api.store import _jql_to_sql
+
+
+def test_absolute_dates_become_timestamp_prefixes():
+    sql, params = _jql_to_sql('project = LAE AND updated >= "2024/05/01 09:30" AND created < 2024-06-01')
+
+    assert "updated >= ?" in sql and "created < ?" in sql
+    assert params == ["LAE", "2024-05-01T09:30", "2024-06-01"]
+
+
+def test_relative_durations_resolve_against_now():
+    before = (datetime.now() - timedelta(days=7)).strftime("%Y-%m-%dT%H:%M")
+    _, params = _jql_to_sql("updated >= -7d")
+    after = (datetime.now() - timedelta(days=7)).strftime("%Y-%m-%dT%H:%M")
+
+    assert before <= params[0] <= after
+
+
+@pytest.mark.parametrize("jql", ["updated >= startOfDay()", 'created > "startOfWeek(-1)"', "updated >= yesterday"])
+def test_unsupported_dates_are_rejected(jql):
+    with pytest.raises(ValueError, match="Unsupported date"):
+        _jql_to_sql(jql)